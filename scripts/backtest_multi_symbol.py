@@ -31,6 +31,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
+import pandas as pd
 
 console = Console()
 
@@ -45,104 +46,98 @@ async def run_symbol_backtest(
     symbol: str,
     start_dt: datetime,
     end_dt: datetime,
-    initial_capital: float,
+    settings,
+    alpaca_fetcher,
+    dolthub_fetcher,
+    data_loader,
 ) -> Dict:
     """Run backtest for a single symbol.
 
+    Config, fetchers and loader are shared across symbols (their clients and
+    caches are not per-symbol); only the strategy and engine, which hold
+    per-run state, are created here.
+
     Args:
         symbol: Stock symbol to backtest.
         start_dt: Start date.
         end_dt: End date.
-        initial_capital: Starting capital.
+        settings: Loaded settings (initial capital already applied).
+        alpaca_fetcher: Shared AlpacaOptionsDataFetcher for underlying bars.
+        dolthub_fetcher: Shared DoltHubOptionsDataFetcher for option chains.
+        data_loader: Shared BacktestDataLoader for technical indicators.
 
     Returns:
         Dict with results and metrics.
     """
     from alpaca_options.backtesting import BacktestEngine
-    from alpaca_options.backtesting.alpaca_options_fetcher import AlpacaOptionsDataFetcher
-    from alpaca_options.backtesting.dolthub_options_fetcher import DoltHubOptionsDataFetcher
-    from alpaca_options.core.config import load_config
+    from alpaca_options.backtesting.data_loader import trading_days
     from alpaca_options.strategies import VerticalSpreadStrategy
-    import pandas as pd
 
     console.print(f"\n[bold cyan]{'='*60}[/bold cyan]")
     console.print(f"[bold cyan]Backtesting {symbol}[/bold cyan]")
     console.print(f"[bold cyan]{'='*60}[/bold cyan]")
 
-    # Load configuration
-    settings = load_config()
-    settings.backtesting.initial_capital = initial_capital
-
-    # Initialize fetchers
-    api_key = os.environ.get("ALPACA_API_KEY", "")
-    api_secret = os.environ.get("ALPACA_SECRET_KEY", "")
-
-    alpaca_fetcher = AlpacaOptionsDataFetcher(
-        api_key=api_key,
-        api_secret=api_secret,
-    )
-
-    dolthub_fetcher = DoltHubOptionsDataFetcher()
-
     # Fetch underlying data from Alpaca
+    # Blocking fetch/compute steps run in worker threads so other symbols'
+    # backtests make progress meanwhile (rich allows one live spinner at a
+    # time, so concurrent symbols report with plain prints)
     console.print(f"\n[bold]Loading Underlying Data for {symbol}...[/bold]")
-    with console.status(f"[cyan]Fetching {symbol} price bars..."):
-        underlying_data = alpaca_fetcher.fetch_underlying_bars(
-            symbol=symbol,
-            start_date=start_dt,
-            end_date=end_dt,
-            timeframe="1Hour",
-        )
+    underlying_data = await asyncio.to_thread(
+        alpaca_fetcher.fetch_underlying_bars,
+        symbol=symbol,
+        start_date=start_dt,
+        end_date=end_dt,
+        timeframe="1Hour",
+    )
 
     if underlying_data.empty:
         console.print(f"[red]✗ Failed to load underlying data for {symbol}![/red]")
         return {"symbol": symbol, "error": "No underlying data"}
 
-    console.print(f"[green]✓ Loaded {len(underlying_data):,} price bars[/green]")
+    console.print(f"[green]✓ {symbol}: Loaded {len(underlying_data):,} price bars[/green]")
 
     # Show price stats
     price_start = underlying_data['close'].iloc[0]
     price_end = underlying_data['close'].iloc[-1]
     price_return = ((price_end/price_start)-1)*100
 
-    console.print(f"[dim]Start: ${price_start:.2f} -> End: ${price_end:.2f} ({price_return:+.1f}%)[/dim]")
+    console.print(f"[dim]{symbol} start: ${price_start:.2f} -> End: ${price_end:.2f} ({price_return:+.1f}%)[/dim]")
 
     # Add technical indicators
-    with console.status("[cyan]Computing technical indicators..."):
-        from alpaca_options.backtesting.data_loader import BacktestDataLoader
-        data_loader = BacktestDataLoader(settings.backtesting.data)
-        underlying_data = data_loader.add_technical_indicators(underlying_data)
+    underlying_data = await asyncio.to_thread(
+        data_loader.add_technical_indicators_cached,
+        underlying_data, symbol, start_dt, end_dt, timeframe="1Hour",
+    )
 
-    console.print("[green]✓ Technical indicators computed[/green]")
+    console.print(f"[green]✓ {symbol}: Technical indicators computed[/green]")
 
     # Fetch options chains from DoltHub
     console.print(f"\n[bold]Fetching Options Chains for {symbol}...[/bold]")
 
-    options_data = {}
-    # Use dropna(subset=['close']) to only require close price (not all indicators)
-    daily_timestamps = underlying_data.resample('1D').last().dropna(subset=['close']).index
-
-    with console.status(f"[cyan]Fetching DoltHub chains for {symbol}...") as status:
-        total = len(daily_timestamps)
-        chains_loaded = 0
+    # Entry DTE ceiling for the strategy. Held positions only move closer to
+    # expiry, so contracts beyond it are never needed and are skipped in SQL.
+    # (Min DTE / delta can't be pushed down: open positions must stay priced.)
+    max_dte = 45
 
-        for i, timestamp in enumerate(daily_timestamps):
-            status.update(f"[cyan]Fetching chain {i+1}/{total} ({timestamp.date()})...")
+    # One chain per day that has a close price (indicators may still be warming up)
+    daily_timestamps = trading_days(underlying_data)
 
-            chain = dolthub_fetcher.fetch_option_chain(
-                underlying=symbol,
-                as_of_date=timestamp,
-            )
+    total = len(daily_timestamps)
 
-            if chain:
-                options_data[timestamp] = chain
-                chains_loaded += 1
+    # Batched queries (one per group of dates), several in flight at once;
+    # chains stay in the on-disk cache and are loaded as the engine reaches them
+    options_data = await dolthub_fetcher.fetch_option_chains_lazy(
+        underlying=symbol,
+        as_of_dates=list(daily_timestamps),
+        max_dte=max_dte,
+    )
+    chains_loaded = len(options_data)
 
     if not options_data:
         console.print(f"[red]✗ No DoltHub options data for {symbol}![/red]")
         return {"symbol": symbol, "error": "No options data"}
 
-    console.print(f"[green]✓ Loaded {chains_loaded:,} option chains ({chains_loaded/total*100:.1f}% coverage)[/green]")
+    console.print(f"[green]✓ {symbol}: Loaded {chains_loaded:,} option chains ({chains_loaded/total*100:.1f}% coverage)[/green]")
 
     # Create strategy instance
     strategy = VerticalSpreadStrategy()
@@ -160,7 +155,7 @@ async def run_symbol_backtest(
     strategy._config["spread_width"] = 5.0
     strategy._config["min_iv_rank"] = 0  # DoltHub has good IV data, but no rank calc
     strategy._config["min_dte"] = 21
-    strategy._config["max_dte"] = 45
+    strategy._config["max_dte"] = max_dte
     strategy._config["close_dte"] = 14
     strategy._config["min_open_interest"] = 0  # CRITICAL: DoltHub has OI=0
     strategy._config["max_spread_percent"] = 15.0  # Allow wider spreads
@@ -176,16 +171,15 @@ async def run_symbol_backtest(
     engine = BacktestEngine(settings.backtesting, settings.risk)
 
     # Run backtest
-    console.print(f"\n[bold]Running Backtest...[/bold]")
-
-    with console.status("[cyan]Processing trades..."):
-        result = await engine.run(
-            strategy=strategy,
-            underlying_data=underlying_data,
-            options_data=options_data,
-            start_date=start_dt,
-            end_date=end_dt,
-        )
+    console.print(f"\n[bold]Running {symbol} Backtest...[/bold]")
+
+    result = await engine.run(
+        strategy=strategy,
+        underlying_data=underlying_data,
+        options_data=options_data,
+        start_date=start_dt,
+        end_date=end_dt,
+    )
 
     m = result.metrics
 
@@ -230,6 +224,7 @@ async def main():
     start_dt = datetime(2019, 2, 9)   # Extended backtest: DoltHub earliest date
     end_dt = datetime(2024, 12, 31)   # Extended backtest: DoltHub latest date
     initial_capital = 10000.0
+    max_concurrent_symbols = 2
 
     console.print(f"\n[dim]Period: {start_dt.date()} to {end_dt.date()} (~6 years)[/dim]")
     console.print(f"[dim]Initial Capital: ${initial_capital:,.2f}[/dim]")
@@ -242,21 +237,45 @@ async def main():
         console.print("[yellow]Set ALPACA_API_KEY and ALPACA_SECRET_KEY environment variables[/yellow]")
         return
 
-    # Run backtests for each symbol
-    results = []
+    from alpaca_options.backtesting.alpaca_options_fetcher import AlpacaOptionsDataFetcher
+    from alpaca_options.backtesting.data_loader import BacktestDataLoader
+    from alpaca_options.backtesting.dolthub_options_fetcher import DoltHubOptionsDataFetcher
+    from alpaca_options.core.config import load_config
 
-    for symbol in symbols:
-        try:
-            result = await run_symbol_backtest(
-                symbol=symbol,
-                start_dt=start_dt,
-                end_dt=end_dt,
-                initial_capital=initial_capital,
-            )
-            results.append(result)
-        except Exception as e:
-            console.print(f"\n[red]✗ Error backtesting {symbol}: {e}[/red]")
-            results.append({"symbol": symbol, "error": str(e)})
+    # Load configuration and create fetchers once for all symbols
+    settings = load_config()
+    settings.backtesting.initial_capital = initial_capital
+
+    alpaca_fetcher = AlpacaOptionsDataFetcher(
+        api_key=os.environ["ALPACA_API_KEY"],
+        api_secret=os.environ["ALPACA_SECRET_KEY"],
+    )
+    dolthub_fetcher = DoltHubOptionsDataFetcher()
+    data_loader = BacktestDataLoader(settings.backtesting.data)
+
+    # Run symbol backtests concurrently so one symbol's network waits overlap
+    # with another's processing (bounded: each symbol runs several DoltHub
+    # queries at once)
+    semaphore = asyncio.Semaphore(max_concurrent_symbols)
+
+    async def backtest_with_semaphore(symbol: str) -> Dict:
+        async with semaphore:
+            try:
+                return await run_symbol_backtest(
+                    symbol=symbol,
+                    start_dt=start_dt,
+                    end_dt=end_dt,
+                    settings=settings,
+                    alpaca_fetcher=alpaca_fetcher,
+                    dolthub_fetcher=dolthub_fetcher,
+                    data_loader=data_loader,
+                )
+            except Exception as e:
+                console.print(f"\n[red]✗ Error backtesting {symbol}: {e}[/red]")
+                return {"symbol": symbol, "error": str(e)}
+
+    # gather() keeps results in symbol order for the comparison table
+    results = await asyncio.gather(*(backtest_with_semaphore(s) for s in symbols))
 
     # Display comparison table
     console.print("\n")
@@ -307,37 +326,66 @@ async def main():
 
     console.print(comparison_table)
 
-    # Best performers
     valid_results = [r for r in results if "error" not in r]
 
     if valid_results:
-        console.print("\n[bold cyan]Key Insights:[/bold cyan]")
-
-        # Best total return
-        best_return = max(valid_results, key=lambda r: r["metrics"].total_return_percent)
-        console.print(f"[green]  ✓ Best Total Return: {best_return['symbol']} ({best_return['metrics'].total_return_percent:+.2f}%)[/green]")
-
-        # Best Sharpe
-        best_sharpe = max(valid_results, key=lambda r: r["metrics"].sharpe_ratio)
-        console.print(f"[green]  ✓ Best Risk-Adjusted: {best_sharpe['symbol']} (Sharpe: {best_sharpe['metrics'].sharpe_ratio:.2f})[/green]")
-
-        # Best win rate
-        best_winrate = max(valid_results, key=lambda r: r["metrics"].win_rate)
-        console.print(f"[green]  ✓ Best Win Rate: {best_winrate['symbol']} ({best_winrate['metrics'].win_rate:.1f}%)[/green]")
+        # One row per symbol, so best performers and averages are single
+        # column reductions instead of a pass over the results per metric
+        summary = pd.DataFrame(
+            [
+                (
+                    r["metrics"].total_return_percent,
+                    r["metrics"].sharpe_ratio,
+                    r["metrics"].win_rate,
+                    r["metrics"].total_trades,
+                )
+                for r in valid_results
+            ],
+            columns=["return", "sharpe", "win_rate", "trades"],
+        )
 
-        # Most trades
-        most_trades = max(valid_results, key=lambda r: r["metrics"].total_trades)
-        console.print(f"[green]  ✓ Most Active: {most_trades['symbol']} ({most_trades['metrics'].total_trades} trades)[/green]")
+        # Best performers (positions in valid_results)
+        best_idx = summary.idxmax()
+        best_return = valid_results[best_idx["return"]]
+        best_sharpe = valid_results[best_idx["sharpe"]]
+        best_winrate = valid_results[best_idx["win_rate"]]
+        most_trades = valid_results[best_idx["trades"]]
 
         # Average metrics
-        avg_return = sum(r["metrics"].total_return_percent for r in valid_results) / len(valid_results)
-        avg_sharpe = sum(r["metrics"].sharpe_ratio for r in valid_results) / len(valid_results)
-        avg_winrate = sum(r["metrics"].win_rate for r in valid_results) / len(valid_results)
-
-        console.print(f"\n[bold]Average Performance:[/bold]")
-        console.print(f"[dim]  Total Return: {avg_return:+.2f}%[/dim]")
-        console.print(f"[dim]  Sharpe Ratio: {avg_sharpe:.2f}[/dim]")
-        console.print(f"[dim]  Win Rate: {avg_winrate:.1f}%[/dim]")
+        avg_return, avg_sharpe, avg_winrate = summary[["return", "sharpe", "win_rate"]].mean()
+
+        # Collect everything into one table and print it once
+        insights_table = Table(title="Key Insights", box=box.SIMPLE)
+        insights_table.add_column("Insight", style="cyan")
+        insights_table.add_column("Symbol", style="green")
+        insights_table.add_column("Value", justify="right")
+
+        insights_table.add_row(
+            "Best Total Return",
+            best_return["symbol"],
+            f"{best_return['metrics'].total_return_percent:+.2f}%",
+        )
+        insights_table.add_row(
+            "Best Risk-Adjusted",
+            best_sharpe["symbol"],
+            f"Sharpe {best_sharpe['metrics'].sharpe_ratio:.2f}",
+        )
+        insights_table.add_row(
+            "Best Win Rate",
+            best_winrate["symbol"],
+            f"{best_winrate['metrics'].win_rate:.1f}%",
+        )
+        insights_table.add_row(
+            "Most Active",
+            most_trades["symbol"],
+            f"{most_trades['metrics'].total_trades} trades",
+        )
+        insights_table.add_section()
+        insights_table.add_row("Average Total Return", "all", f"{avg_return:+.2f}%")
+        insights_table.add_row("Average Sharpe Ratio", "all", f"{avg_sharpe:.2f}")
+        insights_table.add_row("Average Win Rate", "all", f"{avg_winrate:.1f}%")
+
+        console.print(insights_table)
 
     console.print("\n[bold green]Data Source:[/bold green]")
     console.print("[green]  ✓ Underlying: Alpaca API (REAL)[/green]")
@@ -17,11 +17,13 @@ Usage:
 
 import asyncio
 import logging
+import multiprocessing
 import os
 import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -30,12 +32,17 @@ sys.path.insert(0, str(project_root / "src"))
 from dotenv import load_dotenv
 load_dotenv(project_root / ".env")
 
+import numpy as np
+import pandas as pd
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich import box
 
+if TYPE_CHECKING:
+    from alpaca_options.backtesting import BacktestEngine
+
 console = Console()
 
 # Set INFO level for cleaner output
@@ -49,49 +56,48 @@ async def run_symbol_backtest(
     symbol: str,
     start_dt: datetime,
     end_dt: datetime,
-    initial_capital: float,
+    settings,
     config: dict,
+    alpaca_fetcher,
+    dolthub_fetcher,
+    data_loader,
+    underlying_data: Optional[pd.DataFrame] = None,
+    executor: Optional[Executor] = None,
+    trades_dir: Optional[Path] = None,
 ) -> Dict:
     """Run backtest for a single symbol using optimized config.
 
+    Fetchers and loader are shared across symbols (their clients and caches
+    are not per-symbol).
+
     Args:
         symbol: Stock symbol to test
         start_dt: Start date
         end_dt: End date
-        initial_capital: Starting capital
+        settings: Loaded settings (initial capital already applied)
         config: Strategy configuration dict
+        alpaca_fetcher: Shared AlpacaOptionsDataFetcher for underlying bars
+        dolthub_fetcher: Shared DoltHubOptionsDataFetcher for option chains
+        data_loader: Shared BacktestDataLoader for technical indicators
+        underlying_data: Prefetched hourly bars (fetched here if None)
+        executor: Process pool for the simulation (runs in this process if None)
+        trades_dir: Directory to write the symbol's trades to (not written if None)
 
     Returns:
         Dict with results and metrics
     """
-    from alpaca_options.backtesting import BacktestEngine
-    from alpaca_options.backtesting.alpaca_options_fetcher import AlpacaOptionsDataFetcher
-    from alpaca_options.backtesting.dolthub_options_fetcher import DoltHubOptionsDataFetcher
-    from alpaca_options.core.config import load_config
-    from alpaca_options.strategies import VerticalSpreadStrategy
-
-    # Load configuration
-    settings = load_config(project_root / "config" / "paper_trading.yaml")
-    settings.backtesting.initial_capital = initial_capital
-
-    # Initialize fetchers
-    api_key = os.environ.get("ALPACA_API_KEY", "")
-    api_secret = os.environ.get("ALPACA_SECRET_KEY", "")
-
-    alpaca_fetcher = AlpacaOptionsDataFetcher(
-        api_key=api_key,
-        api_secret=api_secret,
-    )
-
-    dolthub_fetcher = DoltHubOptionsDataFetcher()
-
-    # Fetch underlying data from Alpaca
-    underlying_data = alpaca_fetcher.fetch_underlying_bars(
-        symbol=symbol,
-        start_date=start_dt,
-        end_date=end_dt,
-        timeframe="1Hour",
-    )
+    from alpaca_options.backtesting.data_loader import trading_days
+
+    # Fetch underlying data from Alpaca unless main() prefetched it (blocking
+    # calls run in worker threads so the other symbols' backtests proceed meanwhile)
+    if underlying_data is None:
+        underlying_data = await asyncio.to_thread(
+            alpaca_fetcher.fetch_underlying_bars,
+            symbol=symbol,
+            start_date=start_dt,
+            end_date=end_dt,
+            timeframe="1Hour",
+        )
 
     if underlying_data.empty:
         return {
@@ -100,21 +106,19 @@ async def run_symbol_backtest(
         }
 
     # Add technical indicators
-    from alpaca_options.backtesting.data_loader import BacktestDataLoader
-    data_loader = BacktestDataLoader(settings.backtesting.data)
-    underlying_data = data_loader.add_technical_indicators(underlying_data)
+    underlying_data = await asyncio.to_thread(
+        data_loader.add_technical_indicators_cached,
+        underlying_data, symbol, start_dt, end_dt, timeframe="1Hour",
+    )
 
-    # Fetch options chains from DoltHub
-    options_data = {}
-    daily_timestamps = underlying_data.resample('1D').last().dropna(subset=['close']).index
+    # Fetch options chains from DoltHub (batched queries, several in flight);
+    # chains stay in the on-disk cache and are loaded as the engine reaches them
+    daily_timestamps = trading_days(underlying_data)
 
-    for timestamp in daily_timestamps:
-        chain = dolthub_fetcher.fetch_option_chain(
-            underlying=symbol,
-            as_of_date=timestamp,
-        )
-        if chain:
-            options_data[timestamp] = chain
+    options_data = await dolthub_fetcher.fetch_option_chains_lazy(
+        underlying=symbol,
+        as_of_dates=list(daily_timestamps),
+    )
 
     if not options_data:
         return {
@@ -122,18 +126,128 @@ async def run_symbol_backtest(
             "error": "No options data"
         }
 
+    # The strategy/engine simulation is CPU-bound; in a worker process it runs
+    # in parallel with the other symbols instead of sharing this process' GIL
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            executor,
+            simulate_symbol,
+            symbol,
+            start_dt,
+            end_dt,
+            settings,
+            config,
+            underlying_data,
+            options_data,
+            trades_dir,
+        )
+    else:
+        result = await _simulate_symbol(
+            symbol,
+            start_dt,
+            end_dt,
+            settings,
+            config,
+            underlying_data,
+            options_data,
+            trades_dir=trades_dir,
+        )
+
+    # Log which delta is being used
+    console.print(f"[dim]  {symbol}: Using delta {result['delta_used']:.2f}[/dim]")
+
+    return result
+
+
+def simulate_symbol(
+    symbol: str,
+    start_dt: datetime,
+    end_dt: datetime,
+    settings,
+    config: dict,
+    underlying_data: pd.DataFrame,
+    options_data: Mapping,
+    trades_dir: Optional[Path] = None,
+) -> Dict:
+    """Run the strategy simulation for one symbol (process-pool entry point).
+
+    Args:
+        symbol: Stock symbol to test
+        start_dt: Start date
+        end_dt: End date
+        settings: Loaded settings (initial capital already applied)
+        config: Strategy configuration dict
+        underlying_data: Hourly bars with technical indicators
+        options_data: Mapping of timestamp to OptionChain
+        trades_dir: Directory to write the symbol's trades to (not written if None)
+
+    Returns:
+        Dict with results and metrics
+    """
+    return asyncio.run(
+        _simulate_symbol(
+            symbol,
+            start_dt,
+            end_dt,
+            settings,
+            config,
+            underlying_data,
+            options_data,
+            engine=_worker_engine(settings),
+            trades_dir=trades_dir,
+        )
+    )
+
+
+# Engines built in this (worker) process, keyed by their config. A worker runs
+# one simulation at a time and BacktestEngine.run resets all per-run state, so
+# each worker pays engine construction (SEC filings analyzer etc.) only once.
+_worker_engines: Dict[str, "BacktestEngine"] = {}
+
+
+def _worker_engine(settings) -> "BacktestEngine":
+    """Get this process' engine for the given backtest and risk settings."""
+    from alpaca_options.backtesting import BacktestEngine
+
+    key = settings.backtesting.model_dump_json() + settings.risk.model_dump_json()
+    if key not in _worker_engines:
+        _worker_engines[key] = BacktestEngine(settings.backtesting, settings.risk)
+    return _worker_engines[key]
+
+
+async def _simulate_symbol(
+    symbol: str,
+    start_dt: datetime,
+    end_dt: datetime,
+    settings,
+    config: dict,
+    underlying_data: pd.DataFrame,
+    options_data: Mapping,
+    engine: Optional["BacktestEngine"] = None,
+    trades_dir: Optional[Path] = None,
+) -> Dict:
+    """Initialize the strategy and run the backtest engine for one symbol.
+
+    A fresh engine is created unless one is passed in; an engine must not be
+    shared by simulations running at the same time. Only metrics are
+    returned: trades are written to ``trades_dir`` here instead, so the trade
+    objects are never pickled back from a worker process or kept for the
+    whole run.
+    """
+    from alpaca_options.backtesting import BacktestEngine
+    from alpaca_options.strategies import VerticalSpreadStrategy
+
     # Create strategy instance
     strategy = VerticalSpreadStrategy()
 
     # Initialize strategy with OPTIMIZED CONFIG
     await strategy.initialize(config)
-
-    # Log which delta is being used
     delta_used = strategy._get_delta_for_symbol(symbol)
-    console.print(f"[dim]  {symbol}: Using delta {delta_used:.2f}[/dim]")
 
     # Create backtest engine
-    engine = BacktestEngine(settings.backtesting, settings.risk)
+    if engine is None:
+        engine = BacktestEngine(settings.backtesting, settings.risk)
 
     # Run backtest
     result = await engine.run(
@@ -146,15 +260,40 @@ async def run_symbol_backtest(
 
     m = result.metrics
 
+    trades_file = None
+    if trades_dir is not None:
+        trades_file = _write_trades(result, trades_dir / f"{symbol}_trades")
+
     return {
         "symbol": symbol,
         "metrics": m,
-        "trades": result.trades,
+        "trades_file": trades_file,
         "chains_loaded": len(options_data),
         "delta_used": delta_used,
     }
 
 
+def _write_trades(result, path: Path) -> Path:
+    """Write a backtest's trades to Parquet (CSV if no Parquet engine is installed).
+
+    Args:
+        result: BacktestResult whose trades to write
+        path: Output path without suffix
+
+    Returns:
+        Path of the written file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    trades = result.trades_frame()
+
+    try:
+        trades.to_parquet(path.with_suffix(".parquet"), compression="zstd")
+        return path.with_suffix(".parquet")
+    except ImportError:
+        trades.to_csv(path.with_suffix(".csv"), index=False)
+        return path.with_suffix(".csv")
+
+
 async def main():
     """Run comprehensive backtest validation."""
     import argparse
@@ -165,6 +304,12 @@ async def main():
         action="store_true",
         help="Use 2023-2024 only for faster testing"
     )
+    parser.add_argument(
+        "--trades-dir",
+        type=Path,
+        default=None,
+        help="Write each symbol's trades to <dir>/<symbol>_trades.parquet"
+    )
     args = parser.parse_args()
 
     console.print(Panel.fit(
@@ -187,6 +332,7 @@ async def main():
         console.print("[dim]Full mode: Testing 2019-2024 (~6 years)[/dim]\n")
 
     initial_capital = 10000.0
+    max_concurrent_symbols = 4
 
     console.print(f"[dim]Symbols: {', '.join(symbols)}[/dim]")
     console.print(f"[dim]Period: {start_dt.date()} to {end_dt.date()}[/dim]")
@@ -201,6 +347,7 @@ async def main():
     # Load configuration
     from alpaca_options.core.config import load_config
     settings = load_config(project_root / "config" / "paper_trading.yaml")
+    settings.backtesting.initial_capital = initial_capital
 
     vertical_config = settings.strategies.get("vertical_spread")
     if not vertical_config:
@@ -221,10 +368,47 @@ async def main():
 
     console.print("\n")
 
+    # Create fetchers and loader once for all symbols
+    from alpaca_options.backtesting.alpaca_options_fetcher import AlpacaOptionsDataFetcher
+    from alpaca_options.backtesting.data_loader import BacktestDataLoader
+    from alpaca_options.backtesting.dolthub_options_fetcher import DoltHubOptionsDataFetcher
+
+    alpaca_fetcher = AlpacaOptionsDataFetcher(
+        api_key=os.environ["ALPACA_API_KEY"],
+        api_secret=os.environ["ALPACA_SECRET_KEY"],
+    )
+    try:
+        dolthub_fetcher = DoltHubOptionsDataFetcher()
+    except RuntimeError as e:
+        console.print(f"[red]ERROR: {e}[/red]")
+        return
+    data_loader = BacktestDataLoader(settings.backtesting.data)
+
+    # Fetch every symbol's bars with one multi-symbol request (cached symbols
+    # are read from disk); symbols missing here are fetched per symbol instead
+    try:
+        underlying_bars = await asyncio.to_thread(
+            alpaca_fetcher.fetch_underlying_bars_multi,
+            symbols=symbols,
+            start_date=start_dt,
+            end_date=end_dt,
+            timeframe="1Hour",
+        )
+    except Exception as e:
+        console.print(f"[yellow]Batched bar fetch failed ({e}), fetching per symbol[/yellow]")
+        underlying_bars = {}
+
     # Run backtests
     all_results = {}
 
-    with Progress(
+    # Simulations run in worker processes (spawned, since this process already
+    # has I/O threads running); data fetching stays here with shared clients
+    executor = ProcessPoolExecutor(
+        max_workers=min(max_concurrent_symbols, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+    with executor, Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
@@ -235,32 +419,45 @@ async def main():
             total=len(symbols)
         )
 
-        for symbol in symbols:
+        # Symbols run concurrently (bounded to respect Alpaca rate limits);
+        # progress ticks as each one finishes
+        semaphore = asyncio.Semaphore(max_concurrent_symbols)
+
+        async def backtest_with_semaphore(symbol: str) -> Dict:
+            async with semaphore:
+                try:
+                    return await run_symbol_backtest(
+                        symbol=symbol,
+                        start_dt=start_dt,
+                        end_dt=end_dt,
+                        settings=settings,
+                        config=vertical_config.config,
+                        alpaca_fetcher=alpaca_fetcher,
+                        dolthub_fetcher=dolthub_fetcher,
+                        data_loader=data_loader,
+                        underlying_data=underlying_bars.get(symbol),
+                        executor=executor,
+                        trades_dir=args.trades_dir,
+                    )
+                except Exception as e:
+                    console.print(f"\n[red]Error testing {symbol}: {e}[/red]")
+                    import traceback
+                    traceback.print_exc()
+                    return {
+                        "symbol": symbol,
+                        "error": str(e)
+                    }
+
+        tasks = [backtest_with_semaphore(symbol) for symbol in symbols]
+        for finished in asyncio.as_completed(tasks):
+            result = await finished
+            all_results[result["symbol"]] = result
             progress.update(
                 task,
-                description=f"[cyan]Running backtest for {symbol}..."
+                advance=1,
+                description=f"[cyan]Finished {result['symbol']}...",
             )
 
-            try:
-                result = await run_symbol_backtest(
-                    symbol=symbol,
-                    start_dt=start_dt,
-                    end_dt=end_dt,
-                    initial_capital=initial_capital,
-                    config=vertical_config.config,
-                )
-                all_results[symbol] = result
-            except Exception as e:
-                console.print(f"\n[red]Error testing {symbol}: {e}[/red]")
-                import traceback
-                traceback.print_exc()
-                all_results[symbol] = {
-                    "symbol": symbol,
-                    "error": str(e)
-                }
-
-            progress.update(task, advance=1)
-
         progress.update(task, description="[green]✓ All backtests complete")
 
     # Display results
@@ -330,11 +527,22 @@ async def main():
     if valid_results:
         console.print("\n[bold cyan]Portfolio Aggregate:[/bold cyan]\n")
 
-        total_trades = sum(r["metrics"].total_trades for r in valid_results)
-        avg_return = sum(r["metrics"].total_return_percent for r in valid_results) / len(valid_results)
-        avg_sharpe = sum(r["metrics"].sharpe_ratio for r in valid_results) / len(valid_results)
-        avg_win_rate = sum(r["metrics"].win_rate for r in valid_results) / len(valid_results)
-        avg_max_dd = sum(r["metrics"].max_drawdown_percent for r in valid_results) / len(valid_results)
+        # One row per symbol: (return, sharpe, win rate, max drawdown, trades)
+        metrics_arr = np.array(
+            [
+                [
+                    r["metrics"].total_return_percent,
+                    r["metrics"].sharpe_ratio,
+                    r["metrics"].win_rate,
+                    r["metrics"].max_drawdown_percent,
+                    r["metrics"].total_trades,
+                ]
+                for r in valid_results
+            ],
+            dtype=np.float64,
+        )
+        avg_return, avg_sharpe, avg_win_rate, avg_max_dd = metrics_arr[:, :4].mean(axis=0)
+        total_trades = int(metrics_arr[:, 4].sum())
 
         # Calculate average annualized return
         avg_annualized = (((1 + avg_return/100) ** (1/years)) - 1) * 100
@@ -355,9 +563,10 @@ async def main():
         # Best performers
         console.print("\n[bold cyan]Top Performers:[/bold cyan]\n")
 
-        best_return = max(valid_results, key=lambda r: r["metrics"].total_return_percent)
-        best_sharpe = max(valid_results, key=lambda r: r["metrics"].sharpe_ratio)
-        best_winrate = max(valid_results, key=lambda r: r["metrics"].win_rate)
+        best_return_idx, best_sharpe_idx, best_winrate_idx = metrics_arr[:, :3].argmax(axis=0)
+        best_return = valid_results[best_return_idx]
+        best_sharpe = valid_results[best_sharpe_idx]
+        best_winrate = valid_results[best_winrate_idx]
 
         console.print(f"  [green]Best Return:[/green] {best_return['symbol']} "
                      f"({best_return['metrics'].total_return_percent:+.2f}%)")
@@ -383,46 +592,58 @@ async def main():
         validation_table.add_column("Actual", justify="right", width=12)
         validation_table.add_column("Diff", justify="right", width=12)
 
-        for symbol in symbols:
-            result = all_results.get(symbol, {})
-            if "error" not in result and symbol in expected:
-                m = result["metrics"]
-                exp = expected[symbol]
-
-                # Return comparison
-                return_diff = m.total_return_percent - exp["return"]
-                return_diff_style = "green" if abs(return_diff) < 20 else "yellow"
-                validation_table.add_row(
-                    symbol,
-                    "Return",
-                    f"{exp['return']:+.2f}%",
-                    f"{m.total_return_percent:+.2f}%",
-                    f"[{return_diff_style}]{return_diff:+.2f}%[/{return_diff_style}]"
-                )
-
-                # Sharpe comparison
-                sharpe_diff = m.sharpe_ratio - exp["sharpe"]
-                sharpe_diff_style = "green" if abs(sharpe_diff) < 0.5 else "yellow"
-                validation_table.add_row(
-                    "",
-                    "Sharpe",
-                    f"{exp['sharpe']:.2f}",
-                    f"{m.sharpe_ratio:.2f}",
-                    f"[{sharpe_diff_style}]{sharpe_diff:+.2f}[/{sharpe_diff_style}]"
-                )
-
-                # Win rate comparison
-                wr_diff = m.win_rate - exp["win_rate"]
-                wr_diff_style = "green" if abs(wr_diff) < 5 else "yellow"
-                validation_table.add_row(
-                    "",
-                    "Win Rate",
-                    f"{exp['win_rate']:.1f}%",
-                    f"{m.win_rate:.1f}%",
-                    f"[{wr_diff_style}]{wr_diff:+.1f}%[/{wr_diff_style}]"
-                )
-
-                validation_table.add_row("", "", "", "", "")  # Separator
+        # Differences and their styles are computed for all symbols at once;
+        # the loop below only renders rows
+        expected_df = pd.DataFrame(expected).T
+        actual_df = pd.DataFrame(
+            {
+                r["symbol"]: {
+                    "return": r["metrics"].total_return_percent,
+                    "sharpe": r["metrics"].sharpe_ratio,
+                    "win_rate": r["metrics"].win_rate,
+                }
+                for r in valid_results
+            }
+        ).T
+        checked = [sym for sym in symbols if sym in actual_df.index and sym in expected_df.index]
+        expected_df = expected_df.loc[checked, ["return", "sharpe", "win_rate"]]
+        actual_df = actual_df.loc[checked, ["return", "sharpe", "win_rate"]]
+        diff_df = actual_df - expected_df
+
+        tolerances = np.array([20.0, 0.5, 5.0])
+        diff_styles = np.where(np.abs(diff_df.to_numpy()) < tolerances, "green", "yellow")
+
+        for symbol, exp, act, diff, style in zip(
+            checked,
+            expected_df.to_numpy(),
+            actual_df.to_numpy(),
+            diff_df.to_numpy(),
+            diff_styles,
+        ):
+            # Columns are (return, sharpe, win_rate)
+            validation_table.add_row(
+                symbol,
+                "Return",
+                f"{exp[0]:+.2f}%",
+                f"{act[0]:+.2f}%",
+                f"[{style[0]}]{diff[0]:+.2f}%[/{style[0]}]"
+            )
+            validation_table.add_row(
+                "",
+                "Sharpe",
+                f"{exp[1]:.2f}",
+                f"{act[1]:.2f}",
+                f"[{style[1]}]{diff[1]:+.2f}[/{style[1]}]"
+            )
+            validation_table.add_row(
+                "",
+                "Win Rate",
+                f"{exp[2]:.1f}%",
+                f"{act[2]:.1f}%",
+                f"[{style[2]}]{diff[2]:+.1f}%[/{style[2]}]"
+            )
+
+            validation_table.add_row("", "", "", "", "")  # Separator
 
         console.print(validation_table)
 
@@ -441,6 +662,9 @@ async def main():
         border_style="green"
     ))
 
+    if args.trades_dir is not None:
+        console.print(f"\n[dim]Trades written to {args.trades_dir}[/dim]")
+
     console.print("\n[dim]Backtest complete.[/dim]")
 
 
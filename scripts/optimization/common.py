@@ -0,0 +1,95 @@
+"""Helpers shared by the parallel optimization scripts.
+
+The scripts are run directly (``python scripts/optimization/<script>.py``),
+which puts this directory on ``sys.path``, so they import this module as
+``common``.
+"""
+
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from rich import box
+from rich.table import Table
+from rich.text import Text
+
+# Results table column schema: (header, justify, style, width)
+Column = Tuple[str, str, str, int]
+
+# Backtest metric columns every results table ends with
+METRIC_COLUMNS: Tuple[Column, ...] = (
+    ("Total Return", "right", "", 12),
+    ("Sharpe", "right", "", 8),
+    ("Win Rate", "right", "", 10),
+    ("Trades", "right", "", 8),
+    ("Max DD", "right", "", 10),
+)
+
+# Styled once and reused for every failed row
+ERROR_CELL = Text("ERROR", style="red")
+
+
+def resolve_base_config(settings, baseline_params: Mapping) -> Dict:
+    """Merge the configured vertical spread settings with a script's baseline.
+
+    Built once per run and shared by every backtest, which only adds the
+    parameters it varies.
+
+    Args:
+        settings: Loaded Settings
+        baseline_params: Parameters the script holds at baseline
+
+    Returns:
+        Base strategy config dict
+    """
+    strat_config = settings.strategies.get("vertical_spread")
+    base = strat_config.config if strat_config else {}
+    return {**base, **baseline_params}
+
+
+def results_table(
+    title: str,
+    param_columns: Sequence[Column],
+    extra_columns: Sequence[Column] = (),
+) -> Table:
+    """Create a results table: parameter, metric, then any extra columns.
+
+    Args:
+        title: Table title
+        param_columns: Columns of the parameters the script varies
+        extra_columns: Script-specific columns after METRIC_COLUMNS
+
+    Returns:
+        Empty rich Table
+    """
+    table = Table(title=title, box=box.ROUNDED)
+    for header, justify, style, width in (*param_columns, *METRIC_COLUMNS, *extra_columns):
+        table.add_column(header, justify=justify, style=style, width=width)
+    return table
+
+
+def metric_cells(metrics) -> List:
+    """Format backtest metrics as the METRIC_COLUMNS cells of a row.
+
+    Args:
+        metrics: BacktestMetrics of one backtest
+
+    Returns:
+        Cells with the total return colored by sign
+    """
+    return_style = "green" if metrics.total_return_percent > 0 else "red"
+    return [
+        Text(f"{metrics.total_return_percent:+.2f}%", style=return_style),
+        f"{metrics.sharpe_ratio:.2f}",
+        f"{metrics.win_rate:.1f}%",
+        str(metrics.total_trades),
+        f"{metrics.max_drawdown_percent:.2f}%",
+    ]
+
+
+def add_error_row(table: Table, *param_cells) -> None:
+    """Add a failed backtest's row: its parameters, then ERROR cells.
+
+    Args:
+        table: Table from results_table
+        *param_cells: Cells of the backtest's parameters
+    """
+    table.add_row(*param_cells, *[ERROR_CELL] * (len(table.columns) - len(param_cells)))
@@ -21,7 +21,7 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -31,12 +31,13 @@ from dotenv import load_dotenv
 load_dotenv(project_root / ".env")
 
 from rich.console import Console
-from rich.table import Table
+from rich.text import Text
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich import box
 import argparse
 
+from common import add_error_row, metric_cells, resolve_base_config, results_table
+
 console = Console()
 
 # Set INFO level for cleaner output
@@ -45,6 +46,28 @@ logging.basicConfig(
     format='%(levelname)-8s [%(name)s] %(message)s',
 )
 
+# Results table columns: (header, justify, style, width)
+PARAM_COLUMNS = (("Delta", "center", "cyan", 8),)
+EXTRA_COLUMNS = (("Profit Factor", "right", "", 12),)
+
+
+# Parameters held at baseline while delta is optimized
+BASELINE_PARAMS = {
+    "min_dte": 21,
+    "max_dte": 45,
+    "close_dte": 14,
+    "spread_width": 5.0,
+    "min_iv_rank": 0,
+    "min_open_interest": 0,
+    "max_spread_percent": 15.0,
+    "min_return_on_risk": 0.08,
+    "rsi_oversold": 45.0,
+    "rsi_overbought": 55.0,
+    "min_credit": 15.0,
+    "profit_target_pct": 0.50,
+    "stop_loss_multiplier": 2.0,
+}
+
 
 async def run_delta_backtest(
     delta_target: float,
@@ -52,6 +75,7 @@ async def run_delta_backtest(
     start_dt: datetime,
     end_dt: datetime,
     initial_capital: float = 10000.0,
+    base_config: Optional[Dict] = None,
 ) -> Dict:
     """Run backtest with specific delta target.
 
@@ -61,6 +85,7 @@ async def run_delta_backtest(
         start_dt: Start date
         end_dt: End date
         initial_capital: Starting capital
+        base_config: Strategy config from resolve_base_config (resolved if None)
 
     Returns:
         Dict with results and metrics
@@ -87,8 +112,10 @@ async def run_delta_backtest(
 
     dolthub_fetcher = DoltHubOptionsDataFetcher()
 
-    # Fetch underlying data from Alpaca
-    underlying_data = alpaca_fetcher.fetch_underlying_bars(
+    # Fetch underlying data from Alpaca (in a thread, so concurrent backtests
+    # keep running while this one waits on the network)
+    underlying_data = await asyncio.to_thread(
+        alpaca_fetcher.fetch_underlying_bars,
         symbol=symbol,
         start_date=start_dt,
         end_date=end_dt,
@@ -99,21 +126,19 @@ async def run_delta_backtest(
         return {"symbol": symbol, "delta": delta_target, "error": "No underlying data"}
 
     # Add technical indicators
-    from alpaca_options.backtesting.data_loader import BacktestDataLoader
+    from alpaca_options.backtesting.data_loader import BacktestDataLoader, trading_days
     data_loader = BacktestDataLoader(settings.backtesting.data)
-    underlying_data = data_loader.add_technical_indicators(underlying_data)
+    underlying_data = await asyncio.to_thread(
+        data_loader.add_technical_indicators_cached,
+        underlying_data, symbol, start_dt, end_dt,
+    )
 
     # Fetch options chains from DoltHub
-    options_data = {}
-    daily_timestamps = underlying_data.resample('1D').last().dropna(subset=['close']).index
-
-    for timestamp in daily_timestamps:
-        chain = dolthub_fetcher.fetch_option_chain(
-            underlying=symbol,
-            as_of_date=timestamp,
-        )
-        if chain:
-            options_data[timestamp] = chain
+    daily_timestamps = trading_days(underlying_data)
+    options_data = await dolthub_fetcher.fetch_option_chains_async(
+        underlying=symbol,
+        as_of_dates=list(daily_timestamps),
+    )
 
     if not options_data:
         return {"symbol": symbol, "delta": delta_target, "error": "No options data"}
@@ -121,35 +146,19 @@ async def run_delta_backtest(
     # Create strategy instance
     strategy = VerticalSpreadStrategy()
 
-    # Configure strategy with specific delta
-    strat_config = settings.strategies.get("vertical_spread")
-    if strat_config:
-        strategy._config = strat_config.config.copy()
-    else:
-        strategy._config = {}
-
-    strategy._config["underlyings"] = [symbol]
-
-    # Set DELTA TARGET (optimization parameter)
-    strategy._config["delta_target"] = delta_target
-
-    # Keep other parameters at baseline
-    strategy._config["spread_width"] = 5.0
-    strategy._config["min_iv_rank"] = 0
-    strategy._config["min_dte"] = 21
-    strategy._config["max_dte"] = 45
-    strategy._config["close_dte"] = 14
-    strategy._config["min_open_interest"] = 0
-    strategy._config["max_spread_percent"] = 15.0
-    strategy._config["min_return_on_risk"] = 0.08
-    strategy._config["rsi_oversold"] = 45.0
-    strategy._config["rsi_overbought"] = 55.0
-    strategy._config["min_credit"] = 15.0
-    strategy._config["profit_target_pct"] = 0.50
-    strategy._config["stop_loss_multiplier"] = 2.0
+    # Configure strategy with specific delta on top of the shared base
+    if base_config is None:
+        base_config = resolve_base_config(settings, BASELINE_PARAMS)
+
+    config = {
+        **base_config,
+        "underlyings": [symbol],
+        # Set DELTA TARGET (optimization parameter)
+        "delta_target": delta_target,
+    }
 
     # Initialize strategy
-    await strategy.initialize(strategy._config)
+    await strategy.initialize(config)
 
     # Create backtest engine
     engine = BacktestEngine(settings.backtesting, settings.risk)
@@ -211,6 +220,7 @@ async def main():
         console.print("[dim]Full mode: Testing 2019-2024 (~6 years)[/dim]\n")
 
     initial_capital = 10000.0
+    max_concurrent_backtests = 4
 
     console.print(f"[dim]Symbols: {', '.join(symbols)}[/dim]")
     console.print(f"[dim]Period: {start_dt.date()} to {end_dt.date()}[/dim]")
@@ -225,25 +235,21 @@ async def main():
         console.print("[yellow]Set ALPACA_API_KEY and ALPACA_SECRET_KEY environment variables[/yellow]")
         return
 
-    # Create all backtest tasks upfront (PARALLEL EXECUTION)
+    from alpaca_options.core.config import load_config
+
+    # Strategy config shared by every job; each adds only what it varies
+    base_config = resolve_base_config(load_config(), BASELINE_PARAMS)
+
+    # Create all backtest jobs upfront (PARALLEL EXECUTION)
     console.print("[cyan]Creating backtest tasks...[/cyan]")
-    tasks = []
-    task_metadata = []  # Track which symbol/delta each task represents
-
-    for symbol in symbols:
-        for delta in delta_targets:
-            task = run_delta_backtest(
-                delta_target=delta,
-                symbol=symbol,
-                start_dt=start_dt,
-                end_dt=end_dt,
-                initial_capital=initial_capital,
-            )
-            tasks.append(task)
-            task_metadata.append({"symbol": symbol, "delta": delta})
+    jobs = [(symbol, delta) for symbol in symbols for delta in delta_targets]
+
+    # Bound how many backtests load data at once; their network waits overlap
+    # on the event loop
+    semaphore = asyncio.Semaphore(max_concurrent_backtests)
 
     # Run all tasks concurrently with progress tracking
-    console.print(f"[bold green]Running {len(tasks)} backtests in parallel...[/bold green]\n")
+    console.print(f"[bold green]Running {len(jobs)} backtests in parallel...[/bold green]\n")
 
     with Progress(
         SpinnerColumn(),
@@ -254,32 +260,34 @@ async def main():
     ) as progress:
         task_progress = progress.add_task(
             "[cyan]Running parallel backtests...",
-            total=len(tasks)
+            total=len(jobs)
         )
 
-        # Run all tasks concurrently (use return_exceptions to handle errors gracefully)
-        results = []
         completed = 0
 
-        # Use asyncio.as_completed to track progress
-        for coro in asyncio.as_completed(tasks):
-            try:
-                result = await coro
-                results.append(result)
-            except Exception as e:
-                # Get metadata for this task
-                meta = task_metadata[completed]
-                console.print(f"\n[red]Error in {meta['symbol']} delta={meta['delta']}: {e}[/red]")
-                results.append({
-                    "symbol": meta["symbol"],
-                    "delta": meta["delta"],
-                    "error": str(e)
-                })
+        async def run_job(symbol: str, delta: float) -> Dict:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    result = await run_delta_backtest(
+                        delta_target=delta,
+                        symbol=symbol,
+                        start_dt=start_dt,
+                        end_dt=end_dt,
+                        initial_capital=initial_capital,
+                        base_config=base_config,
+                    )
+                except Exception as e:
+                    console.print(f"\n[red]Error in {symbol} delta={delta}: {e}[/red]")
+                    result = {"symbol": symbol, "delta": delta, "error": str(e)}
 
             completed += 1
-            progress.update(task_progress, advance=1, description=f"[cyan]Completed {completed}/{len(tasks)} backtests...")
+            progress.update(task_progress, advance=1, description=f"[cyan]Completed {completed}/{len(jobs)} backtests...")
+            return result
 
-        progress.update(task_progress, description=f"[green]✓ All {len(tasks)} backtests complete!")
+        results = await asyncio.gather(*[run_job(symbol, delta) for symbol, delta in jobs])
+
+        progress.update(task_progress, description=f"[green]✓ All {len(jobs)} backtests complete!")
 
     # Organize results by symbol
     all_results = {}
@@ -304,26 +312,11 @@ async def main():
         console.print(f"\n[bold cyan]{symbol} Results:[/bold cyan]")
 
         # Create comparison table
-        table = Table(title=f"{symbol} Delta Optimization", box=box.ROUNDED)
-        table.add_column("Delta", justify="center", style="cyan", width=8)
-        table.add_column("Total Return", justify="right", width=12)
-        table.add_column("Sharpe", justify="right", width=8)
-        table.add_column("Win Rate", justify="right", width=10)
-        table.add_column("Trades", justify="right", width=8)
-        table.add_column("Max DD", justify="right", width=10)
-        table.add_column("Profit Factor", justify="right", width=12)
+        table = results_table(f"{symbol} Delta Optimization", PARAM_COLUMNS, EXTRA_COLUMNS)
 
         for result in results:
             if "error" in result:
-                table.add_row(
-                    f"{result['delta']:.2f}",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
-                )
+                add_error_row(table, f"{result['delta']:.2f}")
             else:
                 m = result["metrics"]
                 baseline = (result["delta"] == 0.20)
@@ -331,18 +324,11 @@ async def main():
                 # Highlight baseline
                 delta_str = f"{result['delta']:.2f}"
                 if baseline:
-                    delta_str = f"[bold]{delta_str}*[/bold]"
-
-                # Color code returns
-                return_style = "green" if m.total_return_percent > 0 else "red"
+                    delta_str = Text(f"{delta_str}*", style="bold")
 
                 table.add_row(
                     delta_str,
-                    f"[{return_style}]{m.total_return_percent:+.2f}%[/{return_style}]",
-                    f"{m.sharpe_ratio:.2f}",
-                    f"{m.win_rate:.1f}%",
-                    str(m.total_trades),
-                    f"{m.max_drawdown_percent:.2f}%",
+                    *metric_cells(m),
                     f"{m.profit_factor:.2f}" if m.profit_factor != float('inf') else "N/A",
                 )
 
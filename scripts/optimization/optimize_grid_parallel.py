@@ -18,11 +18,13 @@ Usage:
 
 import asyncio
 import logging
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -32,11 +34,13 @@ from dotenv import load_dotenv
 load_dotenv(project_root / ".env")
 
 from rich.console import Console
-from rich.table import Table
+from rich.text import Text
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich import box
 import argparse
+import pandas as pd
+
+from common import add_error_row, metric_cells, resolve_base_config, results_table
 
 console = Console()
 
@@ -46,42 +50,39 @@ logging.basicConfig(
     format='%(levelname)-8s [%(name)s] %(message)s',
 )
 
+# Results table parameter columns: (header, justify, style, width)
+PARAM_COLUMNS = (
+    ("Delta", "center", "cyan", 8),
+    ("DTE Range", "center", "", 12),
+)
 
-async def run_parameter_backtest(
+
+async def load_symbol_data(
     symbol: str,
-    delta_target: float,
-    min_dte: int,
-    max_dte: int,
-    close_dte: int,
     start_dt: datetime,
     end_dt: datetime,
-    initial_capital: float = 10000.0,
-) -> Dict:
-    """Run backtest with specific parameter combination.
+) -> Tuple[pd.DataFrame, Mapping]:
+    """Load underlying bars (with indicators) and option chains for one symbol.
+
+    The data only depends on (symbol, start, end), so it is loaded once per
+    symbol and shared by every parameter combination tested on it.
 
     Args:
-        symbol: Stock symbol to test
-        delta_target: Target delta (e.g., 0.20 for 20 delta)
-        min_dte: Minimum days to expiration
-        max_dte: Maximum days to expiration
-        close_dte: Close DTE threshold
+        symbol: Stock symbol to load
         start_dt: Start date
         end_dt: End date
-        initial_capital: Starting capital
 
     Returns:
-        Dict with results and metrics
+        Tuple of (underlying_data, options_data); options_data is a lazy
+        CachedOptionChains, which pickles to worker processes without the
+        chains themselves. Both are empty when Alpaca has no bars for the symbol
     """
-    from alpaca_options.backtesting import BacktestEngine
     from alpaca_options.backtesting.alpaca_options_fetcher import AlpacaOptionsDataFetcher
     from alpaca_options.backtesting.dolthub_options_fetcher import DoltHubOptionsDataFetcher
     from alpaca_options.core.config import load_config
-    from alpaca_options.strategies import VerticalSpreadStrategy
-    from alpaca_options.backtesting.data_loader import BacktestDataLoader
+    from alpaca_options.backtesting.data_loader import BacktestDataLoader, trading_days
 
-    # Load configuration
     settings = load_config()
-    settings.backtesting.initial_capital = initial_capital
 
     # Initialize fetchers
     api_key = os.environ.get("ALPACA_API_KEY", "")
@@ -95,13 +96,91 @@ async def run_parameter_backtest(
     dolthub_fetcher = DoltHubOptionsDataFetcher()
 
     # Fetch underlying data from Alpaca
-    underlying_data = alpaca_fetcher.fetch_underlying_bars(
+    underlying_data = await asyncio.to_thread(
+        alpaca_fetcher.fetch_underlying_bars,
         symbol=symbol,
         start_date=start_dt,
         end_date=end_dt,
         timeframe="1Hour",
     )
 
+    if underlying_data.empty:
+        return underlying_data, {}
+
+    # Add technical indicators
+    data_loader = BacktestDataLoader(settings.backtesting.data)
+    underlying_data = await asyncio.to_thread(
+        data_loader.add_technical_indicators_cached,
+        underlying_data, symbol, start_dt, end_dt,
+    )
+
+    # Fetch options chains from DoltHub
+    daily_timestamps = trading_days(underlying_data)
+    options_data = await dolthub_fetcher.fetch_option_chains_lazy(
+        underlying=symbol,
+        as_of_dates=list(daily_timestamps),
+    )
+
+    return underlying_data, options_data
+
+
+# Parameters held at baseline for every grid combination
+BASELINE_PARAMS = {
+    "spread_width": 5.0,
+    "min_iv_rank": 0,
+    "min_open_interest": 0,
+    "max_spread_percent": 15.0,
+    "min_return_on_risk": 0.08,
+    "rsi_oversold": 45.0,
+    "rsi_overbought": 55.0,
+    "min_credit": 15.0,
+    "profit_target_pct": 0.50,
+    "stop_loss_multiplier": 2.0,
+}
+
+
+async def run_parameter_backtest(
+    symbol: str,
+    delta_target: float,
+    min_dte: int,
+    max_dte: int,
+    close_dte: int,
+    start_dt: datetime,
+    end_dt: datetime,
+    initial_capital: float = 10000.0,
+    underlying_data: Optional[pd.DataFrame] = None,
+    options_data: Optional[Mapping] = None,
+    base_config: Optional[Dict] = None,
+) -> Dict:
+    """Run backtest with specific parameter combination.
+
+    Args:
+        symbol: Stock symbol to test
+        delta_target: Target delta (e.g., 0.20 for 20 delta)
+        min_dte: Minimum days to expiration
+        max_dte: Maximum days to expiration
+        close_dte: Close DTE threshold
+        start_dt: Start date
+        end_dt: End date
+        initial_capital: Starting capital
+        underlying_data: Bars with indicators from load_symbol_data (loaded if None)
+        options_data: Option chains from load_symbol_data (loaded if None)
+        base_config: Strategy config from resolve_base_config (resolved if None)
+
+    Returns:
+        Dict with results and metrics
+    """
+    from alpaca_options.backtesting import BacktestEngine
+    from alpaca_options.core.config import load_config
+    from alpaca_options.strategies import VerticalSpreadStrategy
+
+    # Load configuration
+    settings = load_config()
+    settings.backtesting.initial_capital = initial_capital
+
+    if underlying_data is None or options_data is None:
+        underlying_data, options_data = await load_symbol_data(symbol, start_dt, end_dt)
+
     if underlying_data.empty:
         return {
             "symbol": symbol,
@@ -112,22 +191,6 @@ async def run_parameter_backtest(
             "error": "No underlying data"
         }
 
-    # Add technical indicators
-    data_loader = BacktestDataLoader(settings.backtesting.data)
-    underlying_data = data_loader.add_technical_indicators(underlying_data)
-
-    # Fetch options chains from DoltHub
-    options_data = {}
-    daily_timestamps = underlying_data.resample('1D').last().dropna(subset=['close']).index
-
-    for timestamp in daily_timestamps:
-        chain = dolthub_fetcher.fetch_option_chain(
-            underlying=symbol,
-            as_of_date=timestamp,
-        )
-        if chain:
-            options_data[timestamp] = chain
-
     if not options_data:
         return {
             "symbol": symbol,
@@ -141,33 +204,21 @@ async def run_parameter_backtest(
     # Create strategy instance
     strategy = VerticalSpreadStrategy()
 
-    # Configure strategy with specific parameters
-    strat_config = settings.strategies.get("vertical_spread")
-    if strat_config:
-        strategy._config = strat_config.config.copy()
-    else:
-        strategy._config = {}
-
-    strategy._config["underlyings"] = [symbol]
-    strategy._config["delta_target"] = delta_target
-    strategy._config["min_dte"] = min_dte
-    strategy._config["max_dte"] = max_dte
-    strategy._config["close_dte"] = close_dte
-
-    # Keep other parameters at baseline
-    strategy._config["spread_width"] = 5.0
-    strategy._config["min_iv_rank"] = 0
-    strategy._config["min_open_interest"] = 0
-    strategy._config["max_spread_percent"] = 15.0
-    strategy._config["min_return_on_risk"] = 0.08
-    strategy._config["rsi_oversold"] = 45.0
-    strategy._config["rsi_overbought"] = 55.0
-    strategy._config["min_credit"] = 15.0
-    strategy._config["profit_target_pct"] = 0.50
-    strategy._config["stop_loss_multiplier"] = 2.0
+    # Configure strategy with specific parameters on top of the shared base
+    if base_config is None:
+        base_config = resolve_base_config(settings, BASELINE_PARAMS)
+
+    config = {
+        **base_config,
+        "underlyings": [symbol],
+        "delta_target": delta_target,
+        "min_dte": min_dte,
+        "max_dte": max_dte,
+        "close_dte": close_dte,
+    }
 
     # Initialize strategy
-    await strategy.initialize(strategy._config)
+    await strategy.initialize(config)
 
     # Create backtest engine
     engine = BacktestEngine(settings.backtesting, settings.risk)
@@ -194,6 +245,54 @@ async def run_parameter_backtest(
     }
 
 
+# Each symbol's (underlying_data, options_data), handed to a worker process
+# once when it starts instead of being pickled into every job it runs
+_worker_data: Dict[str, Tuple[pd.DataFrame, Mapping]] = {}
+
+
+def _init_worker(symbol_data: Dict[str, Tuple[pd.DataFrame, Mapping]]) -> None:
+    """Store the shared per-symbol data in a new worker process (pool initializer)."""
+    _worker_data.update(symbol_data)
+
+
+def _run_parameter_backtest_proc(job: Dict) -> Dict:
+    """Run one grid backtest in a worker process (process-pool entry point).
+
+    Args:
+        job: Keyword arguments for run_parameter_backtest, without the
+            symbol's data, which is taken from the worker's _worker_data.
+
+    Returns:
+        Dict with results and metrics
+    """
+    underlying_data, options_data = _worker_data[job["symbol"]]
+    return asyncio.run(
+        run_parameter_backtest(
+            **job, underlying_data=underlying_data, options_data=options_data
+        )
+    )
+
+
+def error_result(job: Dict, error: str) -> Dict:
+    """Build the result of a grid backtest that could not run.
+
+    Args:
+        job: Keyword arguments of the backtest
+        error: Error message
+
+    Returns:
+        Dict with the job's parameters and the error
+    """
+    return {
+        "symbol": job["symbol"],
+        "delta": job["delta_target"],
+        "min_dte": job["min_dte"],
+        "max_dte": job["max_dte"],
+        "close_dte": job["close_dte"],
+        "error": error,
+    }
+
+
 async def main():
     """Run comprehensive parameter grid search with parallel execution."""
     parser = argparse.ArgumentParser(description="Parameter grid search (PARALLEL)")
@@ -252,35 +351,83 @@ async def main():
         console.print("[yellow]Set ALPACA_API_KEY and ALPACA_SECRET_KEY environment variables[/yellow]")
         return
 
-    # Create all backtest tasks upfront (PARALLEL EXECUTION)
+    # Load each symbol's data once; every parameter combination reuses it
+    console.print("[cyan]Loading market data...[/cyan]")
+    loaded = await asyncio.gather(
+        *[load_symbol_data(symbol, start_dt, end_dt) for symbol in symbols],
+        return_exceptions=True,
+    )
+
+    # A symbol whose data failed to load only loses its own combinations
+    symbol_data = {}
+    load_errors = {}
+    for symbol, data in zip(symbols, loaded):
+        if isinstance(data, Exception):
+            console.print(f"[red]Error loading {symbol} data: {data}[/red]")
+            load_errors[symbol] = str(data)
+        else:
+            symbol_data[symbol] = data
+
+    from alpaca_options.core.config import load_config
+
+    # Strategy config shared by every job; each adds only what it varies
+    base_config = resolve_base_config(load_config(), BASELINE_PARAMS)
+
+    # Create all backtest jobs upfront (PARALLEL EXECUTION)
     console.print("[cyan]Creating backtest tasks...[/cyan]")
-    tasks = []
-    task_metadata = []  # Track which parameters each task represents
-
-    for symbol in symbols:
-        for delta in delta_targets:
-            for min_dte, max_dte, close_dte in dte_configs:
-                task = run_parameter_backtest(
-                    symbol=symbol,
-                    delta_target=delta,
-                    min_dte=min_dte,
-                    max_dte=max_dte,
-                    close_dte=close_dte,
-                    start_dt=start_dt,
-                    end_dt=end_dt,
-                    initial_capital=initial_capital,
-                )
-                tasks.append(task)
-                task_metadata.append({
-                    "symbol": symbol,
-                    "delta": delta,
-                    "dte": f"{min_dte}-{max_dte}-{close_dte}"
-                })
+    jobs = [
+        {
+            "symbol": symbol,
+            "delta_target": delta,
+            "min_dte": min_dte,
+            "max_dte": max_dte,
+            "close_dte": close_dte,
+            "start_dt": start_dt,
+            "end_dt": end_dt,
+            "initial_capital": initial_capital,
+            "base_config": base_config,
+        }
+        for symbol in symbols
+        for delta in delta_targets
+        for min_dte, max_dte, close_dte in dte_configs
+    ]
+
+    # Jobs of symbols without data are reported as errors instead of run
+    failed_results = [
+        error_result(job, load_errors[job["symbol"]])
+        for job in jobs
+        if job["symbol"] in load_errors
+    ]
+    jobs = [job for job in jobs if job["symbol"] in symbol_data]
+
+    # Backtests are CPU-bound Python (and their data loading is blocking), so
+    # they run in worker processes, one per core; spawned rather than forked
+    # so workers start from a clean interpreter. The loaded data is sent to
+    # each worker once, so jobs only carry their parameters
+    loop = asyncio.get_running_loop()
+    executor = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(symbol_data,),
+    )
+
+    async def run_job(job: Dict) -> Dict:
+        try:
+            return await loop.run_in_executor(executor, _run_parameter_backtest_proc, job)
+        except Exception as e:
+            console.print(
+                f"\n[red]Error in {job['symbol']} delta={job['delta_target']} "
+                f"dte={job['min_dte']}-{job['max_dte']}-{job['close_dte']}: {e}[/red]"
+            )
+            return error_result(job, str(e))
+
+    tasks = [run_job(job) for job in jobs]
 
     # Run all tasks concurrently with progress tracking
     console.print(f"[bold green]Running {len(tasks)} backtests in parallel...[/bold green]\n")
 
-    with Progress(
+    with executor, Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
@@ -293,24 +440,11 @@ async def main():
         )
 
         # Run all tasks concurrently
-        results = []
+        results = failed_results
         completed = 0
 
         for coro in asyncio.as_completed(tasks):
-            try:
-                result = await coro
-                results.append(result)
-            except Exception as e:
-                meta = task_metadata[completed]
-                console.print(f"\n[red]Error in {meta['symbol']} delta={meta['delta']} dte={meta['dte']}: {e}[/red]")
-                results.append({
-                    "symbol": meta["symbol"],
-                    "delta": meta["delta"],
-                    "min_dte": int(meta["dte"].split('-')[0]),
-                    "max_dte": int(meta["dte"].split('-')[1]),
-                    "close_dte": int(meta["dte"].split('-')[2]),
-                    "error": str(e)
-                })
+            results.append(await coro)
 
             completed += 1
             progress.update(
@@ -333,6 +467,35 @@ async def main():
     for symbol in all_results:
         all_results[symbol].sort(key=lambda r: (r["delta"], r["min_dte"]))
 
+    # One row per successful backtest (in display order), so best and baseline
+    # picks per symbol are grouped reductions instead of repeated list scans
+    summary = pd.DataFrame(
+        [
+            {
+                "symbol": r["symbol"],
+                "delta": r["delta"],
+                "min_dte": r["min_dte"],
+                "max_dte": r["max_dte"],
+                "sharpe": r["metrics"].sharpe_ratio,
+                "return_pct": r["metrics"].total_return_percent,
+            }
+            for symbol_results in all_results.values()
+            for r in symbol_results
+            if "error" not in r
+        ],
+        columns=["symbol", "delta", "min_dte", "max_dte", "sharpe", "return_pct"],
+    )
+    summary["is_baseline"] = (
+        (summary["delta"] == 0.20) & (summary["min_dte"] == 21) & (summary["max_dte"] == 45)
+    )
+
+    by_symbol = summary.groupby("symbol")
+    best = summary.loc[by_symbol["sharpe"].idxmax()].set_index("symbol")
+    best_return = summary.loc[by_symbol["return_pct"].idxmax()].set_index("symbol")
+    baseline = summary[summary["is_baseline"]].groupby("symbol").first()
+    best["baseline_sharpe"] = baseline["sharpe"]
+    best["improvement"] = (best["sharpe"] / best["baseline_sharpe"] - 1) * 100
+
     # Display results
     console.print("\n\n")
     console.print(Panel.fit(
@@ -344,25 +507,14 @@ async def main():
         console.print(f"\n[bold cyan]{symbol} Results:[/bold cyan]")
 
         # Create comparison table
-        table = Table(title=f"{symbol} Parameter Grid", box=box.ROUNDED)
-        table.add_column("Delta", justify="center", style="cyan", width=8)
-        table.add_column("DTE Range", justify="center", width=12)
-        table.add_column("Return", justify="right", width=10)
-        table.add_column("Sharpe", justify="right", width=8)
-        table.add_column("Win%", justify="right", width=8)
-        table.add_column("Trades", justify="right", width=8)
-        table.add_column("Max DD", justify="right", width=10)
+        table = results_table(f"{symbol} Parameter Grid", PARAM_COLUMNS)
 
         for result in results:
             if "error" in result:
-                table.add_row(
+                add_error_row(
+                    table,
                     f"{result['delta']:.2f}",
                     f"{result['min_dte']}-{result['max_dte']}",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
                 )
             else:
                 m = result["metrics"]
@@ -372,75 +524,49 @@ async def main():
                 delta_str = f"{result['delta']:.2f}"
                 dte_str = f"{result['min_dte']}-{result['max_dte']}"
                 if is_baseline:
-                    delta_str = f"[bold]{delta_str}*[/bold]"
-                    dte_str = f"[bold]{dte_str}*[/bold]"
-
-                # Color code returns
-                return_style = "green" if m.total_return_percent > 0 else "red"
-
-                table.add_row(
-                    delta_str,
-                    dte_str,
-                    f"[{return_style}]{m.total_return_percent:+.2f}%[/{return_style}]",
-                    f"{m.sharpe_ratio:.2f}",
-                    f"{m.win_rate:.1f}%",
-                    str(m.total_trades),
-                    f"{m.max_drawdown_percent:.2f}%",
-                )
+                    delta_str = Text(f"{delta_str}*", style="bold")
+                    dte_str = Text(f"{dte_str}*", style="bold")
+
+                table.add_row(delta_str, dte_str, *metric_cells(m))
 
         console.print(table)
 
         # Find best parameters
-        valid_results = [r for r in results if "error" not in r]
-        if valid_results:
+        if symbol in best.index:
             # Best by Sharpe ratio (primary metric)
-            best_sharpe = max(valid_results, key=lambda r: r["metrics"].sharpe_ratio)
+            best_sharpe = best.loc[symbol]
             console.print(f"\n[green]  ✓ Best Sharpe: delta={best_sharpe['delta']:.2f}, "
                          f"DTE {best_sharpe['min_dte']}-{best_sharpe['max_dte']} "
-                         f"(Sharpe {best_sharpe['metrics'].sharpe_ratio:.2f})[/green]")
+                         f"(Sharpe {best_sharpe['sharpe']:.2f})[/green]")
 
             # Best by total return
-            best_return = max(valid_results, key=lambda r: r["metrics"].total_return_percent)
-            console.print(f"[green]  ✓ Best Return: delta={best_return['delta']:.2f}, "
-                         f"DTE {best_return['min_dte']}-{best_return['max_dte']} "
-                         f"({best_return['metrics'].total_return_percent:+.2f}%)[/green]")
-
-            # Baseline comparison
-            baseline_result = next((r for r in valid_results
-                                  if r["delta"] == 0.20 and r["min_dte"] == 21 and r["max_dte"] == 45), None)
-            if baseline_result:
-                baseline_sharpe = baseline_result["metrics"].sharpe_ratio
-                if baseline_sharpe > 0 and best_sharpe != baseline_result:
-                    improvement = ((best_sharpe["metrics"].sharpe_ratio / baseline_sharpe) - 1) * 100
-                    console.print(f"\n[yellow]  → Improvement vs baseline: "
-                                 f"{improvement:+.1f}% Sharpe[/yellow]")
+            top_return = best_return.loc[symbol]
+            console.print(f"[green]  ✓ Best Return: delta={top_return['delta']:.2f}, "
+                         f"DTE {top_return['min_dte']}-{top_return['max_dte']} "
+                         f"({top_return['return_pct']:+.2f}%)[/green]")
+
+            # Baseline comparison (NaN baseline Sharpe when it is missing)
+            if best_sharpe["baseline_sharpe"] > 0 and not best_sharpe["is_baseline"]:
+                console.print(f"\n[yellow]  → Improvement vs baseline: "
+                             f"{best_sharpe['improvement']:+.1f}% Sharpe[/yellow]")
 
     # Summary recommendations
     console.print("\n\n[bold cyan]Recommendations:[/bold cyan]")
     console.print("[dim]* = Current baseline (delta=0.20, DTE 21-45-14)[/dim]\n")
 
-    for symbol, results in all_results.items():
-        valid_results = [r for r in results if "error" not in r]
-        if valid_results:
-            best = max(valid_results, key=lambda r: r["metrics"].sharpe_ratio)
-            baseline = next((r for r in valid_results
-                           if r["delta"] == 0.20 and r["min_dte"] == 21 and r["max_dte"] == 45), None)
-
-            if baseline:
-                baseline_sharpe = baseline["metrics"].sharpe_ratio
-                if baseline_sharpe > 0:
-                    sharpe_improvement = ((best["metrics"].sharpe_ratio / baseline_sharpe) - 1) * 100
-                    if sharpe_improvement > 5:  # More than 5% improvement
-                        console.print(
-                            f"[green]✓ {symbol}: Recommend delta={best['delta']:.2f}, "
-                            f"DTE {best['min_dte']}-{best['max_dte']} "
-                            f"(+{sharpe_improvement:.1f}% Sharpe improvement)[/green]"
-                        )
-                    else:
-                        console.print(
-                            f"[yellow]→ {symbol}: Baseline is near-optimal "
-                            f"(best improvement: {sharpe_improvement:+.1f}%)[/yellow]"
-                        )
+    for symbol, row in best[best["baseline_sharpe"] > 0].iterrows():
+        sharpe_improvement = row["improvement"]
+        if sharpe_improvement > 5:  # More than 5% improvement
+            console.print(
+                f"[green]✓ {symbol}: Recommend delta={row['delta']:.2f}, "
+                f"DTE {row['min_dte']}-{row['max_dte']} "
+                f"(+{sharpe_improvement:.1f}% Sharpe improvement)[/green]"
+            )
+        else:
+            console.print(
+                f"[yellow]→ {symbol}: Baseline is near-optimal "
+                f"(best improvement: {sharpe_improvement:+.1f}%)[/yellow]"
+            )
 
     console.print("\n[dim]Parameter grid search complete.[/dim]")
 
@@ -23,7 +23,7 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -33,12 +33,13 @@ from dotenv import load_dotenv
 load_dotenv(project_root / ".env")
 
 from rich.console import Console
-from rich.table import Table
+from rich.text import Text
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich import box
 import argparse
 
+from common import add_error_row, metric_cells, resolve_base_config, results_table
+
 console = Console()
 
 # Set INFO level for cleaner output
@@ -47,6 +48,12 @@ logging.basicConfig(
     format='%(levelname)-8s [%(name)s] %(message)s',
 )
 
+# Results table parameter columns: (header, justify, style, width)
+PARAM_COLUMNS = (
+    ("Profit Target", "center", "cyan", 13),
+    ("Stop Loss", "center", "", 10),
+)
+
 # Validated delta targets from walk-forward validation
 VALIDATED_DELTAS = {
     "SPY": 0.18,   # OOS Sharpe 10.73
@@ -56,6 +63,22 @@ VALIDATED_DELTAS = {
 }
 
 
+# Parameters held at their validated baseline while profit/loss is optimized
+BASELINE_PARAMS = {
+    "min_dte": 14,  # Grid search optimal
+    "max_dte": 30,  # Grid search optimal
+    "close_dte": 7,  # Grid search optimal
+    "spread_width": 5.0,
+    "min_iv_rank": 0,
+    "min_open_interest": 0,
+    "max_spread_percent": 15.0,
+    "min_return_on_risk": 0.08,
+    "rsi_oversold": 45.0,
+    "rsi_overbought": 55.0,
+    "min_credit": 15.0,
+}
+
+
 async def run_profit_loss_backtest(
     profit_target_pct: float,
     stop_loss_multiplier: float,
@@ -63,6 +86,7 @@ async def run_profit_loss_backtest(
     start_dt: datetime,
     end_dt: datetime,
     initial_capital: float = 10000.0,
+    base_config: Optional[Dict] = None,
 ) -> Dict:
     """Run backtest with specific profit/loss management parameters.
 
@@ -73,6 +97,7 @@ async def run_profit_loss_backtest(
         start_dt: Start date
         end_dt: End date
         initial_capital: Starting capital
+        base_config: Strategy config from resolve_base_config (resolved if None)
 
     Returns:
         Dict with results and metrics
@@ -99,8 +124,10 @@ async def run_profit_loss_backtest(
 
     dolthub_fetcher = DoltHubOptionsDataFetcher()
 
-    # Fetch underlying data from Alpaca
-    underlying_data = alpaca_fetcher.fetch_underlying_bars(
+    # Fetch underlying data from Alpaca (in a thread, so concurrent backtests
+    # keep running while this one waits on the network)
+    underlying_data = await asyncio.to_thread(
+        alpaca_fetcher.fetch_underlying_bars,
         symbol=symbol,
         start_date=start_dt,
         end_date=end_dt,
@@ -116,21 +143,19 @@ async def run_profit_loss_backtest(
         }
 
     # Add technical indicators
-    from alpaca_options.backtesting.data_loader import BacktestDataLoader
+    from alpaca_options.backtesting.data_loader import BacktestDataLoader, trading_days
     data_loader = BacktestDataLoader(settings.backtesting.data)
-    underlying_data = data_loader.add_technical_indicators(underlying_data)
+    underlying_data = await asyncio.to_thread(
+        data_loader.add_technical_indicators_cached,
+        underlying_data, symbol, start_dt, end_dt,
+    )
 
     # Fetch options chains from DoltHub
-    options_data = {}
-    daily_timestamps = underlying_data.resample('1D').last().dropna(subset=['close']).index
-
-    for timestamp in daily_timestamps:
-        chain = dolthub_fetcher.fetch_option_chain(
-            underlying=symbol,
-            as_of_date=timestamp,
-        )
-        if chain:
-            options_data[timestamp] = chain
+    daily_timestamps = trading_days(underlying_data)
+    options_data = await dolthub_fetcher.fetch_option_chains_async(
+        underlying=symbol,
+        as_of_dates=list(daily_timestamps),
+    )
 
     if not options_data:
         return {
@@ -143,37 +168,22 @@ async def run_profit_loss_backtest(
     # Create strategy instance
     strategy = VerticalSpreadStrategy()
 
-    # Configure strategy with validated parameters
-    strat_config = settings.strategies.get("vertical_spread")
-    if strat_config:
-        strategy._config = strat_config.config.copy()
-    else:
-        strategy._config = {}
-
-    strategy._config["underlyings"] = [symbol]
-
-    # Use VALIDATED parameters from previous optimizations
-    strategy._config["delta_target"] = VALIDATED_DELTAS[symbol]
-    strategy._config["min_dte"] = 14  # Grid search optimal
-    strategy._config["max_dte"] = 30  # Grid search optimal
-    strategy._config["close_dte"] = 7  # Grid search optimal
-
-    # Set PROFIT/LOSS MANAGEMENT parameters (optimization targets)
-    strategy._config["profit_target_pct"] = profit_target_pct
-    strategy._config["stop_loss_multiplier"] = stop_loss_multiplier
-
-    # Keep other parameters at validated baseline
-    strategy._config["spread_width"] = 5.0
-    strategy._config["min_iv_rank"] = 0
-    strategy._config["min_open_interest"] = 0
-    strategy._config["max_spread_percent"] = 15.0
-    strategy._config["min_return_on_risk"] = 0.08
-    strategy._config["rsi_oversold"] = 45.0
-    strategy._config["rsi_overbought"] = 55.0
-    strategy._config["min_credit"] = 15.0
+    # Configure strategy with validated parameters on top of the shared base
+    if base_config is None:
+        base_config = resolve_base_config(settings, BASELINE_PARAMS)
+
+    config = {
+        **base_config,
+        "underlyings": [symbol],
+        # Use VALIDATED delta from previous optimizations
+        "delta_target": VALIDATED_DELTAS[symbol],
+        # Set PROFIT/LOSS MANAGEMENT parameters (optimization targets)
+        "profit_target_pct": profit_target_pct,
+        "stop_loss_multiplier": stop_loss_multiplier,
+    }
 
     # Initialize strategy
-    await strategy.initialize(strategy._config)
+    await strategy.initialize(config)
 
     # Create backtest engine
     engine = BacktestEngine(settings.backtesting, settings.risk)
@@ -243,6 +253,7 @@ async def main():
         console.print("[dim]Full mode: Testing 2019-2024 (~6 years)[/dim]\n")
 
     initial_capital = 10000.0
+    max_concurrent_backtests = 4
 
     console.print(f"[dim]Symbols: {', '.join(symbols)}[/dim]")
     console.print(f"[dim]Period: {start_dt.date()} to {end_dt.date()}[/dim]")
@@ -257,31 +268,26 @@ async def main():
         console.print("[yellow]Set ALPACA_API_KEY and ALPACA_SECRET_KEY environment variables[/yellow]")
         return
 
-    # Create all backtest tasks upfront (PARALLEL EXECUTION)
+    from alpaca_options.core.config import load_config
+
+    # Strategy config shared by every job; each adds only what it varies
+    base_config = resolve_base_config(load_config(), BASELINE_PARAMS)
+
+    # Create all backtest jobs upfront (PARALLEL EXECUTION)
     console.print("[cyan]Creating backtest tasks...[/cyan]")
-    tasks = []
-    task_metadata = []
-
-    for symbol in symbols:
-        for profit_target in profit_targets:
-            for stop_loss in stop_losses:
-                task = run_profit_loss_backtest(
-                    profit_target_pct=profit_target,
-                    stop_loss_multiplier=stop_loss,
-                    symbol=symbol,
-                    start_dt=start_dt,
-                    end_dt=end_dt,
-                    initial_capital=initial_capital,
-                )
-                tasks.append(task)
-                task_metadata.append({
-                    "symbol": symbol,
-                    "profit_target": profit_target,
-                    "stop_loss": stop_loss
-                })
+    jobs = [
+        (symbol, profit_target, stop_loss)
+        for symbol in symbols
+        for profit_target in profit_targets
+        for stop_loss in stop_losses
+    ]
+
+    # Bound how many backtests load data at once; their network waits overlap
+    # on the event loop
+    semaphore = asyncio.Semaphore(max_concurrent_backtests)
 
     # Run all tasks concurrently with progress tracking
-    console.print(f"[bold green]Running {len(tasks)} backtests in parallel...[/bold green]\n")
+    console.print(f"[bold green]Running {len(jobs)} backtests in parallel...[/bold green]\n")
 
     with Progress(
         SpinnerColumn(),
@@ -292,41 +298,50 @@ async def main():
     ) as progress:
         task_progress = progress.add_task(
             "[cyan]Running parallel backtests...",
-            total=len(tasks)
+            total=len(jobs)
         )
 
-        # Run all tasks concurrently
-        results = []
         completed = 0
 
-        for coro in asyncio.as_completed(tasks):
-            try:
-                result = await coro
-                results.append(result)
-            except Exception as e:
-                meta = task_metadata[completed]
-                console.print(
-                    f"\n[red]Error in {meta['symbol']} "
-                    f"profit={meta['profit_target']:.2f} "
-                    f"stop={meta['stop_loss']:.1f}: {e}[/red]"
-                )
-                results.append({
-                    "symbol": meta["symbol"],
-                    "profit_target": meta["profit_target"],
-                    "stop_loss": meta["stop_loss"],
-                    "error": str(e)
-                })
+        async def run_job(symbol: str, profit_target: float, stop_loss: float) -> Dict:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    result = await run_profit_loss_backtest(
+                        profit_target_pct=profit_target,
+                        stop_loss_multiplier=stop_loss,
+                        symbol=symbol,
+                        start_dt=start_dt,
+                        end_dt=end_dt,
+                        initial_capital=initial_capital,
+                        base_config=base_config,
+                    )
+                except Exception as e:
+                    console.print(
+                        f"\n[red]Error in {symbol} "
+                        f"profit={profit_target:.2f} "
+                        f"stop={stop_loss:.1f}: {e}[/red]"
+                    )
+                    result = {
+                        "symbol": symbol,
+                        "profit_target": profit_target,
+                        "stop_loss": stop_loss,
+                        "error": str(e)
+                    }
 
             completed += 1
             progress.update(
                 task_progress,
                 advance=1,
-                description=f"[cyan]Completed {completed}/{len(tasks)} backtests..."
+                description=f"[cyan]Completed {completed}/{len(jobs)} backtests..."
             )
+            return result
+
+        results = await asyncio.gather(*[run_job(*job) for job in jobs])
 
         progress.update(
             task_progress,
-            description=f"[green]✓ All {len(tasks)} backtests complete!"
+            description=f"[green]✓ All {len(jobs)} backtests complete!"
         )
 
     # Organize results by symbol
@@ -355,28 +370,14 @@ async def main():
         console.print(f"[dim]Using validated delta: {VALIDATED_DELTAS[symbol]:.2f}[/dim]\n")
 
         # Create comparison table
-        table = Table(
-            title=f"{symbol} Profit/Loss Optimization",
-            box=box.ROUNDED
-        )
-        table.add_column("Profit Target", justify="center", style="cyan", width=13)
-        table.add_column("Stop Loss", justify="center", width=10)
-        table.add_column("Total Return", justify="right", width=12)
-        table.add_column("Sharpe", justify="right", width=8)
-        table.add_column("Win Rate", justify="right", width=10)
-        table.add_column("Trades", justify="right", width=8)
-        table.add_column("Max DD", justify="right", width=10)
+        table = results_table(f"{symbol} Profit/Loss Optimization", PARAM_COLUMNS)
 
         for result in results:
             if "error" in result:
-                table.add_row(
+                add_error_row(
+                    table,
                     f"{result['profit_target']:.0%}",
                     f"{result['stop_loss']:.1f}x",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
-                    "[red]ERROR[/red]",
                 )
             else:
                 m = result["metrics"]
@@ -389,21 +390,10 @@ async def main():
                 profit_str = f"{result['profit_target']:.0%}"
                 stop_str = f"{result['stop_loss']:.1f}x"
                 if baseline:
-                    profit_str = f"[bold]{profit_str}*[/bold]"
-                    stop_str = f"[bold]{stop_str}*[/bold]"
-
-                # Color code returns
-                return_style = "green" if m.total_return_percent > 0 else "red"
-
-                table.add_row(
-                    profit_str,
-                    stop_str,
-                    f"[{return_style}]{m.total_return_percent:+.2f}%[/{return_style}]",
-                    f"{m.sharpe_ratio:.2f}",
-                    f"{m.win_rate:.1f}%",
-                    str(m.total_trades),
-                    f"{m.max_drawdown_percent:.2f}%",
-                )
+                    profit_str = Text(f"{profit_str}*", style="bold")
+                    stop_str = Text(f"{stop_str}*", style="bold")
+
+                table.add_row(profit_str, stop_str, *metric_cells(m))
 
         console.print(table)
 
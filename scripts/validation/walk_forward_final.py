@@ -75,6 +75,9 @@ async def test_window(
 ) -> Dict:
     """Test optimized parameters on out-of-sample window.
 
+    Each window is an independent test with its own strategy, engine and
+    starting capital, so no positions or equity carry over between years.
+
     Args:
         symbol: Stock symbol
         window_num: Window number (1-4)
@@ -90,7 +93,7 @@ async def test_window(
     from alpaca_options.backtesting.dolthub_options_fetcher import DoltHubOptionsDataFetcher
     from alpaca_options.core.config import load_config
     from alpaca_options.strategies import VerticalSpreadStrategy
-    from alpaca_options.backtesting.data_loader import BacktestDataLoader
+    from alpaca_options.backtesting.data_loader import BacktestDataLoader, trading_days
 
     try:
         # Load configuration
@@ -124,19 +127,16 @@ async def test_window(
             }
 
         data_loader = BacktestDataLoader(settings.backtesting.data)
-        test_underlying = data_loader.add_technical_indicators(test_underlying)
+        test_underlying = data_loader.add_technical_indicators_cached(
+            test_underlying, symbol, test_start, test_end
+        )
 
         # Fetch test options chains
-        test_options = {}
-        test_timestamps = test_underlying.resample('1D').last().dropna(subset=['close']).index
-
-        for timestamp in test_timestamps:
-            chain = dolthub_fetcher.fetch_option_chain(
-                underlying=symbol,
-                as_of_date=timestamp,
-            )
-            if chain:
-                test_options[timestamp] = chain
+        test_timestamps = trading_days(test_underlying)
+        test_options = await dolthub_fetcher.fetch_option_chains_async(
+            underlying=symbol,
+            as_of_dates=list(test_timestamps),
+        )
 
         if not test_options:
             return {
@@ -8,7 +8,7 @@ This module provides:
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 import json
@@ -94,21 +94,9 @@ class AlpacaOptionsDataFetcher:
         Returns:
             DataFrame with OHLCV data.
         """
-        cache_file = self._cache_dir / f"{symbol}_bars_{start_date.date()}_{end_date.date()}_{timeframe}.parquet"
-
-        # Check cache
-        if cache_file.exists():
-            logger.info(f"Loading cached bars from {cache_file}")
-            df = pd.read_parquet(cache_file)
-            return df
-
-        # Map timeframe string to TimeFrame enum
-        tf_map = {
-            "1Min": TimeFrame.Minute,
-            "1Hour": TimeFrame.Hour,
-            "1Day": TimeFrame.Day,
-        }
-        tf = tf_map.get(timeframe, TimeFrame.Hour)
+        cached = self._load_cached_bars(symbol, start_date, end_date, timeframe)
+        if cached is not None:
+            return cached
 
         logger.info(f"Fetching {symbol} bars from Alpaca ({start_date.date()} to {end_date.date()})")
 
@@ -116,39 +104,186 @@ class AlpacaOptionsDataFetcher:
             symbol_or_symbols=symbol,
             start=start_date,
             end=end_date,
-            timeframe=tf,
+            timeframe=self._timeframe(timeframe),
         )
 
         bars = self._stock_client.get_stock_bars(request)
 
         # Convert to DataFrame
         if symbol in bars.data:
-            bar_list = bars.data[symbol]
-            records = []
-            for bar in bar_list:
-                records.append({
-                    "timestamp": bar.timestamp,
-                    "open": float(bar.open),
-                    "high": float(bar.high),
-                    "low": float(bar.low),
-                    "close": float(bar.close),
-                    "volume": int(bar.volume),
-                })
+            df = self._bars_to_frame(bars.data[symbol])
+            self._cache_bars(df, symbol, start_date, end_date, timeframe)
+            return df
 
-            df = pd.DataFrame(records)
-            df.set_index("timestamp", inplace=True)
+        return pd.DataFrame()
 
-            # Make timezone-naive
-            if df.index.tz is not None:
-                df.index = df.index.tz_localize(None)
+    def fetch_underlying_bars_multi(
+        self,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        timeframe: str = "1Hour",
+    ) -> dict[str, pd.DataFrame]:
+        """Fetch historical bars for several underlyings in one request.
+
+        Symbols with cached bars are served from the cache; the rest share a
+        single multi-symbol bars request instead of one round trip each. Each
+        symbol's bars are cached like ``fetch_underlying_bars`` would.
+
+        Args:
+            symbols: Stock symbols (e.g., ['SPY', 'QQQ']).
+            start_date: Start date.
+            end_date: End date.
+            timeframe: Bar timeframe ('1Min', '1Hour', '1Day').
+
+        Returns:
+            Dict mapping each symbol to its OHLCV DataFrame (empty if no data).
+        """
+        frames: dict[str, pd.DataFrame] = {}
+        missing = []
+
+        for symbol in symbols:
+            cached = self._load_cached_bars(symbol, start_date, end_date, timeframe)
+            if cached is not None:
+                frames[symbol] = cached
+            else:
+                missing.append(symbol)
+
+        if missing:
+            logger.info(
+                f"Fetching {', '.join(missing)} bars from Alpaca "
+                f"({start_date.date()} to {end_date.date()})"
+            )
+
+            request = StockBarsRequest(
+                symbol_or_symbols=missing,
+                start=start_date,
+                end=end_date,
+                timeframe=self._timeframe(timeframe),
+            )
+
+            bars = self._stock_client.get_stock_bars(request)
+
+            for symbol in missing:
+                if symbol in bars.data:
+                    df = self._bars_to_frame(bars.data[symbol])
+                    self._cache_bars(df, symbol, start_date, end_date, timeframe)
+                    frames[symbol] = df
+
+        return {symbol: frames.get(symbol, pd.DataFrame()) for symbol in symbols}
 
-            # Cache the data
+    @staticmethod
+    def _timeframe(timeframe: str) -> TimeFrame:
+        """Map a timeframe string to the Alpaca TimeFrame (hourly by default)."""
+        tf_map = {
+            "1Min": TimeFrame.Minute,
+            "1Hour": TimeFrame.Hour,
+            "1Day": TimeFrame.Day,
+        }
+        return tf_map.get(timeframe, TimeFrame.Hour)
+
+    @staticmethod
+    def _bars_to_frame(bar_list: list) -> pd.DataFrame:
+        """Convert Alpaca bars to a timezone-naive OHLCV DataFrame."""
+        records = []
+        for bar in bar_list:
+            records.append({
+                "timestamp": bar.timestamp,
+                "open": float(bar.open),
+                "high": float(bar.high),
+                "low": float(bar.low),
+                "close": float(bar.close),
+                "volume": int(bar.volume),
+            })
+
+        df = pd.DataFrame(records)
+        df.set_index("timestamp", inplace=True)
+
+        # Make timezone-naive
+        if df.index.tz is not None:
+            df.index = df.index.tz_localize(None)
+
+        return df
+
+    def _load_cached_bars(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        timeframe: str,
+    ) -> Optional[pd.DataFrame]:
+        """Load bars from an exact cache match or a cached run covering a wider range."""
+        cached_file = self._find_cached_bars(symbol, start_date, end_date, timeframe)
+        if cached_file is None:
+            return None
+
+        logger.info(f"Loading cached bars from {cached_file}")
+        df = pd.read_parquet(cached_file)
+        if cached_file != self._bars_cache_file(
+            symbol, start_date.date(), end_date.date(), timeframe
+        ):
+            df = df.loc[start_date.replace(tzinfo=None):end_date.replace(tzinfo=None)]
+        return df
+
+    def _cache_bars(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        timeframe: str,
+    ) -> None:
+        """Cache a symbol's bars as Parquet (skipped without a Parquet engine)."""
+        cache_file = self._bars_cache_file(symbol, start_date.date(), end_date.date(), timeframe)
+        try:
             df.to_parquet(cache_file)
             logger.info(f"Cached {len(df)} bars to {cache_file}")
+        except ImportError:
+            logger.debug("No Parquet engine installed, bars cache disabled")
 
-            return df
+    def _bars_cache_file(self, symbol: str, start: date, end: date, timeframe: str) -> Path:
+        """Get the cache file path for a symbol's bars over a date range."""
+        return self._cache_dir / f"{symbol}_bars_{start}_{end}_{timeframe}.parquet"
 
-        return pd.DataFrame()
+    def _find_cached_bars(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        timeframe: str,
+    ) -> Optional[Path]:
+        """Find a cached bars file that covers the requested range.
+
+        A file fetched up to ``end`` may miss bars later on that day, so a
+        wider file must end strictly after the requested end date.
+
+        Args:
+            symbol: Stock symbol.
+            start_date: Start date.
+            end_date: End date.
+            timeframe: Bar timeframe.
+
+        Returns:
+            Path of the covering cache file, or None.
+        """
+        exact = self._bars_cache_file(symbol, start_date.date(), end_date.date(), timeframe)
+        if exact.exists():
+            return exact
+
+        prefix = f"{symbol}_bars_"
+        suffix = f"_{timeframe}"
+        for path in self._cache_dir.glob(f"{prefix}*{suffix}.parquet"):
+            try:
+                start_str, end_str = path.stem[len(prefix):-len(suffix)].split("_")
+                cached_start = date.fromisoformat(start_str)
+                cached_end = date.fromisoformat(end_str)
+            except ValueError:
+                continue
+
+            if cached_start <= start_date.date() and cached_end > end_date.date():
+                return path
+
+        return None
 
     def fetch_option_chain(
         self,
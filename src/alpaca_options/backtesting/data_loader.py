@@ -12,7 +12,7 @@ import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 import pandas as pd
@@ -20,11 +20,45 @@ import pandas as pd
 from alpaca_options.core.config import BacktestDataConfig
 from alpaca_options.strategies.base import OptionChain, OptionContract
 
+if TYPE_CHECKING:
+    from alpaca_options.backtesting.alpaca_options_fetcher import AlpacaOptionsDataFetcher
+
 logger = logging.getLogger(__name__)
 
 # Alpaca options data availability
 ALPACA_OPTIONS_DATA_START = datetime(2024, 2, 1)
 
+# Columns added by BacktestDataLoader.add_technical_indicators
+INDICATOR_COLUMNS = (
+    "sma_20",
+    "sma_50",
+    "rsi_14",
+    "atr_14",
+    "hv_20",
+    "iv_rank",
+)
+
+# Bump when an indicator formula changes so cached indicator files are recomputed
+INDICATOR_CACHE_VERSION = 1
+
+# Bar columns the indicator cache is validated against
+_BAR_HASH_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def trading_days(bars: pd.DataFrame) -> pd.DatetimeIndex:
+    """Get the midnight timestamp of every day that has a close price.
+
+    Equivalent to ``bars.resample("1D").last().dropna(subset=["close"]).index``
+    without materializing a resampled copy of every column.
+
+    Args:
+        bars: Intraday bars indexed by timestamp.
+
+    Returns:
+        Sorted, normalized timestamps, one per trading day.
+    """
+    return bars.index[bars["close"].notna()].normalize().unique()
+
 
 class BacktestDataLoader:
     """Loads and manages historical data for backtesting.
@@ -51,7 +85,21 @@ class BacktestDataLoader:
         # Alpaca credentials for real data
         self._api_key = api_key or os.environ.get("ALPACA_API_KEY", "")
         self._api_secret = api_secret or os.environ.get("ALPACA_SECRET_KEY", "")
+
+        # The Alpaca fetcher (and its HTTP clients) is only created when data
+        # is first loaded; loaders used just for indicators never build it
         self._alpaca_fetcher = None
+        self._alpaca_fetcher_initialized = False
+
+    def _get_alpaca_fetcher(self) -> Optional["AlpacaOptionsDataFetcher"]:
+        """Get the Alpaca fetcher, initializing it on first use.
+
+        Returns:
+            AlpacaOptionsDataFetcher, or None without credentials or on failure.
+        """
+        if self._alpaca_fetcher_initialized:
+            return self._alpaca_fetcher
+        self._alpaca_fetcher_initialized = True
 
         # Try to initialize Alpaca fetcher if credentials available
         if self._api_key and self._api_secret:
@@ -68,6 +116,8 @@ class BacktestDataLoader:
             except Exception as e:
                 logger.warning(f"Could not initialize Alpaca fetcher: {e}")
 
+        return self._alpaca_fetcher
+
     def load_underlying_data(
         self,
         symbol: str,
@@ -90,12 +140,13 @@ class BacktestDataLoader:
             DataFrame with OHLCV data indexed by datetime.
         """
         # Try Alpaca first if available
-        if self._alpaca_fetcher:
+        alpaca_fetcher = self._get_alpaca_fetcher()
+        if alpaca_fetcher:
             try:
                 tf_map = {"1h": "1Hour", "1d": "1Day", "1m": "1Min"}
                 alpaca_tf = tf_map.get(timeframe.lower(), "1Hour")
 
-                df = self._alpaca_fetcher.fetch_underlying_bars(
+                df = alpaca_fetcher.fetch_underlying_bars(
                     symbol=symbol,
                     start_date=start_date,
                     end_date=end_date,
@@ -218,37 +269,113 @@ class BacktestDataLoader:
         Returns:
             DataFrame with added technical indicators.
         """
-        df = df.copy()
-
-        # Simple Moving Averages
-        df["sma_20"] = df["close"].rolling(window=20).mean()
-        df["sma_50"] = df["close"].rolling(window=50).mean()
+        # Indicators only read close/high/low; they are computed from those
+        # columns and attached in one assign instead of copying the frame and
+        # inserting columns one by one
+        close = df["close"]
+        high = df["high"]
+        low = df["low"]
 
         # RSI
-        delta = df["close"].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+        delta = close.diff()
+        gain = np.fmax(delta, 0.0).rolling(window=14).mean()
+        loss = np.fmax(-delta, 0.0).rolling(window=14).mean()
         rs = gain / loss
-        df["rsi_14"] = 100 - (100 / (1 + rs))
 
         # ATR
-        high_low = df["high"] - df["low"]
-        high_close = (df["high"] - df["close"].shift()).abs()
-        low_close = (df["low"] - df["close"].shift()).abs()
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        df["atr_14"] = tr.rolling(window=14).mean()
+        prev_close = close.shift()
+        tr = np.fmax(np.fmax(high - low, (high - prev_close).abs()), (low - prev_close).abs())
 
         # Historical Volatility (20-day)
-        df["hv_20"] = df["close"].pct_change().rolling(window=20).std() * np.sqrt(252)
+        hv_20 = close.pct_change().rolling(window=20).std() * np.sqrt(252)
 
         # IV Rank (simulated based on HV)
-        hv_min = df["hv_20"].rolling(window=252).min()
-        hv_max = df["hv_20"].rolling(window=252).max()
-        df["iv_rank"] = ((df["hv_20"] - hv_min) / (hv_max - hv_min)) * 100
+        hv_min = hv_20.rolling(window=252).min()
+        hv_max = hv_20.rolling(window=252).max()
+
+        return df.assign(
+            sma_20=close.rolling(window=20).mean(),
+            sma_50=close.rolling(window=50).mean(),
+            rsi_14=100 - (100 / (1 + rs)),
+            atr_14=tr.rolling(window=14).mean(),
+            hv_20=hv_20,
+            iv_rank=((hv_20 - hv_min) / (hv_max - hv_min)) * 100,
+        )
+
+    def add_technical_indicators_cached(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        timeframe: str = "1Hour",
+    ) -> pd.DataFrame:
+        """Add technical indicators, reusing a Parquet cache of the indicators.
+
+        The cache is keyed by (symbol, start, end, timeframe) and
+        ``INDICATOR_CACHE_VERSION``. It stores the ``INDICATOR_COLUMNS`` plus
+        a per-row hash of the OHLCV values, and is only reused when its index
+        and hashes match the bars passed in, so revised bars are recomputed.
+        Cached indicators are attached to ``df``; its own columns are kept.
+
+        Args:
+            df: DataFrame with OHLCV data.
+            symbol: The stock symbol.
+            start_date: Start date of the bars.
+            end_date: End date of the bars.
+            timeframe: Bar timeframe.
 
-        return df
+        Returns:
+            DataFrame with added technical indicators.
+        """
+        if not self._config.cache_enabled:
+            return self.add_technical_indicators(df)
+
+        cache_file = (
+            self._cache_dir
+            / "bars"
+            / (
+                f"{symbol}_{start_date.date()}_{end_date.date()}_{timeframe}"
+                f"_indicators_v{INDICATOR_CACHE_VERSION}.parquet"
+            )
+        )
+        bars_hash = self._bars_hash(df)
+
+        if cache_file.exists():
+            cached = pd.read_parquet(cache_file)
+            if (
+                cached.index.equals(df.index)
+                and set(INDICATOR_COLUMNS).issubset(cached.columns)
+                and "bars_hash" in cached.columns
+                and np.array_equal(cached["bars_hash"].to_numpy(), bars_hash)
+            ):
+                logger.info(f"Loaded cached indicators from {cache_file}")
+                return df.assign(**{col: cached[col] for col in INDICATOR_COLUMNS})
+
+        enriched = self.add_technical_indicators(df)
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            enriched[list(INDICATOR_COLUMNS)].assign(bars_hash=bars_hash).to_parquet(cache_file)
+        except ImportError:
+            logger.debug("No Parquet engine installed, indicator cache disabled")
+
+        return enriched
+
+    @staticmethod
+    def _bars_hash(df: pd.DataFrame) -> np.ndarray:
+        """Hash each bar's OHLCV values to detect revised bars.
+
+        Args:
+            df: DataFrame with OHLCV data.
+
+        Returns:
+            One uint64 hash per row.
+        """
+        columns = [col for col in _BAR_HASH_COLUMNS if col in df.columns]
+        return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
 
     @property
     def has_alpaca_credentials(self) -> bool:
         """Check if Alpaca credentials are available."""
-        return self._alpaca_fetcher is not None
+        return self._get_alpaca_fetcher() is not None
@@ -3,7 +3,7 @@
 This module provides:
 - Fetching real historical options data from DoltHub free database
 - Converting DoltHub data to internal OptionChain format
-- Caching to minimize queries
+- Caching to minimize queries (partitioned Parquet per symbol/date)
 - Support for 2019-2024 options data (2,098 symbols)
 
 DoltHub Database: post-no-preference/options
@@ -11,11 +11,15 @@ Coverage: 2019-01-01 to 2024-12-31, 2,098 symbols
 Source: https://www.dolthub.com/repositories/post-no-preference/options
 """
 
+import asyncio
 import logging
 import subprocess
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Iterator, Optional, Dict, List, Tuple
 import json
 
 import pandas as pd
@@ -30,6 +34,115 @@ DOLTHUB_REPO = "post-no-preference/options"
 DOLTHUB_DATA_START = datetime(2019, 1, 1)
 DOLTHUB_DATA_END = datetime(2024, 12, 31)
 
+# How long cached available-date lookups are reused before DoltHub is queried again
+AVAILABLE_DATES_TTL = timedelta(hours=24)
+
+# Columns selected for option chain queries
+CHAIN_COLUMNS = (
+    "date, act_symbol, expiration, strike, call_put, "
+    "bid, ask, vol, delta, gamma, theta, vega, rho"
+)
+
+
+def _chain_filter(
+    min_dte: Optional[int],
+    max_dte: Optional[int],
+    delta_range: Optional[Tuple[float, float]],
+) -> Tuple[str, str]:
+    """Build the SQL predicate and cache-key suffix for a filtered chain query.
+
+    Args:
+        min_dte: Minimum days to expiration (inclusive).
+        max_dte: Maximum days to expiration (inclusive).
+        delta_range: Inclusive (min, max) range for absolute delta.
+
+    Returns:
+        Tuple of (SQL clauses to append to the WHERE, cache-key suffix).
+    """
+    clauses = []
+    suffix = ""
+
+    if min_dte is not None:
+        clauses.append(f"AND DATEDIFF(expiration, date) >= {int(min_dte)}")
+    if max_dte is not None:
+        clauses.append(f"AND DATEDIFF(expiration, date) <= {int(max_dte)}")
+    if min_dte is not None or max_dte is not None:
+        lower = "" if min_dte is None else int(min_dte)
+        upper = "" if max_dte is None else int(max_dte)
+        suffix += f"_dte{lower}-{upper}"
+
+    if delta_range is not None:
+        min_delta, max_delta = delta_range
+        clauses.append(f"AND ABS(delta) BETWEEN {float(min_delta)} AND {float(max_delta)}")
+        suffix += f"_delta{float(min_delta)}-{float(max_delta)}"
+
+    return " ".join(clauses), suffix
+
+
+class CachedOptionChains(Mapping):
+    """Read-only date -> OptionChain mapping backed by the fetcher's chain cache.
+
+    Only the dates are held; chains are read from the on-disk cache when
+    accessed, with the most recently used ``max_loaded`` kept in memory. A
+    backtest walking dates in order therefore holds a handful of chains
+    instead of every chain for the period.
+    """
+
+    def __init__(
+        self,
+        fetcher: "DoltHubOptionsDataFetcher",
+        underlying: str,
+        dates: List[datetime],
+        cache_suffix: str = "",
+        max_loaded: int = 4,
+    ) -> None:
+        """Initialize the mapping.
+
+        Args:
+            fetcher: Fetcher whose cache holds the chains.
+            underlying: Underlying symbol.
+            dates: Dates with a cached chain, in iteration order.
+            cache_suffix: Cache-key suffix identifying a filtered chain.
+            max_loaded: Number of chains kept in memory.
+        """
+        self._fetcher = fetcher
+        self._underlying = underlying
+        self._dates = dict.fromkeys(dates)
+        self._cache_suffix = cache_suffix
+        self._max_loaded = max_loaded
+        self._loaded: OrderedDict[datetime, OptionChain] = OrderedDict()
+
+    def __getstate__(self) -> dict:
+        # Pickle (e.g. for a worker process) without the loaded chains
+        return {**self.__dict__, "_loaded": OrderedDict()}
+
+    def __getitem__(self, as_of_date: datetime) -> OptionChain:
+        if as_of_date not in self._dates:
+            raise KeyError(as_of_date)
+
+        chain = self._loaded.get(as_of_date)
+        if chain is not None:
+            self._loaded.move_to_end(as_of_date)
+            return chain
+
+        chain = self._fetcher._load_cached_chain(
+            self._underlying, as_of_date, self._cache_suffix
+        )
+        if chain is None:
+            logger.warning(f"Cached chain for {self._underlying} on {as_of_date} is missing")
+            raise KeyError(as_of_date)
+
+        self._loaded[as_of_date] = chain
+        if len(self._loaded) > self._max_loaded:
+            self._loaded.popitem(last=False)
+        return chain
+
+    def __iter__(self) -> Iterator[datetime]:
+        return iter(self._dates)
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
 
 class DoltHubOptionsDataFetcher:
     """Fetches historical options data from DoltHub free database.
@@ -49,16 +162,21 @@ class DoltHubOptionsDataFetcher:
         self,
         dolt_dir: Optional[Path] = None,
         cache_dir: Optional[Path] = None,
+        max_concurrent_queries: int = 4,
     ) -> None:
         """Initialize the fetcher.
 
         Args:
             dolt_dir: Directory where DoltHub repo is cloned.
             cache_dir: Directory for caching data.
+            max_concurrent_queries: Maximum dolt processes running at once
+                across all threads using this fetcher.
         """
         self._dolt_dir = dolt_dir or Path("./data/dolthub/options")
         self._cache_dir = cache_dir or Path("./data/dolthub_cache")
         self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._max_concurrent_queries = max_concurrent_queries
+        self._query_slots = threading.BoundedSemaphore(max_concurrent_queries)
 
         # Check if Dolt is installed
         if not self._check_dolt_installed():
@@ -74,6 +192,16 @@ class DoltHubOptionsDataFetcher:
 
         logger.info("DoltHubOptionsDataFetcher initialized")
 
+    def __getstate__(self) -> dict:
+        # Semaphores can't be pickled; an unpickled copy gets its own query slots
+        state = self.__dict__.copy()
+        del state["_query_slots"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._query_slots = threading.BoundedSemaphore(self._max_concurrent_queries)
+
     def _check_dolt_installed(self) -> bool:
         """Check if Dolt CLI is installed."""
         try:
@@ -113,14 +241,17 @@ class DoltHubOptionsDataFetcher:
             DataFrame with query results.
         """
         try:
-            result = subprocess.run(
-                ["dolt", "sql", "-q", query, "-r", "csv"],
-                cwd=self._dolt_dir,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=60,
-            )
+            # Shared across threads so concurrent chain fetches (possibly for
+            # several symbols) never oversubscribe the local dolt server
+            with self._query_slots:
+                result = subprocess.run(
+                    ["dolt", "sql", "-q", query, "-r", "csv"],
+                    cwd=self._dolt_dir,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    timeout=60,
+                )
 
             # Parse CSV output
             from io import StringIO
@@ -162,25 +293,32 @@ class DoltHubOptionsDataFetcher:
         self,
         underlying: str,
         as_of_date: datetime,
+        min_dte: Optional[int] = None,
+        max_dte: Optional[int] = None,
+        delta_range: Optional[Tuple[float, float]] = None,
     ) -> Optional[OptionChain]:
         """Fetch historical option chain for a specific date.
 
+        The optional filters are pushed into the SQL query so only
+        trading-relevant rows are read; filtered chains are cached
+        separately from full chains.
+
         Args:
             underlying: Underlying symbol (e.g., 'QQQ').
             as_of_date: Date to fetch chain for.
+            min_dte: Minimum days to expiration (inclusive).
+            max_dte: Maximum days to expiration (inclusive).
+            delta_range: Inclusive (min, max) range for absolute delta.
 
         Returns:
             OptionChain with contracts, or None if no data.
         """
-        # Check cache first
-        cache_key = f"{underlying}_{as_of_date.date()}"
-        cache_file = self._cache_dir / f"{cache_key}_chain.json"
+        filter_sql, cache_suffix = _chain_filter(min_dte, max_dte, delta_range)
 
-        if cache_file.exists():
-            logger.debug(f"Loading cached chain: {cache_key}")
-            with open(cache_file, "r") as f:
-                data = json.load(f)
-                return self._json_to_option_chain(data)
+        # Check cache first
+        cached = self._load_cached_chain(underlying, as_of_date, cache_suffix)
+        if cached is not None:
+            return cached
 
         # Check if date is in DoltHub range
         if as_of_date < DOLTHUB_DATA_START or as_of_date > DOLTHUB_DATA_END:
@@ -198,23 +336,11 @@ class DoltHubOptionsDataFetcher:
         #                 delta, gamma, theta, vega, rho
         # Note: No last, volume, open_interest in this database
         query = f"""
-        SELECT
-            date,
-            act_symbol,
-            expiration,
-            strike,
-            call_put,
-            bid,
-            ask,
-            vol,
-            delta,
-            gamma,
-            theta,
-            vega,
-            rho
+        SELECT {CHAIN_COLUMNS}
         FROM option_chain
         WHERE act_symbol = '{underlying}'
           AND date = '{as_of_date.date()}'
+          {filter_sql}
         ORDER BY expiration, strike
         """
 
@@ -229,11 +355,276 @@ class DoltHubOptionsDataFetcher:
 
         # Cache the result
         if chain:
-            with open(cache_file, "w") as f:
-                json.dump(self._option_chain_to_json(chain), f)
+            self._cache_chain(df, chain, cache_suffix)
 
         return chain
 
+    def fetch_option_chains(
+        self,
+        underlying: str,
+        as_of_dates: List[datetime],
+        batch_size: int = 20,
+        min_dte: Optional[int] = None,
+        max_dte: Optional[int] = None,
+        delta_range: Optional[Tuple[float, float]] = None,
+    ) -> Dict[datetime, OptionChain]:
+        """Fetch historical option chains for many dates with batched queries.
+
+        Cached dates are served from disk. The remaining dates are fetched
+        with one ``date IN (...)`` query per batch instead of one query per day.
+
+        Args:
+            underlying: Underlying symbol (e.g., 'QQQ').
+            as_of_dates: Dates to fetch chains for.
+            batch_size: Maximum number of dates per query.
+            min_dte: Minimum days to expiration (inclusive).
+            max_dte: Maximum days to expiration (inclusive).
+            delta_range: Inclusive (min, max) range for absolute delta.
+
+        Returns:
+            Dict mapping each requested date to its OptionChain, in request order.
+            Dates without data are omitted.
+        """
+        filter_sql, cache_suffix = _chain_filter(min_dte, max_dte, delta_range)
+        chains: Dict[datetime, OptionChain] = {}
+        missing: List[datetime] = []
+
+        for as_of_date in as_of_dates:
+            cached = self._load_cached_chain(underlying, as_of_date, cache_suffix)
+            if cached is not None:
+                chains[as_of_date] = cached
+            elif DOLTHUB_DATA_START <= as_of_date <= DOLTHUB_DATA_END:
+                missing.append(as_of_date)
+
+        if missing:
+            logger.info(
+                f"Fetching {len(missing)} DoltHub chains for {underlying} "
+                f"({len(chains)} cached)"
+            )
+
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            date_list = ", ".join(f"'{d.date()}'" for d in batch)
+
+            query = f"""
+            SELECT {CHAIN_COLUMNS}
+            FROM option_chain
+            WHERE act_symbol = '{underlying}'
+              AND date IN ({date_list})
+              {filter_sql}
+            ORDER BY date, expiration, strike
+            """
+
+            df = self._run_dolt_sql(query)
+
+            if df.empty:
+                continue
+
+            by_date = {
+                day: rows.reset_index(drop=True)
+                for day, rows in df.groupby(pd.to_datetime(df["date"]).dt.date, sort=False)
+            }
+
+            for as_of_date in batch:
+                day_df = by_date.get(as_of_date.date())
+                if day_df is None:
+                    continue
+
+                chain = self._dataframe_to_option_chain(day_df, underlying, as_of_date)
+                if chain:
+                    self._cache_chain(day_df, chain, cache_suffix)
+                    chains[as_of_date] = chain
+
+        return {d: chains[d] for d in as_of_dates if d in chains}
+
+    async def fetch_option_chains_async(
+        self,
+        underlying: str,
+        as_of_dates: List[datetime],
+        batch_size: int = 20,
+        max_concurrency: int = 4,
+        min_dte: Optional[int] = None,
+        max_dte: Optional[int] = None,
+        delta_range: Optional[Tuple[float, float]] = None,
+    ) -> Dict[datetime, OptionChain]:
+        """Fetch option chains for many dates, running batches concurrently.
+
+        Each batch goes through ``fetch_option_chains`` in a worker thread so
+        cache reads and dolt query latency of different batches overlap. The
+        number of dolt processes is additionally capped fetcher-wide by
+        ``max_concurrent_queries``.
+
+        Args:
+            underlying: Underlying symbol (e.g., 'QQQ').
+            as_of_dates: Dates to fetch chains for.
+            batch_size: Maximum number of dates per query.
+            max_concurrency: Maximum number of queries in flight.
+            min_dte: Minimum days to expiration (inclusive).
+            max_dte: Maximum days to expiration (inclusive).
+            delta_range: Inclusive (min, max) range for absolute delta.
+
+        Returns:
+            Dict mapping each requested date to its OptionChain, in request order.
+        """
+        results = await self._gather_chain_batches(
+            underlying, as_of_dates, batch_size, max_concurrency, min_dte, max_dte, delta_range
+        )
+
+        chains: Dict[datetime, OptionChain] = {}
+        for batch_chains in results:
+            chains.update(batch_chains)
+        return chains
+
+    async def fetch_option_chains_lazy(
+        self,
+        underlying: str,
+        as_of_dates: List[datetime],
+        batch_size: int = 20,
+        max_concurrency: int = 4,
+        min_dte: Optional[int] = None,
+        max_dte: Optional[int] = None,
+        delta_range: Optional[Tuple[float, float]] = None,
+        max_loaded: int = 4,
+    ) -> CachedOptionChains:
+        """Fetch option chains into the cache and return a lazy mapping over them.
+
+        Batches are fetched as in ``fetch_option_chains_async``, but each
+        batch's chains are dropped once cached, so peak memory is bounded by
+        the batches in flight rather than the whole period. The returned
+        mapping can be passed to ``BacktestEngine.run`` as ``options_data``.
+
+        Args:
+            underlying: Underlying symbol (e.g., 'QQQ').
+            as_of_dates: Dates to fetch chains for.
+            batch_size: Maximum number of dates per query.
+            max_concurrency: Maximum number of queries in flight.
+            min_dte: Minimum days to expiration (inclusive).
+            max_dte: Maximum days to expiration (inclusive).
+            delta_range: Inclusive (min, max) range for absolute delta.
+            max_loaded: Number of chains the mapping keeps in memory.
+
+        Returns:
+            CachedOptionChains over the requested dates that have data, in
+            request order.
+        """
+        results = await self._gather_chain_batches(
+            underlying,
+            as_of_dates,
+            batch_size,
+            max_concurrency,
+            min_dte,
+            max_dte,
+            delta_range,
+            keep_chains=False,
+        )
+
+        available = {as_of_date for batch_dates in results for as_of_date in batch_dates}
+        _, cache_suffix = _chain_filter(min_dte, max_dte, delta_range)
+        return CachedOptionChains(
+            self,
+            underlying,
+            [d for d in as_of_dates if d in available],
+            cache_suffix,
+            max_loaded,
+        )
+
+    async def _gather_chain_batches(
+        self,
+        underlying: str,
+        as_of_dates: List[datetime],
+        batch_size: int,
+        max_concurrency: int,
+        min_dte: Optional[int],
+        max_dte: Optional[int],
+        delta_range: Optional[Tuple[float, float]],
+        keep_chains: bool = True,
+    ) -> list:
+        """Run ``fetch_option_chains`` over date batches in worker threads.
+
+        Returns one result per batch: its chains, or only the dates that had
+        data when ``keep_chains`` is False.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        def fetch(batch: List[datetime]):
+            chains = self.fetch_option_chains(
+                underlying, batch, batch_size, min_dte, max_dte, delta_range
+            )
+            return chains if keep_chains else list(chains)
+
+        async def fetch_batch(batch: List[datetime]):
+            async with semaphore:
+                return await asyncio.to_thread(fetch, batch)
+
+        batches = [
+            as_of_dates[i:i + batch_size] for i in range(0, len(as_of_dates), batch_size)
+        ]
+        return await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+
+    def _chain_cache_file(
+        self, underlying: str, as_of_date: datetime, suffix: str = ""
+    ) -> Path:
+        """Get the partitioned Parquet cache path for a chain."""
+        return (
+            self._cache_dir / "options" / underlying / f"{as_of_date:%Y-%m-%d}{suffix}.parquet"
+        )
+
+    def _json_cache_file(
+        self, underlying: str, as_of_date: datetime, suffix: str = ""
+    ) -> Path:
+        """Get the legacy JSON cache path for a chain."""
+        return self._cache_dir / f"{underlying}_{as_of_date.date()}{suffix}_chain.json"
+
+    def _load_cached_chain(
+        self,
+        underlying: str,
+        as_of_date: datetime,
+        suffix: str = "",
+    ) -> Optional[OptionChain]:
+        """Load a chain from the Parquet cache, falling back to the JSON cache.
+
+        Args:
+            underlying: Underlying symbol.
+            as_of_date: Quote date.
+            suffix: Cache-key suffix identifying a filtered chain.
+
+        Returns:
+            Cached OptionChain, or None on a cache miss.
+        """
+        parquet_file = self._chain_cache_file(underlying, as_of_date, suffix)
+        if parquet_file.exists():
+            logger.debug(f"Loading cached chain: {parquet_file}")
+            df = pd.read_parquet(parquet_file)
+            return self._dataframe_to_option_chain(df, underlying, as_of_date)
+
+        json_file = self._json_cache_file(underlying, as_of_date, suffix)
+        if json_file.exists():
+            logger.debug(f"Loading cached chain: {json_file}")
+            with open(json_file, "r") as f:
+                return self._json_to_option_chain(json.load(f))
+
+        return None
+
+    def _cache_chain(self, df: pd.DataFrame, chain: OptionChain, suffix: str = "") -> None:
+        """Cache raw DoltHub rows as Snappy Parquet (JSON if no Parquet engine).
+
+        Args:
+            df: DoltHub query result the chain was built from.
+            chain: Parsed chain, used for the JSON fallback.
+            suffix: Cache-key suffix identifying a filtered chain.
+        """
+        parquet_file = self._chain_cache_file(chain.underlying, chain.timestamp, suffix)
+        parquet_file.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            df.to_parquet(parquet_file, compression="snappy", index=False)
+            return
+        except ImportError:
+            logger.debug("No Parquet engine installed, caching chain as JSON")
+
+        with open(self._json_cache_file(chain.underlying, chain.timestamp, suffix), "w") as f:
+            json.dump(self._option_chain_to_json(chain), f)
+
     def _dataframe_to_option_chain(
         self,
         df: pd.DataFrame,
@@ -253,51 +644,78 @@ class DoltHubOptionsDataFetcher:
         if df.empty:
             return None
 
-        contracts = []
-
-        for _, row in df.iterrows():
-            try:
-                # Parse expiration date
-                expiration = pd.to_datetime(row["expiration"])
-
-                # Calculate days to expiry
-                days_to_expiry = (expiration - as_of_date).days
-
-                # Build contract symbol (OCC format)
-                # Format: SYMBOL + YY + MM + DD + C/P + STRIKE (8 digits)
-                exp_str = expiration.strftime("%y%m%d")
-                strike_str = f"{int(float(row['strike']) * 1000):08d}"
-                # DoltHub uses "Call" / "Put" format - convert to lowercase for consistency
-                option_type = str(row["call_put"]).lower()
-                contract_symbol = f"{underlying}{exp_str}{option_type[0].upper()}{strike_str}"
-
-                # Create contract
-                # Note: DoltHub lacks last, volume, open_interest - setting defaults
-                contract = OptionContract(
-                    symbol=contract_symbol,
-                    underlying=underlying,
-                    expiration=expiration,
-                    strike=float(row["strike"]),
-                    option_type=option_type,
-                    bid=float(row["bid"]) if pd.notna(row["bid"]) else 0.0,
-                    ask=float(row["ask"]) if pd.notna(row["ask"]) else 0.0,
-                    last=0.0,  # Not available in DoltHub
-                    volume=0,  # Not available in DoltHub
-                    open_interest=0,  # Not available in DoltHub
-                    implied_volatility=float(row["vol"]) if pd.notna(row["vol"]) else None,
-                    delta=float(row["delta"]) if pd.notna(row["delta"]) else None,
-                    gamma=float(row["gamma"]) if pd.notna(row["gamma"]) else None,
-                    theta=float(row["theta"]) if pd.notna(row["theta"]) else None,
-                    vega=float(row["vega"]) if pd.notna(row["vega"]) else None,
-                    rho=float(row["rho"]) if pd.notna(row["rho"]) else None,
-                    _as_of_date=as_of_date,
-                )
+        # Parse and clean whole columns once; only contract construction is per row
+        try:
+            expirations = pd.to_datetime(df["expiration"], errors="coerce")
+            strikes = pd.to_numeric(df["strike"], errors="coerce").astype(float)
+            # DoltHub uses "Call" / "Put" format - convert to lowercase for consistency
+            option_types = df["call_put"].astype(str).str.lower()
+        except KeyError as e:
+            logger.warning(f"Failed to parse DoltHub rows: missing column {e}")
+            return None
 
-                contracts.append(contract)
+        # Skip unparseable rows rather than the whole chain
+        valid = expirations.notna() & strikes.notna() & (option_types.str.len() > 0)
+        if not valid.all():
+            logger.warning(f"Skipped {int((~valid).sum())} unparseable contract rows")
+            df = df[valid]
+            expirations = expirations[valid]
+            strikes = strikes[valid]
+            option_types = option_types[valid]
+
+        # Build contract symbols (OCC format)
+        # Format: SYMBOL + YY + MM + DD + C/P + STRIKE (8 digits)
+        symbols = (
+            underlying
+            + expirations.dt.strftime("%y%m%d")
+            + option_types.str[0].str.upper()
+            + (strikes * 1000).astype(np.int64).map("{:08d}".format)
+        )
 
-            except Exception as e:
-                logger.warning(f"Failed to parse contract row: {e}")
-                continue
+        def prices(column: str) -> List[float]:
+            return pd.to_numeric(df[column], errors="coerce").fillna(0.0).tolist()
+
+        def optional(column: str) -> List[Optional[float]]:
+            values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float64)
+            return np.where(np.isnan(values), None, values).tolist()
+
+        # Note: DoltHub lacks last, volume, open_interest - setting defaults
+        contracts = [
+            OptionContract(
+                symbol=symbol,
+                underlying=underlying,
+                expiration=expiration,
+                strike=strike,
+                option_type=option_type,
+                bid=bid,
+                ask=ask,
+                last=0.0,  # Not available in DoltHub
+                volume=0,  # Not available in DoltHub
+                open_interest=0,  # Not available in DoltHub
+                implied_volatility=iv,
+                delta=delta,
+                gamma=gamma,
+                theta=theta,
+                vega=vega,
+                rho=rho,
+                _as_of_date=as_of_date,
+            )
+            for symbol, expiration, strike, option_type, bid, ask, iv, delta, gamma, theta, vega, rho
+            in zip(
+                symbols,
+                expirations,
+                strikes.tolist(),
+                option_types,
+                prices("bid"),
+                prices("ask"),
+                optional("vol"),
+                optional("delta"),
+                optional("gamma"),
+                optional("theta"),
+                optional("vega"),
+                optional("rho"),
+            )
+        ]
 
         if not contracts:
             return None
@@ -375,17 +793,26 @@ class DoltHubOptionsDataFetcher:
         underlying: str,
         start_date: datetime,
         end_date: datetime,
+        refresh: bool = False,
     ) -> List[datetime]:
         """Get list of dates with available data for a symbol.
 
+        Results are cached on disk for ``AVAILABLE_DATES_TTL``.
+
         Args:
             underlying: Underlying symbol.
             start_date: Start date.
             end_date: End date.
+            refresh: Query DoltHub even if a fresh cached result exists.
 
         Returns:
             List of dates with available data.
         """
+        if not refresh:
+            cached = self._load_cached_dates(underlying, start_date, end_date)
+            if cached is not None:
+                return cached
+
         query = f"""
         SELECT DISTINCT date
         FROM option_chain
@@ -400,4 +827,116 @@ class DoltHubOptionsDataFetcher:
         if df.empty:
             return []
 
-        return [pd.to_datetime(d).to_pydatetime() for d in df["date"]]
+        # One vectorized parse instead of a to_datetime call per date
+        dates = list(pd.to_datetime(df["date"]).dt.to_pydatetime())
+        self._cache_dates(underlying, start_date, end_date, dates)
+        return dates
+
+    def get_available_dates_bulk(
+        self,
+        underlyings: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        refresh: bool = False,
+    ) -> Dict[str, List[datetime]]:
+        """Get dates with available data for several symbols in one query.
+
+        Symbols with a fresh cached result are served from disk; only the
+        rest are queried.
+
+        Args:
+            underlyings: Underlying symbols.
+            start_date: Start date.
+            end_date: End date.
+            refresh: Query DoltHub even for symbols with a fresh cached result.
+
+        Returns:
+            Dict mapping each symbol to its sorted dates (empty if it has none).
+        """
+        available: Dict[str, List[datetime]] = {symbol: [] for symbol in underlyings}
+        missing: List[str] = []
+
+        for symbol in underlyings:
+            cached = None if refresh else self._load_cached_dates(symbol, start_date, end_date)
+            if cached is None:
+                missing.append(symbol)
+            else:
+                available[symbol] = cached
+
+        if not missing:
+            return available
+
+        symbol_list = ", ".join(f"'{symbol}'" for symbol in missing)
+        query = f"""
+        SELECT DISTINCT act_symbol, date
+        FROM option_chain
+        WHERE act_symbol IN ({symbol_list})
+          AND date >= '{start_date.date()}'
+          AND date <= '{end_date.date()}'
+        ORDER BY act_symbol, date
+        """
+
+        df = self._run_dolt_sql(query)
+
+        if df.empty:
+            return available
+
+        dates = pd.to_datetime(df["date"])
+        for symbol, symbol_dates in dates.groupby(df["act_symbol"], sort=False):
+            available[symbol] = list(symbol_dates.dt.to_pydatetime())
+            self._cache_dates(symbol, start_date, end_date, available[symbol])
+
+        return available
+
+    def _dates_cache_file(
+        self, underlying: str, start_date: datetime, end_date: datetime, suffix: str
+    ) -> Path:
+        """Get the cache path for a symbol's available dates."""
+        return (
+            self._cache_dir
+            / "available_dates"
+            / f"{underlying}_{start_date:%Y%m%d}_{end_date:%Y%m%d}{suffix}"
+        )
+
+    def _load_cached_dates(
+        self, underlying: str, start_date: datetime, end_date: datetime
+    ) -> Optional[List[datetime]]:
+        """Load cached available dates, or None if missing or older than the TTL."""
+        for suffix in (".parquet", ".json"):
+            cache_file = self._dates_cache_file(underlying, start_date, end_date, suffix)
+            if not cache_file.exists():
+                continue
+
+            age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
+            if age > AVAILABLE_DATES_TTL:
+                return None
+
+            if suffix == ".parquet":
+                dates = pd.read_parquet(cache_file)["date"]
+            else:
+                with open(cache_file, "r") as f:
+                    dates = pd.Series(json.load(f))
+            return list(pd.to_datetime(dates).dt.to_pydatetime())
+
+        return None
+
+    def _cache_dates(
+        self,
+        underlying: str,
+        start_date: datetime,
+        end_date: datetime,
+        dates: List[datetime],
+    ) -> None:
+        """Cache a symbol's available dates as Parquet (JSON if no Parquet engine)."""
+        parquet_file = self._dates_cache_file(underlying, start_date, end_date, ".parquet")
+        parquet_file.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            pd.DataFrame({"date": pd.to_datetime(dates)}).to_parquet(parquet_file, index=False)
+            return
+        except ImportError:
+            logger.debug("No Parquet engine installed, caching available dates as JSON")
+
+        json_file = self._dates_cache_file(underlying, start_date, end_date, ".json")
+        with open(json_file, "w") as f:
+            json.dump([d.isoformat() for d in dates], f)
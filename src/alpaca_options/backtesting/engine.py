@@ -13,8 +13,9 @@ from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
 
+import numpy as np
 import pandas as pd
 
 from alpaca_options.core.config import BacktestConfig, RiskConfig, TradingConfig
@@ -39,6 +40,12 @@ from alpaca_options.backtesting.execution_model import (
 
 logger = logging.getLogger(__name__)
 
+# Underlying bar columns read into MarketData (prepared once per run)
+BAR_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Optional indicator columns; missing columns and NaN values become None
+OPTIONAL_BAR_COLUMNS = ("vwap", "sma_20", "sma_50", "rsi_14", "iv_rank")
+
 
 class TradeStatus(Enum):
     """Status of a backtested trade."""
@@ -158,17 +165,8 @@ class BacktestResult:
     daily_returns: pd.Series
     config: dict[str, Any] = field(default_factory=dict)
 
-    def save(self, path: Path) -> None:
-        """Save backtest results to files."""
-        path.mkdir(parents=True, exist_ok=True)
-
-        # Save equity curve
-        self.equity_curve.to_csv(path / "equity_curve.csv", index=True)
-
-        # Save daily returns
-        self.daily_returns.to_csv(path / "daily_returns.csv", header=True)
-
-        # Save trades
+    def trades_frame(self) -> pd.DataFrame:
+        """Build a DataFrame with one row per trade (the columns of trades.csv)."""
         trades_data = [
             {
                 "trade_id": t.trade_id,
@@ -185,7 +183,20 @@ class BacktestResult:
             }
             for t in self.trades
         ]
-        pd.DataFrame(trades_data).to_csv(path / "trades.csv", index=False)
+        return pd.DataFrame(trades_data)
+
+    def save(self, path: Path) -> None:
+        """Save backtest results to files."""
+        path.mkdir(parents=True, exist_ok=True)
+
+        # Save equity curve
+        self.equity_curve.to_csv(path / "equity_curve.csv", index=True)
+
+        # Save daily returns
+        self.daily_returns.to_csv(path / "daily_returns.csv", header=True)
+
+        # Save trades
+        self.trades_frame().to_csv(path / "trades.csv", index=False)
 
         # Save metrics summary
         with open(path / "metrics.txt", "w") as f:
@@ -363,6 +374,7 @@ class BacktestEngine:
         trading_config: Optional[TradingConfig] = None,
     ) -> None:
         self._config = config
+        self._risk_config = risk_config
         self._risk_manager = RiskManager(risk_config)
         self._trading_config = trading_config or TradingConfig()
         self._slippage_model = SlippageModel(
@@ -427,7 +439,7 @@ class BacktestEngine:
     def _initialize_backtest(
         self,
         strategy: BaseStrategy,
-        options_data: dict[datetime, OptionChain],
+        options_data: Mapping[datetime, OptionChain],
         start_date: Optional[datetime],
         end_date: Optional[datetime],
     ) -> tuple[datetime, datetime, list[datetime]]:
@@ -476,8 +488,8 @@ class BacktestEngine:
         timestamp: datetime,
         timestamps: list[datetime],
         strategy: BaseStrategy,
-        underlying_data: pd.DataFrame,
-        options_data: dict[datetime, OptionChain],
+        bars: dict[str, list],
+        options_data: Mapping[datetime, OptionChain],
         last_date: Optional[date],
     ) -> Optional[date]:
         """Process a single timestamp in the backtest simulation.
@@ -487,7 +499,7 @@ class BacktestEngine:
             timestamp: Current timestamp to process.
             timestamps: Full list of timestamps.
             strategy: Strategy instance.
-            underlying_data: Historical underlying price data.
+            bars: Underlying bar values per timestamp (see _bar_values).
             options_data: Historical options chain data.
             last_date: Previous day's date for tracking daily P&L.
 
@@ -501,7 +513,7 @@ class BacktestEngine:
 
         # Get market data for this timestamp, using chain's underlying symbol
         market_data = self._get_market_data(
-            underlying_data, timestamp, symbol=chain.underlying
+            bars, i, timestamp, symbol=chain.underlying
         )
 
         # Update chain's underlying price with actual market price
@@ -534,7 +546,10 @@ class BacktestEngine:
         signal = await strategy.on_option_chain(chain)
 
         if signal is not None:
-            logger.info(
+            # Per-bar messages log at DEBUG: strategies can signal on every bar
+            # (e.g. while at max positions), and terminal output at INFO would
+            # dominate long hourly backtests
+            logger.debug(
                 f"Signal received: {signal.signal_type.value} on {signal.underlying} "
                 f"with {len(signal.legs)} legs"
             )
@@ -544,7 +559,7 @@ class BacktestEngine:
             max_concurrent = self._trading_config.max_concurrent_positions
 
             if open_position_count >= max_concurrent:
-                logger.info(
+                logger.debug(
                     f"Signal rejected: at max concurrent positions "
                     f"({open_position_count}/{max_concurrent})"
                 )
@@ -605,7 +620,7 @@ class BacktestEngine:
         start: datetime,
         end: datetime,
         timestamps: list[datetime],
-        options_data: dict[datetime, OptionChain],
+        options_data: Mapping[datetime, OptionChain],
     ) -> BacktestResult:
         """Finalize backtest and generate results.
 
@@ -649,7 +664,7 @@ class BacktestEngine:
         self,
         strategy: BaseStrategy,
         underlying_data: pd.DataFrame,
-        options_data: dict[datetime, OptionChain],
+        options_data: Mapping[datetime, OptionChain],
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
     ) -> BacktestResult:
@@ -658,7 +673,9 @@ class BacktestEngine:
         Args:
             strategy: The strategy to backtest.
             underlying_data: DataFrame with OHLCV data indexed by datetime.
-            options_data: Dict mapping datetime to OptionChain snapshots.
+            options_data: Mapping of datetime to OptionChain snapshots. Chains
+                are only looked up one timestamp at a time, so a lazy mapping
+                (e.g. ``CachedOptionChains``) works as well as a dict.
             start_date: Optional start date override.
             end_date: Optional end date override.
 
@@ -676,6 +693,12 @@ class BacktestEngine:
 
         last_date = None
 
+        # Underlying bar values for every timestamp, found and converted in
+        # one vectorized pass so each bar is a few list reads in the loop
+        bars = self._bar_values(
+            underlying_data, self._bar_positions(underlying_data, timestamps)
+        )
+
         # Run simulation for each timestamp
         for i, timestamp in enumerate(timestamps):
             last_date = await self._process_timestamp(
@@ -683,7 +706,7 @@ class BacktestEngine:
                 timestamp=timestamp,
                 timestamps=timestamps,
                 strategy=strategy,
-                underlying_data=underlying_data,
+                bars=bars,
                 options_data=options_data,
                 last_date=last_date,
             )
@@ -692,7 +715,14 @@ class BacktestEngine:
         return await self._finalize_backtest(strategy, start, end, timestamps, options_data)
 
     def _reset(self) -> None:
-        """Reset backtest state."""
+        """Reset backtest state.
+
+        Everything a run accumulates is reset, including the risk manager's
+        peak equity and position tracking, so one engine can run several
+        backtests in sequence (construction-time models and the SEC filings
+        analyzer are kept).
+        """
+        self._risk_manager = RiskManager(self._risk_config)
         self._equity = self._config.initial_capital
         self._starting_equity = self._config.initial_capital
         self._peak_equity = self._config.initial_capital
@@ -708,43 +738,103 @@ class BacktestEngine:
         self._fill_rejections = 0
         self._gap_events = 0
 
+    @staticmethod
+    def _bar_positions(
+        underlying_data: pd.DataFrame, timestamps: list[datetime]
+    ) -> np.ndarray:
+        """Find the underlying bar at or before each timestamp (forward fill).
+
+        Args:
+            underlying_data: DataFrame with OHLCV data indexed by datetime.
+            timestamps: Sorted timestamps to look up.
+
+        Returns:
+            Row position per timestamp (-1 where no bar precedes it).
+        """
+        try:
+            return (
+                underlying_data.index.searchsorted(pd.DatetimeIndex(timestamps), side="right")
+                - 1
+            )
+        except TypeError as e:
+            # e.g. tz-aware bars vs naive chain timestamps: no market data
+            logger.warning(f"Cannot align underlying bars with option timestamps: {e}")
+            return np.full(len(timestamps), -1)
+
+    @staticmethod
+    def _bar_values(
+        underlying_data: pd.DataFrame, positions: np.ndarray
+    ) -> dict[str, list]:
+        """Read the MarketData fields of each timestamp's bar in one pass.
+
+        Args:
+            underlying_data: DataFrame with OHLCV data indexed by datetime.
+            positions: Bar position per timestamp (see _bar_positions).
+
+        Returns:
+            Dict of per-timestamp lists of Python values: "has_bar", the
+            BAR_COLUMNS present, every OPTIONAL_BAR_COLUMNS entry (None where
+            missing or NaN) and "symbol" if the data has it.
+        """
+        n = len(positions)
+        has_bar = positions >= 0
+        if underlying_data.empty:
+            has_bar = np.zeros(n, dtype=bool)
+        rows = np.where(has_bar, positions, 0)
+
+        values: dict[str, list] = {"has_bar": has_bar.tolist()}
+        for col in BAR_COLUMNS + OPTIONAL_BAR_COLUMNS:
+            if col not in underlying_data.columns or not has_bar.any():
+                if col in OPTIONAL_BAR_COLUMNS:
+                    values[col] = [None] * n
+                continue
+            column = underlying_data[col].to_numpy(dtype=np.float64, na_value=np.nan)[rows]
+            if col in OPTIONAL_BAR_COLUMNS:
+                values[col] = np.where(np.isnan(column), None, column).tolist()
+            else:
+                values[col] = column.tolist()
+        if "symbol" in underlying_data.columns and has_bar.any():
+            values["symbol"] = underlying_data["symbol"].to_numpy()[rows].tolist()
+        return values
+
     def _get_market_data(
-        self, underlying_data: pd.DataFrame, timestamp: datetime, symbol: str = ""
+        self,
+        bars: dict[str, list],
+        i: int,
+        timestamp: datetime,
+        symbol: str = "",
     ) -> Optional[MarketData]:
-        """Get market data for a timestamp."""
-        try:
-            # Find closest row at or before timestamp
-            idx = underlying_data.index.get_indexer([timestamp], method="ffill")[0]
-            if idx < 0:
-                return None
-
-            row = underlying_data.iloc[idx]
-
-            # Helper to get float value, returning None for NaN
-            def safe_float(col: str) -> Optional[float]:
-                if col not in row:
-                    return None
-                val = row[col]
-                if pd.isna(val):
-                    return None
-                return float(val)
+        """Get market data for a timestamp.
+
+        Args:
+            bars: Underlying bar values per timestamp (see _bar_values).
+            i: Index of the timestamp in the backtest's timestamps.
+            timestamp: Timestamp to get market data for.
+            symbol: Underlying symbol (falls back to the bar's "symbol").
+
+        Returns:
+            MarketData from the bar at or before timestamp, or None.
+        """
+        if not bars["has_bar"][i]:
+            return None
 
+        try:
             # Use provided symbol, fall back to row data, then empty string
-            market_symbol = symbol or str(row.get("symbol", ""))
+            market_symbol = symbol or (str(bars["symbol"][i]) if "symbol" in bars else "")
 
             return MarketData(
                 symbol=market_symbol,
                 timestamp=timestamp,
-                open=float(row["open"]),
-                high=float(row["high"]),
-                low=float(row["low"]),
-                close=float(row["close"]),
-                volume=int(row.get("volume", 0)),
-                vwap=safe_float("vwap"),
-                sma_20=safe_float("sma_20"),
-                sma_50=safe_float("sma_50"),
-                rsi_14=safe_float("rsi_14"),
-                iv_rank=safe_float("iv_rank"),
+                open=bars["open"][i],
+                high=bars["high"][i],
+                low=bars["low"][i],
+                close=bars["close"][i],
+                volume=int(bars["volume"][i]) if "volume" in bars else 0,
+                vwap=bars["vwap"][i],
+                sma_20=bars["sma_20"][i],
+                sma_50=bars["sma_50"][i],
+                rsi_14=bars["rsi_14"][i],
+                iv_rank=bars["iv_rank"][i],
             )
         except Exception as e:
             logger.debug(f"Error getting market data: {e}")
@@ -753,13 +843,12 @@ class BacktestEngine:
     def _build_contract_map(
         self, signal: OptionSignal, chain: OptionChain
     ) -> dict[str, OptionContract]:
-        """Build map of contract symbols to contracts."""
+        """Build map of the signal's leg symbols to their contracts in the chain."""
         contracts = {}
         for leg in signal.legs:
-            for contract in chain.contracts:
-                if contract.symbol == leg.contract_symbol:
-                    contracts[leg.contract_symbol] = contract
-                    break
+            contract = chain.get_contract(leg.contract_symbol)
+            if contract is not None:
+                contracts[leg.contract_symbol] = contract
         return contracts
 
     def _check_order_fillability(
@@ -783,17 +872,15 @@ class BacktestEngine:
         Returns:
             True if order should fill, False if it should be rejected.
         """
+        contracts = self._build_contract_map(signal, chain)
+
         # === PHASE 2A: FILL PROBABILITY CHECK ===
         if self._enable_fill_probability and self._fill_model:
             # Get VIX for fill context (default to 20 if not available)
             vix = 20.0  # TODO: Load actual VIX data from market data
 
             for leg in signal.legs:
-                contract = None
-                for c in chain.contracts:
-                    if c.symbol == leg.contract_symbol:
-                        contract = c
-                        break
+                contract = contracts.get(leg.contract_symbol)
 
                 if contract is None:
                     logger.debug(f"Order rejected: contract {leg.contract_symbol} not found")
@@ -836,11 +923,7 @@ class BacktestEngine:
         elif not self._enable_fill_probability:
             import random
             for leg in signal.legs:
-                contract = None
-                for c in chain.contracts:
-                    if c.symbol == leg.contract_symbol:
-                        contract = c
-                        break
+                contract = contracts.get(leg.contract_symbol)
 
                 if contract is None:
                     logger.debug(f"Order rejected: contract {leg.contract_symbol} not found")
@@ -894,13 +977,11 @@ class BacktestEngine:
         total_commission = 0.0
         total_slippage = 0.0
 
+        contracts = self._build_contract_map(signal, chain)
+
         for leg in signal.legs:
             # Find contract in chain
-            contract = None
-            for c in chain.contracts:
-                if c.symbol == leg.contract_symbol:
-                    contract = c
-                    break
+            contract = contracts.get(leg.contract_symbol)
 
             if contract is None:
                 logger.warning(f"Contract not found: {leg.contract_symbol}")
@@ -1020,11 +1101,7 @@ class BacktestEngine:
             position_notional = 0.0
 
             for leg in trade.legs:
-                contract = None
-                for c in chain.contracts:
-                    if c.symbol == leg.contract_symbol:
-                        contract = c
-                        break
+                contract = chain.get_contract(leg.contract_symbol)
 
                 if contract:
                     entry_price = trade.entry_prices.get(leg.contract_symbol, 0)
@@ -1101,11 +1178,7 @@ class BacktestEngine:
         # Calculate current unrealized P&L
         current_pnl = 0.0
         for leg in trade.legs:
-            contract = None
-            for c in chain.contracts:
-                if c.symbol == leg.contract_symbol:
-                    contract = c
-                    break
+            contract = chain.get_contract(leg.contract_symbol)
             if contract:
                 entry_price = trade.entry_prices.get(leg.contract_symbol, 0)
                 current_price = contract.mid_price
@@ -1172,11 +1245,7 @@ class BacktestEngine:
                 break
 
             # Find current contract
-            contract = None
-            for c in chain.contracts:
-                if c.symbol == leg.contract_symbol:
-                    contract = c
-                    break
+            contract = chain.get_contract(leg.contract_symbol)
 
             if contract is None:
                 continue
@@ -1248,11 +1317,7 @@ class BacktestEngine:
 
         # Apply gap to each leg
         for leg in trade.legs:
-            contract = None
-            for c in chain.contracts:
-                if c.symbol == leg.contract_symbol:
-                    contract = c
-                    break
+            contract = chain.get_contract(leg.contract_symbol)
 
             if contract is None:
                 continue
@@ -1346,11 +1411,7 @@ class BacktestEngine:
             vix = 20.0  # TODO: Load actual VIX data from market data
 
             for leg in trade.legs:
-                contract = None
-                for c in chain.contracts:
-                    if c.symbol == leg.contract_symbol:
-                        contract = c
-                        break
+                contract = chain.get_contract(leg.contract_symbol)
 
                 if contract is None:
                     # If contract not found, assume expired/assigned - allow close
@@ -1396,35 +1457,33 @@ class BacktestEngine:
         for leg in trade.legs:
             # Find current price
             current_price = 0.0
-            if chain:
-                for contract in chain.contracts:
-                    if contract.symbol == leg.contract_symbol:
-                        is_buy_to_close = leg.side == "sell"
-                        base_price = (
-                            contract.ask if is_buy_to_close else contract.bid
-                        )
+            contract = chain.get_contract(leg.contract_symbol) if chain else None
+            if contract is not None:
+                is_buy_to_close = leg.side == "sell"
+                base_price = (
+                    contract.ask if is_buy_to_close else contract.bid
+                )
 
-                        # Apply slippage for closing trade
-                        slippage = self._slippage_model.calculate(
-                            price=base_price,
-                            quantity=leg.quantity,
-                            is_buy=is_buy_to_close,
-                            volatility=contract.implied_volatility,
-                            bid=contract.bid,
-                            ask=contract.ask,
-                            num_legs=len(trade.legs),
-                            delta=contract.delta,  # For adaptive model
-                            dte=contract.days_to_expiry,  # For adaptive model
-                        )
-                        total_slippage += slippage
-
-                        # Adjust price for slippage (worse for us)
-                        slippage_per_contract = slippage / (leg.quantity * 100)
-                        if is_buy_to_close:
-                            current_price = base_price + slippage_per_contract
-                        else:
-                            current_price = base_price - slippage_per_contract
-                        break
+                # Apply slippage for closing trade
+                slippage = self._slippage_model.calculate(
+                    price=base_price,
+                    quantity=leg.quantity,
+                    is_buy=is_buy_to_close,
+                    volatility=contract.implied_volatility,
+                    bid=contract.bid,
+                    ask=contract.ask,
+                    num_legs=len(trade.legs),
+                    delta=contract.delta,  # For adaptive model
+                    dte=contract.days_to_expiry,  # For adaptive model
+                )
+                total_slippage += slippage
+
+                # Adjust price for slippage (worse for us)
+                slippage_per_contract = slippage / (leg.quantity * 100)
+                if is_buy_to_close:
+                    current_price = base_price + slippage_per_contract
+                else:
+                    current_price = base_price - slippage_per_contract
 
             exit_prices[leg.contract_symbol] = current_price
 
@@ -1487,11 +1546,9 @@ class BacktestEngine:
                 entry_price = trade.entry_prices.get(leg.contract_symbol, 0.0)
                 current_price = entry_price  # Default to entry
 
-                if chain:
-                    for contract in chain.contracts:
-                        if contract.symbol == leg.contract_symbol:
-                            current_price = contract.mid_price
-                            break
+                contract = chain.get_contract(leg.contract_symbol) if chain else None
+                if contract is not None:
+                    current_price = contract.mid_price
 
                 # Position value
                 if leg.side == "buy":
@@ -1544,8 +1601,12 @@ class BacktestEngine:
 
         # Basic stats
         total_trades = len(closed_trades)
-        winning_trades = [t for t in closed_trades if t.net_pnl > 0]
-        losing_trades = [t for t in closed_trades if t.net_pnl <= 0]
+        pnls = np.fromiter(
+            (t.net_pnl for t in closed_trades), dtype=np.float64, count=total_trades
+        )
+        is_win = pnls > 0
+        num_wins = int(np.count_nonzero(is_win))
+        num_losses = total_trades - num_wins
 
         total_return = self._equity - self._starting_equity
         total_return_percent = (total_return / self._starting_equity) * 100
@@ -1561,23 +1622,18 @@ class BacktestEngine:
             annualized_return = 0.0
 
         # Win rate
-        win_rate = (len(winning_trades) / total_trades * 100) if total_trades > 0 else 0
+        win_rate = (num_wins / total_trades * 100) if total_trades > 0 else 0
+
+        # Gross profit/loss computed once and reused for the averages
+        gross_profit = float(pnls[is_win].sum())
+        net_loss = float(pnls[~is_win].sum())
+        gross_loss = abs(net_loss)
 
         # Average win/loss
-        avg_win = (
-            sum(t.net_pnl for t in winning_trades) / len(winning_trades)
-            if winning_trades
-            else 0
-        )
-        avg_loss = (
-            sum(t.net_pnl for t in losing_trades) / len(losing_trades)
-            if losing_trades
-            else 0
-        )
+        avg_win = gross_profit / num_wins if num_wins else 0
+        avg_loss = net_loss / num_losses if num_losses else 0
 
         # Profit factor
-        gross_profit = sum(t.net_pnl for t in winning_trades)
-        gross_loss = abs(sum(t.net_pnl for t in losing_trades))
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float("inf")
 
         # Max drawdown
@@ -1671,8 +1727,8 @@ class BacktestEngine:
             win_rate=win_rate,
             profit_factor=profit_factor,
             total_trades=total_trades,
-            winning_trades=len(winning_trades),
-            losing_trades=len(losing_trades),
+            winning_trades=num_wins,
+            losing_trades=num_losses,
             avg_win=avg_win,
             avg_loss=avg_loss,
             avg_trade_pnl=total_return / total_trades if total_trades > 0 else 0,
@@ -222,8 +222,14 @@ def backtest(
                 index=dates,
             )
 
-        # Add technical indicators
-        underlying_data = data_loader.add_technical_indicators(underlying_data)
+        # Add technical indicators (reusing the on-disk cache across runs)
+        underlying_data = data_loader.add_technical_indicators_cached(
+            underlying_data,
+            symbol,
+            start_dt,
+            end_dt,
+            settings.backtesting.data.underlying_timeframe,
+        )
 
         # Load options data (synthetic generation removed - use only real data)
         progress.add_task("Loading options chains...", total=None)
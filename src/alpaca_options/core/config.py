@@ -1,6 +1,8 @@
 """Configuration management with Pydantic validation."""
 
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -218,6 +220,16 @@ class Settings(BaseSettings):
         return {k: v for k, v in self.strategies.items() if v.enabled}
 
 
+@lru_cache(maxsize=8)
+def _read_yaml_config(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML config file, memoized on its path and modification time.
+
+    Callers must not mutate the returned dict; load_config works on a copy.
+    """
+    with open(path) as f:
+        return yaml.safe_load(f) or {}
+
+
 def load_config(config_path: Optional[Path] = None) -> Settings:
     """Load configuration from YAML file and environment variables.
 
@@ -243,10 +255,11 @@ def load_config(config_path: Optional[Path] = None) -> Settings:
                 config_path = path
                 break
 
-    # Load YAML config if found
+    # Load YAML config if found (parsed once per file version)
     if config_path and config_path.exists():
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f) or {}
+        config_data = copy.deepcopy(
+            _read_yaml_config(str(config_path.resolve()), config_path.stat().st_mtime_ns)
+        )
 
     # Override with environment variables for sensitive data
     if "alpaca" not in config_data:
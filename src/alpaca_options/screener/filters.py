@@ -22,22 +22,46 @@ def calculate_rsi(prices: pd.Series, period: int = 14) -> float:
     if len(prices) < period + 1:
         return 50.0  # Neutral if not enough data
 
-    delta = prices.diff()
-    gains = delta.where(delta > 0, 0.0)
-    losses = (-delta).where(delta < 0, 0.0)
+    rsi = rsi_series(prices, period)
+    return float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
+
 
-    avg_gain = gains.rolling(window=period, min_periods=period).mean()
-    avg_loss = losses.rolling(window=period, min_periods=period).mean()
+def rsi_series(prices: pd.Series, period: int = 14) -> pd.Series:
+    """Calculate RSI for every bar using Wilder's smoothing.
+
+    Averages are seeded with the simple mean of the first ``period`` moves
+    and then smoothed with ``alpha = 1 / period``, which is an exponential
+    moving average, so the whole series is computed in one pass.
+
+    Args:
+        prices: Series of closing prices.
+        period: RSI period (default 14).
+
+    Returns:
+        Series of RSI values aligned with ``prices`` (NaN during warmup).
+    """
+    delta = prices.diff()
+    # fmax maps the leading NaN move to 0 like a masked where, as one ufunc
+    gains = np.fmax(delta, 0.0)
+    losses = np.fmax(-delta, 0.0)
 
-    # Use Wilder's smoothing method
-    for i in range(period, len(gains)):
-        avg_gain.iloc[i] = (avg_gain.iloc[i - 1] * (period - 1) + gains.iloc[i]) / period
-        avg_loss.iloc[i] = (avg_loss.iloc[i - 1] * (period - 1) + losses.iloc[i]) / period
+    avg_gain = _wilder_average(gains, period)
+    avg_loss = _wilder_average(losses, period)
 
     rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
+    return 100 - (100 / (1 + rs))
 
-    return float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
+
+def _wilder_average(values: pd.Series, period: int) -> pd.Series:
+    """Wilder-smooth values, seeded with the simple mean of the first period."""
+    result = pd.Series(np.nan, index=values.index, dtype=np.float64)
+    if len(values) < period:
+        return result
+
+    smoothed = values.iloc[period - 1:].astype(np.float64)
+    smoothed.iloc[0] = values.iloc[:period].mean()
+    result.iloc[period - 1:] = smoothed.ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+    return result
 
 
 def calculate_sma(prices: pd.Series, period: int) -> float:
@@ -158,6 +182,37 @@ def calculate_bollinger_bands(
     )
 
 
+def bollinger_position_series(
+    prices: pd.Series,
+    period: int = 20,
+    num_std: float = 2.0,
+) -> pd.Series:
+    """Calculate each bar's position within its Bollinger Bands.
+
+    Uses the same rolling mean and sample standard deviation as
+    ``calculate_bollinger_bands``, computed once over the whole series with
+    pandas' O(N) rolling kernels.
+
+    Args:
+        prices: Series of closing prices.
+        period: SMA period for middle band.
+        num_std: Number of standard deviations for bands.
+
+    Returns:
+        Series of positions (0 = lower band, 100 = upper band, 50 where the
+        bands are flat, NaN for the first ``period - 1`` bars).
+    """
+    window = prices.rolling(window=period)
+    middle = window.mean()
+    std = window.std(ddof=1)
+
+    lower = middle - (std * num_std)
+    width = 2 * std * num_std
+    position = (prices - lower) / width.where(width != 0) * 100
+
+    return position.where((width != 0) | width.isna(), 50.0)
+
+
 def calculate_macd(
     prices: pd.Series,
     fast_period: int = 12,
@@ -191,6 +246,34 @@ def calculate_macd(
     )
 
 
+def macd_histogram_series(
+    prices: pd.Series,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+) -> pd.Series:
+    """Calculate the MACD histogram for every bar.
+
+    The EMAs are evaluated once over the whole series, so each bar's value
+    equals ``calculate_macd`` on the prices up to that bar.
+
+    Args:
+        prices: Series of closing prices.
+        fast_period: Fast EMA period.
+        slow_period: Slow EMA period.
+        signal_period: Signal line period.
+
+    Returns:
+        Series of histogram values (NaN for the first ``slow_period - 1`` bars).
+    """
+    fast_ema = prices.ewm(span=fast_period, adjust=False).mean()
+    slow_ema = prices.ewm(span=slow_period, adjust=False).mean()
+    macd_line = fast_ema - slow_ema
+    histogram = macd_line - macd_line.ewm(span=signal_period, adjust=False).mean()
+
+    return histogram.where(np.arange(len(prices)) >= slow_period - 1)
+
+
 def calculate_stochastic(
     high: pd.Series,
     low: pd.Series,
@@ -225,6 +308,31 @@ def calculate_stochastic(
     return k_val, d_val
 
 
+def stochastic_k_series(
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
+    k_period: int = 14,
+) -> pd.Series:
+    """Calculate Stochastic %K for every bar.
+
+    Args:
+        high: Series of high prices.
+        low: Series of low prices.
+        close: Series of closing prices.
+        k_period: %K period.
+
+    Returns:
+        Series of %K values (50 where the range is flat, NaN for the first
+        ``k_period - 1`` bars).
+    """
+    lowest_low = low.rolling(window=k_period).min()
+    price_range = high.rolling(window=k_period).max() - lowest_low
+
+    k = 100 * (close - lowest_low) / price_range.where(price_range != 0)
+    return k.where((price_range != 0) | price_range.isna(), 50.0)
+
+
 def calculate_average_volume(volume: pd.Series, period: int = 20) -> float:
     """Calculate average volume over a period.
 
@@ -334,6 +442,25 @@ def calculate_roc(
     return float(roc)
 
 
+def roc_series(
+    prices: pd.Series,
+    period: int = 14,
+) -> pd.Series:
+    """Calculate Rate of Change for every bar.
+
+    Args:
+        prices: Series of closing prices.
+        period: Number of periods to look back.
+
+    Returns:
+        Series of ROC percentages (0 where the old price is zero, NaN for the
+        first ``period`` bars).
+    """
+    old_prices = prices.shift(period)
+    roc = (prices - old_prices) / old_prices.where(old_prices != 0) * 100
+    return roc.where(old_prices != 0, 0.0).where(old_prices.notna())
+
+
 def is_above_sma(price: float, sma: float) -> bool:
     """Check if price is above SMA."""
     return price > sma
@@ -407,6 +534,29 @@ def calculate_bid_ask_spread_percent(bid: float, ask: float) -> float:
     return ((ask - bid) / mid) * 100
 
 
+def calculate_bid_ask_spread_percents(
+    bids: np.ndarray,
+    asks: np.ndarray,
+) -> np.ndarray:
+    """Vectorized form of calculate_bid_ask_spread_percent.
+
+    Args:
+        bids: Array of bid prices.
+        asks: Array of ask prices.
+
+    Returns:
+        Array of spreads as percentage of mid (100.0 where the quote is invalid).
+    """
+    bids = np.asarray(bids, dtype=np.float64)
+    asks = np.asarray(asks, dtype=np.float64)
+    mids = (bids + asks) / 2
+    valid = (bids > 0) & (asks > 0) & (mids != 0)
+
+    spreads = np.full(bids.shape, 100.0)
+    np.divide((asks - bids) * 100, mids, out=spreads, where=valid)
+    return spreads
+
+
 def is_tight_spread(
     bid: float,
     ask: float,
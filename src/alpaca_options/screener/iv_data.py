@@ -6,10 +6,13 @@ from datetime import datetime, timedelta, date
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from alpaca.data.requests import OptionSnapshotRequest
 from alpaca.trading.requests import GetOptionContractsRequest
 
+from alpaca_options.utils.rate_limit import AsyncRateLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +39,7 @@ class IVDataManager:
         options_data_client,
         cache_dir: str = "./data/iv_cache",
         min_history_days: int = 252,  # 1 year of trading days
+        max_requests_per_minute: int = 200,
     ):
         """Initialize IV data manager.
 
@@ -44,12 +48,17 @@ class IVDataManager:
             options_data_client: Alpaca OptionHistoricalDataClient for snapshots.
             cache_dir: Directory to store IV cache files.
             min_history_days: Minimum days of history required for IV rank.
+            max_requests_per_minute: Alpaca API request budget shared by all
+                IV fetches (Alpaca's default limit is 200/min).
         """
         self._trading_client = trading_client
         self._options_client = options_data_client
         self._cache_dir = Path(cache_dir)
         self._min_history_days = min_history_days
 
+        # Requests only wait when the API budget is used up
+        self._rate_limiter = AsyncRateLimiter(max_requests_per_minute, time_period=60)
+
         # In-memory cache: symbol → DataFrame
         self._iv_history: dict[str, pd.DataFrame] = {}
 
@@ -125,7 +134,8 @@ class IVDataManager:
                 limit=100,
             )
 
-            result = self._trading_client.get_option_contracts(request)
+            async with self._rate_limiter:
+                result = self._trading_client.get_option_contracts(request)
             contracts = result.option_contracts
 
             if not contracts:
@@ -134,11 +144,17 @@ class IVDataManager:
             # Find ATM call (closest to current price)
             # Note: We don't have historical prices here, so we approximate
             # by taking the middle strike
-            strikes = sorted([float(c.strike_price) for c in contracts])
-            if not strikes:
+            strikes = np.fromiter(
+                (float(c.strike_price) for c in contracts),
+                dtype=np.float64,
+                count=len(contracts),
+            )
+            if not strikes.size:
                 return None
 
-            atm_strike = strikes[len(strikes) // 2]
+            # Selection (O(n)) rather than a full sort to pick the middle strike
+            mid = strikes.size // 2
+            atm_strike = float(np.partition(strikes, mid)[mid])
 
             # Find call contract with this strike
             for contract in contracts:
@@ -168,7 +184,8 @@ class IVDataManager:
         """
         try:
             request = OptionSnapshotRequest(symbol_or_symbols=[contract_symbol])
-            snapshots = self._options_client.get_option_snapshot(request)
+            async with self._rate_limiter:
+                snapshots = self._options_client.get_option_snapshot(request)
 
             snap = snapshots.get(contract_symbol)
             if snap and snap.implied_volatility:
@@ -225,9 +242,6 @@ class IVDataManager:
             # Move to next sample date
             current_date += timedelta(days=sample_frequency)
 
-            # Rate limiting: small delay between requests
-            await asyncio.sleep(0.1)
-
         df = pd.DataFrame(records)
         logger.info(f"Fetched {len(df)} IV data points for {symbol}")
 
@@ -351,9 +365,6 @@ class IVDataManager:
 
                         logger.info(f"Updated IV cache for {symbol}: IV = {iv:.3f}")
 
-                # Rate limiting
-                await asyncio.sleep(0.1)
-
             except Exception as e:
                 logger.error(f"Failed to update IV cache for {symbol}: {e}")
 
@@ -375,21 +386,18 @@ class IVDataManager:
         """
         logger.info(f"Backfilling IV data for {len(symbols)} symbols (max {max_concurrent} concurrent)")
 
-        async def backfill_one(symbol: str):
-            try:
-                await self.load_or_fetch_iv_history(symbol)
-            except Exception as e:
-                logger.error(f"Failed to backfill IV data for {symbol}: {e}")
+        semaphore = asyncio.Semaphore(max_concurrent)
 
-        # Process in batches to respect rate limits
-        for i in range(0, len(symbols), max_concurrent):
-            batch = symbols[i:i + max_concurrent]
-            await asyncio.gather(*[backfill_one(sym) for sym in batch])
-
-            # Pause between batches
-            if i + max_concurrent < len(symbols):
-                logger.info(f"Processed {i + max_concurrent}/{len(symbols)}, pausing...")
-                await asyncio.sleep(5)
+        async def backfill_one(symbol: str):
+            async with semaphore:
+                try:
+                    await self.load_or_fetch_iv_history(symbol)
+                except Exception as e:
+                    logger.error(f"Failed to backfill IV data for {symbol}: {e}")
+
+        # The shared rate limiter paces the API requests, so symbols start as
+        # soon as a slot frees up instead of waiting for a whole batch
+        await asyncio.gather(*[backfill_one(sym) for sym in symbols])
 
         logger.info("IV data backfill complete")
 
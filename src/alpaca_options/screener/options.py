@@ -4,6 +4,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional, TYPE_CHECKING
 
+import numpy as np
+
 from alpaca_options.screener.base import (
     BaseScreener,
     ScreenerResult,
@@ -11,7 +13,7 @@ from alpaca_options.screener.base import (
     ScreeningCriteria,
 )
 from alpaca_options.screener.filters import (
-    calculate_bid_ask_spread_percent,
+    calculate_bid_ask_spread_percents,
     is_tight_spread,
     score_options_setup,
 )
@@ -110,26 +112,28 @@ class OptionsScreener(BaseScreener):
                 [c["symbol"] for c in sample_contracts]
             )
 
-            # Calculate aggregate metrics
+            # Calculate aggregate metrics from column arrays in one pass
             total_open_interest = 0
-            total_volume = 0
-            spreads = []
-            ivs = []
-
-            for contract_symbol, snap in snapshots.items():
-                if snap:
-                    # Note: Using what's available from Alpaca snapshot
-                    if snap.get("bid") and snap.get("ask"):
-                        spread_pct = calculate_bid_ask_spread_percent(
-                            snap["bid"], snap["ask"]
-                        )
-                        spreads.append(spread_pct)
+            quotes = [snap for snap in snapshots.values() if snap]
+            bids = np.fromiter(
+                (q.get("bid") or 0.0 for q in quotes), dtype=np.float64, count=len(quotes)
+            )
+            asks = np.fromiter(
+                (q.get("ask") or 0.0 for q in quotes), dtype=np.float64, count=len(quotes)
+            )
+            ivs = np.fromiter(
+                (q.get("implied_volatility") or 0.0 for q in quotes),
+                dtype=np.float64,
+                count=len(quotes),
+            )
 
-                    if snap.get("implied_volatility"):
-                        ivs.append(snap["implied_volatility"])
+            # Note: Using what's available from Alpaca snapshot
+            quoted = (bids != 0) & (asks != 0)
+            spreads = calculate_bid_ask_spread_percents(bids[quoted], asks[quoted])
+            ivs = ivs[ivs != 0]
 
-            avg_spread = sum(spreads) / len(spreads) if spreads else 100.0
-            avg_iv = sum(ivs) / len(ivs) if ivs else None
+            avg_spread = float(spreads.mean()) if spreads.size else 100.0
+            avg_iv = float(ivs.mean()) if ivs.size else None
 
             # Apply filters
             filter_results = {
@@ -180,7 +184,7 @@ class OptionsScreener(BaseScreener):
             # Determine if passed all required filters
             passed = all([
                 oi_ok or total_open_interest == 0,  # Allow if no OI data
-                spread_ok or len(spreads) == 0,  # Allow if no spread data
+                spread_ok or spreads.size == 0,  # Allow if no spread data
                 exp_ok,
                 weeklies_ok,
                 iv_ok,
@@ -190,7 +194,7 @@ class OptionsScreener(BaseScreener):
             score = score_options_setup(
                 iv_rank=iv_rank,
                 open_interest=total_open_interest,
-                bid_ask_spread_pct=avg_spread if spreads else None,
+                bid_ask_spread_pct=avg_spread if spreads.size else None,
                 num_expirations=num_expirations,
             )
 
@@ -200,7 +204,7 @@ class OptionsScreener(BaseScreener):
                 score=score,
                 timestamp=datetime.now(),
                 total_open_interest=total_open_interest,
-                avg_bid_ask_spread=avg_spread if spreads else None,
+                avg_bid_ask_spread=avg_spread if spreads.size else None,
                 implied_volatility=avg_iv,
                 iv_rank=iv_rank,
                 num_expirations=num_expirations,
@@ -4,8 +4,11 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional
 
+import numpy as np
+
 from alpaca_options.strategies.criteria import StrategyCriteria
 
 if TYPE_CHECKING:
@@ -69,9 +72,9 @@ class OptionSignal:
         return sum(leg.quantity for leg in self.legs)
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
-    """Market data snapshot for an underlying."""
+    """Market data snapshot for an underlying (slotted; backtests build one per bar)."""
 
     symbol: str
     timestamp: datetime
@@ -91,9 +94,12 @@ class MarketData:
     iv_percentile: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionContract:
-    """Represents an options contract."""
+    """Represents an options contract.
+
+    Slotted, so chains of thousands of contracts carry no per-instance dict.
+    """
 
     symbol: str
     underlying: str
@@ -167,21 +173,70 @@ class OptionChain:
         """Get contracts for a specific strike."""
         return [c for c in self.contracts if c.strike == strike]
 
+    def get_strikes(self) -> np.ndarray:
+        """Get the sorted unique strike prices in the chain."""
+        return np.unique(
+            np.fromiter(
+                (c.strike for c in self.contracts),
+                dtype=np.float64,
+                count=len(self.contracts),
+            )
+        )
+
     def get_atm_strike(self) -> float:
         """Get the at-the-money strike price."""
-        strikes = sorted(set(c.strike for c in self.contracts))
-        return min(strikes, key=lambda s: abs(s - self.underlying_price))
+        strikes = self.get_strikes()
+        return float(strikes[np.argmin(np.abs(strikes - self.underlying_price))])
+
+    @cached_property
+    def _by_symbol(self) -> dict[str, OptionContract]:
+        """Contracts keyed by symbol (the first contract wins on duplicates)."""
+        return {c.symbol: c for c in reversed(self.contracts)}
+
+    def get_contract(self, symbol: str) -> Optional[OptionContract]:
+        """Get the contract with the given symbol (None if not in the chain).
+
+        Uses a symbol index built on first use, so each lookup is a dict
+        access rather than a scan over the chain.
+        """
+        return self._by_symbol.get(symbol)
+
+    @cached_property
+    def _abs_delta_index(self) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """Per option type: sorted |delta| and the contract positions in that order."""
+        index = {}
+        for option_type in ("call", "put"):
+            positions = np.array(
+                [
+                    i
+                    for i, c in enumerate(self.contracts)
+                    if c.option_type == option_type and c.delta is not None
+                ],
+                dtype=np.intp,
+            )
+            abs_delta = np.fromiter(
+                (abs(self.contracts[i].delta) for i in positions),
+                dtype=np.float64,
+                count=len(positions),
+            )
+            order = np.argsort(abs_delta, kind="stable")
+            index[option_type] = (abs_delta[order], positions[order])
+        return index
 
     def filter_by_delta(
         self, min_delta: float, max_delta: float, option_type: str
     ) -> list[OptionContract]:
-        """Filter contracts by delta range."""
-        contracts = self.get_calls() if option_type == "call" else self.get_puts()
-        return [
-            c
-            for c in contracts
-            if c.delta is not None and min_delta <= abs(c.delta) <= max_delta
+        """Filter contracts by delta range.
+
+        Uses a per-type index sorted by |delta| (built on first use), so each
+        range query is two binary searches plus a slice.
+        """
+        sorted_abs_delta, positions = self._abs_delta_index[
+            "call" if option_type == "call" else "put"
         ]
+        lo = np.searchsorted(sorted_abs_delta, min_delta, side="left")
+        hi = np.searchsorted(sorted_abs_delta, max_delta, side="right")
+        return [self.contracts[i] for i in np.sort(positions[lo:hi])]
 
     def filter_by_dte(self, min_dte: int, max_dte: int) -> list[OptionContract]:
         """Filter contracts by days to expiration."""
@@ -28,6 +28,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
+import numpy as np
+
 from alpaca_options.strategies.base import (
     BaseStrategy,
     MarketData,
@@ -186,6 +188,13 @@ class VerticalSpreadStrategy(BaseStrategy):
         if chain.underlying not in self._underlyings and chain.underlying not in self._screener_symbols:
             return None
 
+        # Determine market direction based on cached data first: it only reads
+        # the cached bar, and most bars have no direction, so the earnings and
+        # SEC lookups below are skipped for them
+        direction = self._determine_direction(chain.underlying)
+        if direction is None:
+            return None
+
         # Check for earnings risk
         if self.has_earnings_risk(chain.underlying, self._max_dte):
             logger.info(f"[{chain.underlying}] Skipping: earnings within {self._max_dte} day window")
@@ -196,11 +205,6 @@ class VerticalSpreadStrategy(BaseStrategy):
             logger.info(f"[{chain.underlying}] Skipping: SEC risk detected")
             return None
 
-        # Determine market direction based on cached data
-        direction = self._determine_direction(chain.underlying)
-        if direction is None:
-            return None
-
         return self._find_spread_opportunity(chain, direction)
 
     def _determine_direction(self, symbol: str) -> Optional[SpreadDirection]:
@@ -276,8 +280,11 @@ class VerticalSpreadStrategy(BaseStrategy):
             logger.warning(f"[{chain.underlying}] No contracts match DTE range {self._min_dte}-{self._max_dte}")
             return None
 
-        # Get unique expirations
-        expirations = sorted(set(c.expiration for c in valid_contracts))
+        # Group contracts by expiration in one pass (chain order kept per group)
+        by_expiration: dict[datetime, list[OptionContract]] = {}
+        for contract in valid_contracts:
+            by_expiration.setdefault(contract.expiration, []).append(contract)
+        expirations = sorted(by_expiration)
         if not expirations:
             logger.warning(f"[{chain.underlying}] No expirations found in valid contracts")
             return None
@@ -286,9 +293,7 @@ class VerticalSpreadStrategy(BaseStrategy):
 
         # Try each expiration
         for i, expiration in enumerate(expirations):
-            contracts_at_exp = [
-                c for c in valid_contracts if c.expiration == expiration
-            ]
+            contracts_at_exp = by_expiration[expiration]
 
             logger.debug(f"[{chain.underlying}] Trying expiration {i+1}/{len(expirations)}: {expiration.date()} ({len(contracts_at_exp)} contracts)")
 
@@ -539,77 +544,81 @@ class VerticalSpreadStrategy(BaseStrategy):
         underlying_price: float,
         below_price: bool,
     ) -> Optional[OptionContract]:
-        """Find contract closest to target delta."""
+        """Find contract closest to target delta.
+
+        Candidates must have a delta, sit on the requested side of the
+        underlying price and pass the liquidity filters; the filters are
+        evaluated as array masks over the contracts rather than contract by
+        contract.
+        """
         logger.debug(f"  Finding contract: target_delta={target_delta:.2f}, price=${underlying_price:.2f}, below_price={below_price}")
         logger.debug(f"  Searching {len(contracts)} contracts")
 
-        no_delta_count = 0
-        wrong_side_count = 0
-        bad_spread_count = 0
-        low_oi_count = 0
-
-        candidates = []
-        for contract in contracts:
-            if contract.delta is None:
-                no_delta_count += 1
-                continue
-
-            # Filter by price relationship
-            if below_price and contract.strike >= underlying_price:
-                wrong_side_count += 1
-                continue
-            if not below_price and contract.strike <= underlying_price:
-                wrong_side_count += 1
-                continue
-
-            delta_diff = abs(abs(contract.delta) - target_delta)
-
-            # Check liquidity
-            if contract.spread_percent > self._max_spread_percent:
-                bad_spread_count += 1
-                logger.debug(f"    {contract.symbol}: spread {contract.spread_percent:.1f}% > {self._max_spread_percent}% (REJECTED)")
-                continue
-            if contract.open_interest < self._min_open_interest:
-                low_oi_count += 1
-                logger.debug(f"    {contract.symbol}: OI {contract.open_interest} < {self._min_open_interest} (REJECTED)")
-                continue
-
-            logger.debug(f"    {contract.symbol}: strike=${contract.strike}, delta={contract.delta:.3f}, diff={delta_diff:.3f} (CANDIDATE)")
-            candidates.append((contract, delta_diff))
-
-        logger.debug(f"  Filtered: {no_delta_count} no delta, {wrong_side_count} wrong side, {bad_spread_count} wide spread, {low_oi_count} low OI")
+        strike, bid, ask, oi, delta = np.array(
+            [
+                (c.strike, c.bid, c.ask, c.open_interest, np.nan if c.delta is None else c.delta)
+                for c in contracts
+            ],
+            dtype=np.float64,
+        ).reshape(len(contracts), 5).T
+
+        has_delta = ~np.isnan(delta)
+        right_side = strike < underlying_price if below_price else strike > underlying_price
+
+        # Same arithmetic as OptionContract.spread_percent (inf for a zero mid)
+        mid = (bid + ask) / 2
+        spread_pct = np.divide(ask - bid, mid, out=np.full(len(contracts), np.inf), where=mid != 0) * 100
+
+        eligible = has_delta & right_side
+        wide = eligible & (spread_pct > self._max_spread_percent)
+        low_oi = eligible & ~wide & (oi < self._min_open_interest)
+        candidates = np.flatnonzero(eligible & ~wide & ~low_oi)
+
+        logger.debug(
+            f"  Filtered: {np.count_nonzero(~has_delta)} no delta, "
+            f"{np.count_nonzero(has_delta & ~right_side)} wrong side, "
+            f"{np.count_nonzero(wide)} wide spread, {np.count_nonzero(low_oi)} low OI"
+        )
         logger.debug(f"  Found {len(candidates)} candidates")
 
-        if not candidates:
+        if not len(candidates):
             logger.warning(f"  No valid contracts found for delta {target_delta:.2f}")
             return None
 
-        candidates.sort(key=lambda x: x[1])
-        best = candidates[0][0]
+        # argmin keeps the first contract on ties, like min() over the list
+        delta_diff = np.abs(np.abs(delta[candidates]) - target_delta)
+        best = contracts[candidates[np.argmin(delta_diff)]]
         logger.debug(f"  ✓ Selected: {best.symbol} (strike=${best.strike}, delta={best.delta:.3f})")
         return best
 
     def _find_contract_by_strike(
         self, contracts: list[OptionContract], target_strike: float
     ) -> Optional[OptionContract]:
-        """Find contract closest to target strike."""
-        candidates = []
-        for contract in contracts:
-            strike_diff = abs(contract.strike - target_strike)
+        """Find contract closest to target strike.
 
-            # More lenient liquidity for protection legs
-            if contract.spread_percent > self._max_spread_percent * 2:
-                continue
-            if contract.open_interest < self._min_open_interest // 2:
-                continue
+        Protection legs use looser liquidity filters (twice the spread limit,
+        half the open interest), evaluated as array masks over the contracts.
+        """
+        if not contracts:
+            return None
 
-            candidates.append((contract, strike_diff))
+        strike, bid, ask, oi = np.array(
+            [(c.strike, c.bid, c.ask, c.open_interest) for c in contracts],
+            dtype=np.float64,
+        ).reshape(len(contracts), 4).T
 
-        if not candidates:
+        mid = (bid + ask) / 2
+        spread_pct = np.divide(ask - bid, mid, out=np.full(len(contracts), np.inf), where=mid != 0) * 100
+
+        # More lenient liquidity for protection legs
+        candidates = np.flatnonzero(
+            (spread_pct <= self._max_spread_percent * 2) & (oi >= self._min_open_interest // 2)
+        )
+        if not len(candidates):
             return None
 
-        candidates.sort(key=lambda x: x[1])
-        return candidates[0][0]
+        strike_diff = np.abs(strike[candidates] - target_strike)
+        return contracts[candidates[np.argmin(strike_diff)]]
 
     def _create_signal(
         self,
@@ -0,0 +1,59 @@
+"""Async request rate limiting.
+
+A token bucket that lets requests through immediately while the API's
+allowance lasts and only waits once the rate would be exceeded, instead of
+sleeping a fixed delay after every request.
+
+Usage:
+    limiter = AsyncRateLimiter(max_rate=200, time_period=60)
+    async with limiter:
+        response = client.get_option_snapshot(request)
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token bucket allowing ``max_rate`` acquisitions per ``time_period`` seconds.
+
+    The bucket starts full, so a burst of up to ``max_rate`` requests goes
+    through without waiting; after that, tokens refill continuously at
+    ``max_rate / time_period`` per second.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_rate: Requests allowed per time period (also the burst size).
+            time_period: Length of the period in seconds.
+        """
+        self._max_rate = max_rate
+        self._refill_rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request is allowed, then consume one token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._max_rate, self._tokens + (now - self._updated) * self._refill_rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
@@ -1,8 +1,12 @@
 """Pytest configuration and fixtures."""
 
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
 import pytest
 
 from alpaca_options.core.config import Settings
+from alpaca_options.strategies.base import OptionContract
 from alpaca_options.strategies.registry import StrategyRegistry
 
 
@@ -16,3 +20,41 @@ def settings() -> Settings:
 def strategy_registry() -> StrategyRegistry:
     """Create a fresh strategy registry."""
     return StrategyRegistry()
+
+
+@pytest.fixture
+def as_of_date() -> datetime:
+    """Quote date used by the contract factory."""
+    return datetime(2024, 1, 2)
+
+
+@pytest.fixture
+def make_contract(as_of_date: datetime) -> Callable[..., OptionContract]:
+    """Create a factory for SPY option contracts quoted on ``as_of_date``."""
+
+    def factory(
+        strike: float,
+        delta: Optional[float] = None,
+        option_type: str = "put",
+        dte: int = 30,
+        bid: float = 1.00,
+        ask: float = 1.10,
+        open_interest: int = 1000,
+    ) -> OptionContract:
+        expiration = as_of_date + timedelta(days=dte)
+        return OptionContract(
+            symbol=f"SPY{expiration:%y%m%d}{option_type[0].upper()}{int(strike * 1000):08d}",
+            underlying="SPY",
+            option_type=option_type,
+            strike=strike,
+            expiration=expiration,
+            bid=bid,
+            ask=ask,
+            last=bid,
+            volume=100,
+            open_interest=open_interest,
+            delta=delta,
+            _as_of_date=as_of_date,
+        )
+
+    return factory
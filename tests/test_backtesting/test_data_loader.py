@@ -0,0 +1,105 @@
+"""Tests for backtest data loading helpers."""
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpaca_options.backtesting.data_loader import (
+    INDICATOR_COLUMNS,
+    BacktestDataLoader,
+    trading_days,
+)
+from alpaca_options.core.config import BacktestDataConfig
+
+
+class TestTradingDays:
+    """Tests for daily timestamp selection."""
+
+    def test_matches_daily_resample(self) -> None:
+        """Test the result equals the resample-based daily index."""
+        index = pd.date_range("2024-01-02 09:30", periods=200, freq="h")
+        close = np.linspace(100.0, 110.0, len(index))
+        close[30:60] = np.nan
+        bars = pd.DataFrame({"close": close, "volume": 1000}, index=index)
+
+        expected = bars.resample("1D").last().dropna(subset=["close"]).index
+
+        assert trading_days(bars).equals(expected)
+
+
+class TestBacktestDataLoader:
+    """Tests for BacktestDataLoader construction."""
+
+    def test_alpaca_fetcher_created_on_first_use(self, tmp_path: Path) -> None:
+        """Test the Alpaca fetcher is only built when data access needs it."""
+        loader = BacktestDataLoader(
+            BacktestDataConfig(cache_dir=str(tmp_path)), api_key="key", api_secret="secret"
+        )
+
+        assert loader._alpaca_fetcher is None
+        assert loader.has_alpaca_credentials
+        assert loader._alpaca_fetcher is not None
+
+    def test_add_technical_indicators(self, tmp_path: Path) -> None:
+        """Test indicators are appended without mutating the input bars."""
+        index = pd.date_range("2024-01-02", periods=60, freq="h")
+        close = pd.Series(np.linspace(100.0, 130.0, len(index)), index=index)
+        bars = pd.DataFrame(
+            {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 10}
+        )
+
+        enriched = BacktestDataLoader(
+            BacktestDataConfig(cache_dir=str(tmp_path))
+        ).add_technical_indicators(bars)
+
+        assert list(bars.columns) == ["open", "high", "low", "close", "volume"]
+        assert tuple(enriched.columns[5:]) == INDICATOR_COLUMNS
+        assert enriched["sma_20"].iloc[-1] == pytest.approx(close.iloc[-20:].mean())
+        assert enriched["atr_14"].iloc[-1] == pytest.approx(2.0)
+        assert enriched["rsi_14"].iloc[-1] == 100.0
+
+
+def _bars(close: np.ndarray) -> pd.DataFrame:
+    """Build hourly OHLCV bars around the given closes."""
+    index = pd.date_range("2024-01-02", periods=len(close), freq="h")
+    return pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 10},
+        index=index,
+    )
+
+
+class TestIndicatorCache:
+    """Tests for the cached indicator path."""
+
+    def test_bars_hash_detects_revised_bars(self) -> None:
+        """Test a revised close changes only that bar's hash."""
+        bars = _bars(np.linspace(100.0, 130.0, 60))
+        revised = bars.copy()
+        revised.iloc[10, revised.columns.get_loc("close")] += 0.5
+
+        before = BacktestDataLoader._bars_hash(bars)
+        after = BacktestDataLoader._bars_hash(revised)
+
+        assert np.array_equal(before, BacktestDataLoader._bars_hash(bars.assign(extra=1)))
+        assert np.flatnonzero(before != after).tolist() == [10]
+
+    def test_revised_bars_are_recomputed(self, tmp_path: Path) -> None:
+        """Test cached indicators are reused only for identical bars."""
+        pytest.importorskip("pyarrow")
+        loader = BacktestDataLoader(BacktestDataConfig(cache_dir=str(tmp_path)))
+        start, end = datetime(2024, 1, 2), datetime(2024, 1, 5)
+        bars = _bars(np.linspace(100.0, 130.0, 60))
+        revised = bars.assign(close=bars["close"] * 2, extra=1.0)
+
+        loader.add_technical_indicators_cached(bars, "SPY", start, end)
+        cached = loader.add_technical_indicators_cached(bars.assign(extra=1.0), "SPY", start, end)
+        recomputed = loader.add_technical_indicators_cached(revised, "SPY", start, end)
+
+        assert "extra" in cached.columns
+        pd.testing.assert_frame_equal(
+            cached, loader.add_technical_indicators(bars.assign(extra=1.0))
+        )
+        pd.testing.assert_frame_equal(recomputed, loader.add_technical_indicators(revised))
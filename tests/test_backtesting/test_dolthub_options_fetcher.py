@@ -0,0 +1,212 @@
+"""Tests for the DoltHub options fetcher and its option chain cache mapping."""
+
+import os
+import pickle
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pytest
+
+from alpaca_options.backtesting.dolthub_options_fetcher import (
+    CachedOptionChains,
+    DoltHubOptionsDataFetcher,
+)
+from alpaca_options.strategies.base import OptionChain
+
+
+DATES = [datetime(2024, 1, 2) + timedelta(days=i) for i in range(5)]
+
+
+class FakeCacheFetcher:
+    """Serves chains as if read from disk and counts the reads."""
+
+    def __init__(self) -> None:
+        self.loads: list[datetime] = []
+
+    def _load_cached_chain(
+        self, underlying: str, as_of_date: datetime, suffix: str = ""
+    ) -> Optional[OptionChain]:
+        self.loads.append(as_of_date)
+        if as_of_date == DATES[-1]:
+            return None
+        return OptionChain(
+            underlying=underlying,
+            underlying_price=0.0,
+            timestamp=as_of_date,
+            contracts=[],
+        )
+
+
+class TestCachedOptionChains:
+    """Tests for CachedOptionChains."""
+
+    def test_mapping_protocol(self) -> None:
+        """Test keys, length and lookups behave like a dict of the given dates."""
+        chains = CachedOptionChains(FakeCacheFetcher(), "SPY", DATES[:3])
+
+        assert list(chains) == DATES[:3]
+        assert len(chains) == 3
+        assert DATES[1] in chains
+        assert chains[DATES[1]].timestamp == DATES[1]
+        assert chains.get(DATES[3]) is None
+
+    def test_keeps_recent_chains_only(self) -> None:
+        """Test recently used chains are reused and older ones reloaded."""
+        fetcher = FakeCacheFetcher()
+        chains = CachedOptionChains(fetcher, "SPY", DATES[:4], max_loaded=2)
+
+        first = chains[DATES[0]]
+        assert chains[DATES[0]] is first
+        chains[DATES[1]]
+        chains[DATES[2]]
+        chains[DATES[0]]
+
+        assert fetcher.loads == [DATES[0], DATES[1], DATES[2], DATES[0]]
+
+    def test_missing_cache_file(self) -> None:
+        """Test a date whose cached chain disappeared is reported as missing."""
+        chains = CachedOptionChains(FakeCacheFetcher(), "SPY", DATES)
+
+        with pytest.raises(KeyError):
+            chains[DATES[-1]]
+        assert chains.get(DATES[-1]) is None
+
+    def test_pickle_drops_loaded_chains(self) -> None:
+        """Test a pickled mapping keeps its dates but reloads chains from cache."""
+        chains = CachedOptionChains(FakeCacheFetcher(), "SPY", DATES[:3])
+        chains[DATES[0]]
+
+        restored = pickle.loads(pickle.dumps(chains))
+
+        assert list(restored) == DATES[:3]
+        assert restored[DATES[0]].timestamp == DATES[0]
+        assert restored._fetcher.loads == [DATES[0], DATES[0]]
+
+
+class FakeSqlFetcher(DoltHubOptionsDataFetcher):
+    """DoltHub fetcher answering SQL queries from a fixed result set."""
+
+    def __init__(self, tmp_path: Path, rows: pd.DataFrame) -> None:
+        self.queries: list[str] = []
+        self._rows = rows
+        super().__init__(dolt_dir=tmp_path, cache_dir=tmp_path / "cache")
+
+    def _check_dolt_installed(self) -> bool:
+        return True
+
+    def _run_dolt_sql(self, query: str) -> pd.DataFrame:
+        self.queries.append(query)
+        return self._rows
+
+
+class TestAvailableDates:
+    """Tests for available-date lookups."""
+
+    def test_single_symbol_lookup(self, tmp_path: Path) -> None:
+        """Test a symbol's dates are returned as datetimes in query order."""
+        rows = pd.DataFrame({"date": ["2024-01-02", "2024-01-03"]})
+        fetcher = FakeSqlFetcher(tmp_path, rows)
+
+        dates = fetcher.get_available_dates("SPY", datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+        assert dates == [datetime(2024, 1, 2), datetime(2024, 1, 3)]
+        assert type(dates[0]) is datetime
+
+    def test_bulk_lookup_uses_one_query(self, tmp_path: Path) -> None:
+        """Test dates for several symbols come from one query, grouped by symbol."""
+        rows = pd.DataFrame(
+            {
+                "act_symbol": ["AAPL", "AAPL", "SPY"],
+                "date": ["2024-01-02", "2024-01-03", "2024-01-02"],
+            }
+        )
+        fetcher = FakeSqlFetcher(tmp_path, rows)
+
+        available = fetcher.get_available_dates_bulk(
+            ["SPY", "AAPL", "MSFT"], datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+
+        assert len(fetcher.queries) == 1
+        assert "IN ('SPY', 'AAPL', 'MSFT')" in fetcher.queries[0]
+        assert available == {
+            "SPY": [datetime(2024, 1, 2)],
+            "AAPL": [datetime(2024, 1, 2), datetime(2024, 1, 3)],
+            "MSFT": [],
+        }
+        assert type(available["SPY"][0]) is datetime
+
+    def test_dates_served_from_cache(self, tmp_path: Path) -> None:
+        """Test a repeated lookup is read from disk until refreshed."""
+        rows = pd.DataFrame({"date": ["2024-01-02", "2024-01-03"]})
+        fetcher = FakeSqlFetcher(tmp_path, rows)
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+
+        first = fetcher.get_available_dates("SPY", start, end)
+        second = fetcher.get_available_dates("SPY", start, end)
+        fetcher.get_available_dates("SPY", start, end, refresh=True)
+
+        assert second == first
+        assert len(fetcher.queries) == 2
+
+    def test_stale_cache_is_requeried(self, tmp_path: Path) -> None:
+        """Test cached dates older than the TTL are fetched again."""
+        rows = pd.DataFrame({"date": ["2024-01-02"]})
+        fetcher = FakeSqlFetcher(tmp_path, rows)
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+        fetcher.get_available_dates("SPY", start, end)
+
+        stale = time.time() - 2 * 24 * 3600
+        for cache_file in (tmp_path / "cache" / "available_dates").iterdir():
+            os.utime(cache_file, (stale, stale))
+        fetcher.get_available_dates("SPY", start, end)
+
+        assert len(fetcher.queries) == 2
+
+    def test_bulk_lookup_queries_only_uncached(self, tmp_path: Path) -> None:
+        """Test symbols cached by an earlier lookup are left out of the query."""
+        rows = pd.DataFrame({"act_symbol": ["SPY"], "date": ["2024-01-02"]})
+        fetcher = FakeSqlFetcher(tmp_path, rows)
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+        fetcher.get_available_dates_bulk(["SPY"], start, end)
+
+        fetcher._rows = pd.DataFrame({"act_symbol": ["AAPL"], "date": ["2024-01-03"]})
+        available = fetcher.get_available_dates_bulk(["SPY", "AAPL"], start, end)
+
+        assert "IN ('AAPL')" in fetcher.queries[-1]
+        assert available == {"SPY": [datetime(2024, 1, 2)], "AAPL": [datetime(2024, 1, 3)]}
+
+
+class TestDataFrameToOptionChain:
+    """Tests for building chains from DoltHub rows."""
+
+    def test_bad_rows_are_skipped(self, tmp_path: Path) -> None:
+        """Test a row with a bad strike or expiration is dropped, not the chain."""
+        rows = pd.DataFrame(
+            {
+                "expiration": ["2024-02-16", "not a date", "2024-02-16", "2024-02-16"],
+                "strike": [440.0, 445.0, None, 450.5],
+                "call_put": ["Put", "Put", "Put", "Call"],
+                "bid": [1.0, 1.1, 1.2, None],
+                "ask": [1.1, 1.2, 1.3, 2.1],
+                "vol": [0.2, 0.2, 0.2, None],
+                "delta": [-0.3, -0.35, -0.4, 0.45],
+                "gamma": [0.01] * 4,
+                "theta": [-0.05] * 4,
+                "vega": [0.1] * 4,
+                "rho": [0.01] * 4,
+            }
+        )
+        fetcher = FakeSqlFetcher(tmp_path, rows)
+
+        chain = fetcher._dataframe_to_option_chain(rows, "SPY", datetime(2024, 1, 2))
+
+        assert [c.symbol for c in chain.contracts] == [
+            "SPY240216P00440000",
+            "SPY240216C00450500",
+        ]
+        assert chain.contracts[1].bid == 0.0
+        assert chain.contracts[1].implied_volatility is None
+        assert chain.contracts[1].delta == 0.45
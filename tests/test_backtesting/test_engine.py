@@ -0,0 +1,132 @@
+"""Tests for backtest engine lookups."""
+
+from datetime import datetime
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpaca_options.backtesting.engine import BacktestEngine
+from alpaca_options.strategies.base import (
+    OptionChain,
+    OptionContract,
+    OptionLeg,
+    OptionSignal,
+    SignalType,
+)
+
+
+@pytest.fixture
+def bars() -> pd.DataFrame:
+    """Create five hourly bars with a missing RSI on the first."""
+    index = pd.date_range("2024-01-02 10:00", periods=5, freq="h")
+    return pd.DataFrame(
+        {
+            "open": 100.0,
+            "high": 101.0,
+            "low": 99.0,
+            "close": np.arange(100.0, 105.0),
+            "volume": 1000,
+            "rsi_14": [np.nan, 40.0, 45.0, 50.0, 55.0],
+        },
+        index=index,
+    )
+
+
+class TestMarketDataLookup:
+    """Tests for the per-run bar positions and columns."""
+
+    def test_bar_positions_forward_fill(self, bars: pd.DataFrame) -> None:
+        """Test positions match a forward-filling get_indexer lookup."""
+        timestamps = [
+            datetime(2024, 1, 2, 9, 0),
+            datetime(2024, 1, 2, 10, 0),
+            datetime(2024, 1, 2, 11, 30),
+            datetime(2024, 1, 3),
+        ]
+
+        positions = BacktestEngine._bar_positions(bars, timestamps)
+
+        assert positions.tolist() == [-1, 0, 1, 4]
+        assert positions.tolist() == bars.index.get_indexer(timestamps, method="ffill").tolist()
+
+    def test_bar_positions_unalignable_index(self, bars: pd.DataFrame) -> None:
+        """Test tz-aware bars against naive timestamps yield no positions."""
+        positions = BacktestEngine._bar_positions(
+            bars.tz_localize("UTC"), [datetime(2024, 1, 2, 11)]
+        )
+
+        assert positions.tolist() == [-1]
+
+    def test_get_market_data(self, bars: pd.DataFrame) -> None:
+        """Test MarketData is built from the prepared values with NaN as None."""
+        engine = BacktestEngine.__new__(BacktestEngine)
+        timestamps = [
+            datetime(2024, 1, 2, 9, 0),
+            datetime(2024, 1, 2, 10, 30),
+            datetime(2024, 1, 2, 11, 30),
+        ]
+        values = BacktestEngine._bar_values(
+            bars, BacktestEngine._bar_positions(bars, timestamps)
+        )
+
+        first = engine._get_market_data(values, 1, timestamps[1], symbol="SPY")
+        second = engine._get_market_data(values, 2, timestamps[2], symbol="SPY")
+
+        assert engine._get_market_data(values, 0, timestamps[0]) is None
+        assert first.rsi_14 is None
+        assert first.vwap is None
+        assert second.close == 101.0
+        assert second.volume == 1000
+        assert second.rsi_14 == 40.0
+        assert type(second.rsi_14) is float
+
+    def test_bar_values_without_bars(self) -> None:
+        """Test an empty frame yields no market data rather than an error."""
+        engine = BacktestEngine.__new__(BacktestEngine)
+        timestamps = [datetime(2024, 1, 2, 11)]
+        values = BacktestEngine._bar_values(
+            pd.DataFrame(), BacktestEngine._bar_positions(pd.DataFrame(), timestamps)
+        )
+
+        assert engine._get_market_data(values, 0, timestamps[0]) is None
+
+
+class TestContractMap:
+    """Tests for mapping signal legs to chain contracts."""
+
+    def test_build_contract_map(
+        self, make_contract: Callable[..., OptionContract], as_of_date: datetime
+    ) -> None:
+        """Test legs are matched by symbol and unknown symbols are skipped."""
+        contracts = [make_contract(strike) for strike in (440.0, 445.0, 450.0)]
+        chain = OptionChain(
+            underlying="SPY", underlying_price=450.0, timestamp=as_of_date, contracts=contracts
+        )
+        legs = [
+            OptionLeg(
+                contract_symbol=symbol,
+                underlying="SPY",
+                option_type="put",
+                strike=0.0,
+                expiration=contracts[0].expiration,
+                side="sell",
+                quantity=1,
+            )
+            for symbol in (contracts[2].symbol, contracts[0].symbol, "SPY240201P00999000")
+        ]
+        signal = OptionSignal(
+            signal_type=SignalType.SELL_PUT_SPREAD,
+            underlying="SPY",
+            legs=legs,
+            confidence=1.0,
+            strategy_name="test",
+        )
+
+        contract_map = BacktestEngine.__new__(BacktestEngine)._build_contract_map(signal, chain)
+
+        assert contract_map == {
+            contracts[2].symbol: contracts[2],
+            contracts[0].symbol: contracts[0],
+        }
@@ -0,0 +1,34 @@
+"""Tests for configuration loading."""
+
+import os
+from pathlib import Path
+
+from alpaca_options.core.config import load_config
+
+
+class TestLoadConfig:
+    """Tests for load_config."""
+
+    def test_repeated_loads_are_independent(self, tmp_path: Path) -> None:
+        """Test memoized parsing still hands out independent Settings."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("backtesting:\n  initial_capital: 5000\n")
+
+        first = load_config(config_file)
+        first.backtesting.initial_capital = 1.0
+        second = load_config(config_file)
+
+        assert second.backtesting.initial_capital == 5000
+        assert second is not first
+
+    def test_reload_after_file_change(self, tmp_path: Path) -> None:
+        """Test an edited config file is parsed again."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("backtesting:\n  initial_capital: 5000\n")
+        assert load_config(config_file).backtesting.initial_capital == 5000
+
+        config_file.write_text("backtesting:\n  initial_capital: 7500\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config(config_file).backtesting.initial_capital == 7500
@@ -0,0 +1,138 @@
+"""Tests for screener indicator calculations."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpaca_options.screener.filters import (
+    bollinger_position_series,
+    calculate_bollinger_bands,
+    calculate_macd,
+    calculate_roc,
+    calculate_rsi,
+    calculate_stochastic,
+    macd_histogram_series,
+    roc_series,
+    rsi_series,
+    stochastic_k_series,
+)
+
+
+def _wilder_rsi_loop(prices: pd.Series, period: int = 14) -> float:
+    """Reference RSI using an explicit Wilder smoothing loop."""
+    delta = prices.diff()
+    gains = delta.where(delta > 0, 0.0)
+    losses = (-delta).where(delta < 0, 0.0)
+    avg_gain = gains.iloc[:period].mean()
+    avg_loss = losses.iloc[:period].mean()
+    for i in range(period, len(prices)):
+        avg_gain = (avg_gain * (period - 1) + gains.iloc[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses.iloc[i]) / period
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+@pytest.fixture
+def prices() -> pd.Series:
+    """Create a random-walk close series."""
+    rng = np.random.default_rng(42)
+    return pd.Series(100 + rng.normal(0, 1, 120).cumsum())
+
+
+class TestRSI:
+    """Tests for RSI calculations."""
+
+    def test_matches_wilder_loop(self, prices: pd.Series) -> None:
+        """Test the vectorized RSI matches Wilder's recursive definition."""
+        assert calculate_rsi(prices) == pytest.approx(_wilder_rsi_loop(prices))
+        assert calculate_rsi(prices.iloc[:15]) == pytest.approx(
+            _wilder_rsi_loop(prices.iloc[:15])
+        )
+
+    def test_series_warmup_and_alignment(self, prices: pd.Series) -> None:
+        """Test the full series is aligned and NaN only during warmup."""
+        rsi = rsi_series(prices)
+
+        assert rsi.index.equals(prices.index)
+        assert rsi.iloc[:13].isna().all()
+        assert rsi.iloc[14:].notna().all()
+        assert rsi.iloc[-1] == pytest.approx(calculate_rsi(prices))
+
+    def test_neutral_without_enough_data(self) -> None:
+        """Test short or flat series return a neutral RSI."""
+        assert calculate_rsi(pd.Series([1.0, 2.0, 3.0])) == 50.0
+        assert calculate_rsi(pd.Series(np.ones(30))) == 50.0
+
+
+class TestMACD:
+    """Tests for MACD calculations."""
+
+    def test_histogram_series_matches_windowed(self, prices: pd.Series) -> None:
+        """Test each bar equals calculate_macd on the prices up to that bar."""
+        histogram = macd_histogram_series(prices)
+
+        assert histogram.iloc[:25].isna().all()
+        for i in (25, 60, len(prices) - 1):
+            assert histogram.iloc[i] == pytest.approx(calculate_macd(prices.iloc[: i + 1])[2])
+
+
+class TestBollinger:
+    """Tests for Bollinger Band calculations."""
+
+    def test_position_series_matches_bands(self, prices: pd.Series) -> None:
+        """Test each bar's position matches the windowed band values."""
+        position = bollinger_position_series(prices)
+
+        assert position.iloc[:19].isna().all()
+        for i in (19, 70, len(prices) - 1):
+            upper, _, lower = calculate_bollinger_bands(prices.iloc[: i + 1])
+            expected = (prices.iloc[i] - lower) / (upper - lower) * 100
+            assert position.iloc[i] == pytest.approx(expected)
+
+    def test_flat_bands_are_neutral(self) -> None:
+        """Test a constant price sits in the middle of collapsed bands."""
+        position = bollinger_position_series(pd.Series(np.full(25, 10.0)))
+
+        assert position.iloc[19:].tolist() == [50.0] * 6
+
+    def test_flat_after_moves_is_neutral(self, prices: pd.Series) -> None:
+        """Test a flat window after price moves is exactly neutral."""
+        flat_tail = pd.concat([prices, pd.Series(np.full(20, prices.iloc[-1]))])
+
+        assert bollinger_position_series(flat_tail.reset_index(drop=True)).iloc[-1] == 50.0
+
+
+class TestStochastic:
+    """Tests for Stochastic Oscillator calculations."""
+
+    def test_k_series_matches_windowed(self, prices: pd.Series) -> None:
+        """Test each bar's %K matches calculate_stochastic on that window."""
+        high, low = prices + 0.5, prices - 0.5
+        k = stochastic_k_series(high, low, prices)
+
+        assert k.iloc[:13].isna().all()
+        for i in (13, 50, len(prices) - 1):
+            window = slice(0, i + 1)
+            expected, _ = calculate_stochastic(high[window], low[window], prices[window])
+            assert k.iloc[i] == pytest.approx(expected)
+
+    def test_flat_range_is_neutral(self) -> None:
+        """Test a flat range yields 50 instead of NaN."""
+        flat = pd.Series(np.full(15, 10.0))
+
+        assert stochastic_k_series(flat, flat, flat).iloc[-1] == 50.0
+
+
+class TestROC:
+    """Tests for Rate of Change calculations."""
+
+    def test_series_matches_windowed(self, prices: pd.Series) -> None:
+        """Test each bar's ROC matches calculate_roc on that window."""
+        roc = roc_series(prices)
+
+        assert roc.iloc[:14].isna().all()
+        for i in (14, 50, len(prices) - 1):
+            assert roc.iloc[i] == pytest.approx(calculate_roc(prices.iloc[: i + 1]))
+
+    def test_zero_base_price(self) -> None:
+        """Test a zero base price yields 0 like the scalar version."""
+        assert roc_series(pd.Series([0.0, 1.0, 2.0]), period=1).tolist()[1:] == [0.0, 100.0]
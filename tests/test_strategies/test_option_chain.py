@@ -0,0 +1,73 @@
+"""Tests for the OptionChain container."""
+
+from datetime import datetime
+from typing import Callable
+
+import pytest
+
+from alpaca_options.strategies.base import OptionChain, OptionContract
+
+
+@pytest.fixture
+def sample_chain(
+    make_contract: Callable[..., OptionContract], as_of_date: datetime
+) -> OptionChain:
+    """Create a small chain with puts and calls across two expirations."""
+    contracts = [
+        make_contract(440.0, -0.10),
+        make_contract(445.0, -0.20),
+        make_contract(450.0, -0.35),
+        make_contract(455.0, None),
+        make_contract(460.0, 0.40, option_type="call"),
+        make_contract(465.0, 0.25, option_type="call"),
+        make_contract(445.0, -0.15, dte=5),
+        make_contract(465.0, 0.18, option_type="call", dte=5),
+    ]
+    return OptionChain(
+        underlying="SPY",
+        underlying_price=457.0,
+        timestamp=as_of_date,
+        contracts=contracts,
+    )
+
+
+class TestOptionChainStrikes:
+    """Tests for strike helpers."""
+
+    def test_strikes(self, sample_chain: OptionChain) -> None:
+        """Test strikes are unique and sorted ascending."""
+        assert sample_chain.get_strikes().tolist() == [440.0, 445.0, 450.0, 455.0, 460.0, 465.0]
+
+    def test_atm_strike(self, sample_chain: OptionChain) -> None:
+        """Test the ATM strike is the one closest to the underlying price."""
+        assert sample_chain.get_atm_strike() == 455.0
+
+
+class TestOptionChainFilters:
+    """Tests for chain filters."""
+
+    def test_filter_by_delta_matches_scan(self, sample_chain: OptionChain) -> None:
+        """Test the indexed delta filter matches a linear scan in chain order."""
+        for option_type in ("call", "put"):
+            for min_delta, max_delta in [(0.15, 0.25), (0.10, 0.35), (0.0, 1.0), (0.5, 0.9)]:
+                expected = [
+                    c
+                    for c in sample_chain.contracts
+                    if c.option_type == option_type
+                    and c.delta is not None
+                    and min_delta <= abs(c.delta) <= max_delta
+                ]
+                assert sample_chain.filter_by_delta(min_delta, max_delta, option_type) == expected
+
+    def test_filter_by_delta_inclusive_bounds(self, sample_chain: OptionChain) -> None:
+        """Test both range bounds are inclusive."""
+        puts = sample_chain.filter_by_delta(0.20, 0.35, "put")
+
+        assert [c.strike for c in puts] == [445.0, 450.0]
+
+    def test_get_contract(self, sample_chain: OptionChain) -> None:
+        """Test contracts are looked up by symbol and unknown symbols give None."""
+        for contract in sample_chain.contracts:
+            assert sample_chain.get_contract(contract.symbol) is contract
+
+        assert sample_chain.get_contract("SPY240201P00999000") is None
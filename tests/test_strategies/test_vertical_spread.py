@@ -0,0 +1,186 @@
+"""Tests for the Vertical Spread Strategy."""
+
+from datetime import datetime
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from alpaca_options.strategies.base import MarketData, OptionChain, OptionContract
+from alpaca_options.strategies.vertical_spread import VerticalSpreadStrategy
+
+
+@pytest.fixture
+async def strategy() -> VerticalSpreadStrategy:
+    """Create an initialized strategy with explicit liquidity filters."""
+    strategy = VerticalSpreadStrategy()
+    await strategy.initialize(
+        {"underlyings": ["SPY"], "max_spread_percent": 15.0, "min_open_interest": 100}
+    )
+    return strategy
+
+
+class TestFindContractByDelta:
+    """Tests for short-leg selection by delta."""
+
+    def test_selects_closest_liquid_delta(
+        self, strategy: VerticalSpreadStrategy, make_contract: Callable[..., OptionContract]
+    ) -> None:
+        """Test filters are applied before picking the closest delta."""
+        contracts = [
+            make_contract(430.0, -0.10),
+            make_contract(435.0, -0.19, bid=0.50, ask=1.50),  # wide spread
+            make_contract(440.0, -0.21, open_interest=10),  # low open interest
+            make_contract(445.0, None),  # no delta
+            make_contract(442.0, -0.24),
+            make_contract(455.0, -0.20),  # above the price
+        ]
+
+        best = strategy._find_contract_by_delta(contracts, 0.20, 450.0, below_price=True)
+
+        assert best is contracts[4]
+
+    def test_first_contract_wins_ties(
+        self, strategy: VerticalSpreadStrategy, make_contract: Callable[..., OptionContract]
+    ) -> None:
+        """Test equally close deltas resolve to the earlier contract."""
+        contracts = [make_contract(440.0, -0.25), make_contract(445.0, -0.15)]
+
+        best = strategy._find_contract_by_delta(contracts, 0.20, 450.0, below_price=True)
+
+        assert best is contracts[0]
+
+    def test_no_candidates(
+        self, strategy: VerticalSpreadStrategy, make_contract: Callable[..., OptionContract]
+    ) -> None:
+        """Test None is returned for an empty list or no eligible contract."""
+        assert strategy._find_contract_by_delta([], 0.20, 450.0, below_price=True) is None
+        assert (
+            strategy._find_contract_by_delta(
+                [make_contract(430.0, -0.20, bid=0.0, ask=0.0)], 0.20, 450.0, below_price=True
+            )
+            is None
+        )
+
+    def test_matches_contract_scan(
+        self, strategy: VerticalSpreadStrategy, make_contract: Callable[..., OptionContract]
+    ) -> None:
+        """Test the selection matches a scan over the contract properties."""
+        rng = np.random.default_rng(3)
+        contracts = [
+            make_contract(
+                float(strike),
+                None if rng.random() < 0.1 else -float(rng.uniform(0.01, 0.6)),
+                bid=float(rng.uniform(0.0, 2.0)),
+                ask=float(rng.uniform(2.0, 2.6)),
+                open_interest=int(rng.integers(0, 500)),
+            )
+            for strike in range(380, 460)
+        ]
+        candidates = [
+            c
+            for c in contracts
+            if c.delta is not None
+            and c.strike < 450.0
+            and c.spread_percent <= 15.0
+            and c.open_interest >= 100
+        ]
+        expected = min(candidates, key=lambda c: abs(abs(c.delta) - 0.20))
+
+        best = strategy._find_contract_by_delta(contracts, 0.20, 450.0, below_price=True)
+
+        assert best is expected
+
+
+class RecordingSECAnalyzer:
+    """SEC analyzer that records which symbols were looked up."""
+
+    def __init__(self) -> None:
+        self.lookups: list[str] = []
+
+    def get_risk_score(self, symbol: str) -> None:
+        self.lookups.append(symbol)
+        return None
+
+    def get_financial_health(self, symbol: str) -> None:
+        return None
+
+    def get_insider_sentiment(self, symbol: str) -> None:
+        return None
+
+    def get_cash_flow_health(self, symbol: str) -> None:
+        return None
+
+
+class TestOnOptionChain:
+    """Tests for the order of the per-chain checks."""
+
+    async def test_no_direction_skips_sec_lookup(
+        self,
+        strategy: VerticalSpreadStrategy,
+        make_contract: Callable[..., OptionContract],
+        as_of_date: datetime,
+    ) -> None:
+        """Test a neutral bar returns before the SEC analyzer is consulted."""
+        analyzer = RecordingSECAnalyzer()
+        strategy.set_sec_filings_analyzer(analyzer)
+        chain = OptionChain(
+            underlying="SPY",
+            underlying_price=450.0,
+            timestamp=as_of_date,
+            contracts=[make_contract(440.0, -0.2)],
+        )
+
+        for rsi in (50.0, 30.0):
+            await strategy.on_market_data(
+                MarketData(
+                    symbol="SPY",
+                    timestamp=as_of_date,
+                    open=450.0,
+                    high=451.0,
+                    low=449.0,
+                    close=450.0,
+                    volume=1000,
+                    rsi_14=rsi,
+                )
+            )
+            await strategy.on_option_chain(chain)
+
+        # Only the oversold (bullish) bar reaches the SEC checks
+        assert analyzer.lookups == ["SPY"]
+
+
+class TestFindContractByStrike:
+    """Tests for protection-leg selection by strike."""
+
+    def test_matches_contract_scan(
+        self, strategy: VerticalSpreadStrategy, make_contract: Callable[..., OptionContract]
+    ) -> None:
+        """Test the closest liquid strike matches a scan with the lenient filters."""
+        rng = np.random.default_rng(5)
+        contracts = [
+            make_contract(
+                float(strike),
+                -0.2,
+                bid=float(rng.uniform(0.0, 2.0)),
+                ask=float(rng.uniform(2.0, 2.6)),
+                open_interest=int(rng.integers(0, 120)),
+            )
+            for strike in np.arange(400.0, 450.0, 2.5)
+        ]
+        for target in (401.0, 423.75, 447.5, 460.0):
+            candidates = [
+                c for c in contracts if c.spread_percent <= 30.0 and c.open_interest >= 50
+            ]
+            expected = min(candidates, key=lambda c: abs(c.strike - target))
+
+            assert strategy._find_contract_by_strike(contracts, target) is expected
+
+    def test_no_liquid_contract(
+        self, strategy: VerticalSpreadStrategy, make_contract: Callable[..., OptionContract]
+    ) -> None:
+        """Test None is returned when nothing passes the filters."""
+        illiquid = make_contract(440.0, -0.2, open_interest=10)
+
+        assert strategy._find_contract_by_strike([], 440.0) is None
+        assert strategy._find_contract_by_strike([illiquid], 440.0) is None
@@ -0,0 +1,43 @@
+"""Tests for async request rate limiting."""
+
+import asyncio
+import time
+
+import pytest
+
+from alpaca_options.utils.rate_limit import AsyncRateLimiter
+
+
+class TestAsyncRateLimiter:
+    """Tests for the token-bucket limiter."""
+
+    async def test_burst_does_not_wait(self) -> None:
+        """Test requests within the allowance go through immediately."""
+        limiter = AsyncRateLimiter(max_rate=20, time_period=60)
+
+        start = time.monotonic()
+        for _ in range(20):
+            async with limiter:
+                pass
+
+        assert time.monotonic() - start < 0.05
+
+    async def test_waits_once_allowance_is_used(self) -> None:
+        """Test the request past the allowance waits for a token to refill."""
+        limiter = AsyncRateLimiter(max_rate=5, time_period=0.5)
+        for _ in range(5):
+            await limiter.acquire()
+
+        start = time.monotonic()
+        await limiter.acquire()
+
+        assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+
+    async def test_concurrent_acquires_are_paced(self) -> None:
+        """Test concurrent callers share one budget."""
+        limiter = AsyncRateLimiter(max_rate=4, time_period=0.2)
+
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(8)))
+
+        assert time.monotonic() - start == pytest.approx(0.2, abs=0.08)